@@ -0,0 +1,48 @@
+"""Wall-clock cost of `ghl --help` in a fresh interpreter.
+
+Measures the import of ghl.cli plus rendering the help, best of several runs,
+and compares it with a budget: about 35 ms on a laptop, so 150 ms leaves room
+for slow machines but flags httpx (~70 ms) or the endpoint modules creeping
+back into the startup path. (tests/test_cli_startup.py checks the imports
+themselves.) Run from the wrapper directory:
+
+    python benchmarks/bench_cli_startup.py [runs]
+"""
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+HELP_BUDGET_MS = 150
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+from ghl.cli import cli
+try:
+    cli(sys.argv[1:], prog_name="ghl")
+except SystemExit:
+    pass
+print(json.dumps({"ms": (time.perf_counter() - start) * 1000}), file=sys.stderr)
+"""
+
+def probe(*args):
+    env = {**os.environ, "PYTHONPATH": str(SRC), "GHL_API_KEY": "key"}
+    result = subprocess.run([sys.executable, "-c", PROBE, *args], capture_output=True, text=True, env=env, timeout=60)
+    return json.loads(result.stderr.strip().splitlines()[-1])["ms"]
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    best = {}
+    for label, args in (("ghl --help", ["--help"]), ("ghl contacts --help", ["contacts", "--help"])):
+        best[label] = min(probe(*args) for _ in range(runs))
+        print(f"{label:<24} {best[label]:7.1f} ms (best of {runs})")
+    if best["ghl --help"] >= HELP_BUDGET_MS:
+        print(f"ghl --help is over the {HELP_BUDGET_MS} ms budget")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Per-record cost of --fields projection.
+
+Compares the old approach (split the field string and build a dict for every
+record) with ghl.projection's compiled projectors, for top-level and nested
+paths. Run from the wrapper directory:
+
+    python benchmarks/bench_projection.py [records]
+"""
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from ghl.projection import compile_projection, project  # noqa: E402
+
+def make_contacts(n):
+    return [
+        {
+            "id": f"c{i}", "firstName": f"First{i}", "lastName": f"Last{i}", "email": f"user{i}@example.com",
+            "phone": f"+1555{i:07d}", "tags": ["vip", "lead"], "dateAdded": "2024-01-01T00:00:00Z",
+            "customFields": [{"id": f"f{k}", "value": k} for k in range(10)],
+            "attributionSource": {"medium": "email", "utm": {"campaign": "spring"}},
+        }
+        for i in range(n)
+    ]
+
+def per_record_split(items, fields):
+    # What contacts._filter_fields used to do
+    out = []
+    for item in items:
+        selected = fields.split(",")
+        out.append({k: item.get(k) for k in selected if k in item})
+    return out
+
+def run(label, fn, records, repeat=5):
+    best = min(timeit.repeat(fn, number=1, repeat=repeat))
+    print(f"{label:<48} {best * 1e9 / records:8.0f} ns/record")
+
+def main():
+    records = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    items = make_contacts(records)
+    flat = "id,email,firstName,lastName,phone,tags"
+    nested = "id,email,attributionSource.utm.campaign,customFields[id=f7].value,customFields[*].value"
+
+    run("split per record (old)", lambda: per_record_split(items, flat), records)
+    run("compiled, top-level keys", lambda: project(items, flat), records)
+    run("compiled, nested paths", lambda: project(items, nested), records)
+    run("compile_projection() cache hit per record", lambda: [compile_projection(flat)(i) for i in items], records)
+
+if __name__ == "__main__":
+    main()
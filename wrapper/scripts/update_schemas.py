@@ -0,0 +1,28 @@
+"""Regenerates src/ghl/schemas/ (the Parquet export column definitions) from ../apps/*.json.
+
+Run after updating the OpenAPI specs:
+
+    python scripts/update_schemas.py
+"""
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from ghl.parquet import RESOURCE_SCHEMAS, bundled_schemas  # noqa: E402
+
+SPECS = ROOT.parent / "apps"
+OUT = ROOT / "src" / "ghl" / "schemas"
+
+def main() -> None:
+    OUT.mkdir(exist_ok=True)
+    for filename, names in RESOURCE_SCHEMAS.values():
+        with open(SPECS / filename, "r") as f:
+            spec = json.load(f)
+        (OUT / filename).write_text(json.dumps(bundled_schemas(spec, names), indent=2) + "\n")
+        print(OUT / filename)
+
+if __name__ == "__main__":
+    main()
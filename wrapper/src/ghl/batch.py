@@ -0,0 +1,156 @@
+import asyncio
+from typing import Optional, Dict, Any, Iterable, Iterator, Tuple, Union, Callable, TextIO
+from . import codec
+from .client import AsyncGHLClient
+from .endpoints.aio import contacts, opportunities, conversations, calendars, locations, objects
+
+DEFAULT_CONCURRENCY = 8
+
+# In input order, at most this many operations per worker may be read ahead of the
+# oldest one still running; it bounds the results held back for reordering
+WINDOW_PER_WORKER = 4
+
+ORDERS = ("input", "completion")
+
+# resource -> (endpoint module, noun): action "update" on "contacts" calls update_contact
+RESOURCES = {
+    "contacts": (contacts, "contact"),
+    "opportunities": (opportunities, "opportunity"),
+    "conversations": (conversations, "conversation"),
+    "calendars": (calendars, "calendar"),
+    "events": (calendars, "event"),
+    "locations": (locations, "location"),
+    "objects": (objects, "record"),
+}
+
+ACTIONS = ("get", "create", "upsert", "update", "delete")
+_NEEDS_ID = ("get", "update", "delete")
+_NEEDS_PAYLOAD = ("create", "upsert", "update")
+
+Operation = Union[Dict[str, Any], Exception]
+
+def read_operations(source: TextIO) -> Iterator[Tuple[int, Operation]]:
+    """Streams (line index, operation) pairs from JSON lines.
+
+    A line that is not a JSON object is yielded as the exception, so the batch
+    can report it and carry on.
+    """
+    for index, line in enumerate(source):
+        if not line.strip():
+            continue
+        try:
+            operation = codec.loads(line)
+        except ValueError as e:
+            yield index, e
+            continue
+        yield index, operation if isinstance(operation, dict) else ValueError("Expected a JSON object")
+
+def resolve(operation: Dict[str, Any]) -> Tuple[Callable, tuple]:
+    """Endpoint coroutine function and its positional arguments (after the client) for an operation.
+
+    An operation is {"resource", "action", "id", "payload"}; custom object records
+    also take "schemaKey". Raises ValueError for anything that does not map onto
+    an endpoint function.
+    """
+    resource, action = operation.get("resource"), operation.get("action")
+    if resource not in RESOURCES:
+        raise ValueError(f"Unknown resource: {resource} (use one of {', '.join(RESOURCES)})")
+    if action not in ACTIONS:
+        raise ValueError(f"Unknown action: {action} (use one of {', '.join(ACTIONS)})")
+    module, noun = RESOURCES[resource]
+    function = getattr(module, f"{action}_{noun}", None)
+    if function is None:
+        raise ValueError(f"{resource} does not support {action}")
+
+    args: tuple = ()
+    if resource == "objects":
+        if not operation.get("schemaKey"):
+            raise ValueError("objects operations need a schemaKey")
+        args += (operation["schemaKey"],)
+    if action in _NEEDS_ID:
+        if not operation.get("id"):
+            raise ValueError(f"{action} needs an id")
+        args += (operation["id"],)
+    if action in _NEEDS_PAYLOAD:
+        if not isinstance(operation.get("payload"), dict):
+            raise ValueError(f"{action} needs a payload object")
+        args += (operation["payload"],)
+    return function, args
+
+async def _run_operation(client: AsyncGHLClient, index: int, operation: Operation) -> Dict[str, Any]:
+    if isinstance(operation, Exception):
+        return {"row": index, "status": "error", "error": f"Invalid operation: {operation}"}
+
+    result: Dict[str, Any] = {"row": index, "resource": operation.get("resource"), "action": operation.get("action")}
+    if operation.get("id"):
+        result["id"] = operation["id"]
+    try:
+        function, args = resolve(operation)
+        data = await function(client, *args)
+    except Exception as e:
+        return {**result, "status": "error", "error": str(e)}
+    return {**result, "status": "ok", "result": data}
+
+async def _next(operations: Iterator[Tuple[int, Operation]]) -> Optional[Tuple[int, Operation]]:
+    # Input may be a pipe that is slow to fill; waiting on it must not stall requests in flight
+    return await asyncio.to_thread(next, operations, None)
+
+async def run_batch(client: AsyncGHLClient, operations: Iterable[Tuple[int, Operation]],
+                    emit: Callable[[Dict[str, Any]], None], concurrency: int = DEFAULT_CONCURRENCY,
+                    order: str = "input") -> Dict[str, int]:
+    """Runs operations through their endpoint functions with `concurrency` workers.
+
+    Each operation's result is passed to `emit`, either in input order or as it
+    completes. Pacing is left to the client's rate limiter and retry policy; a
+    failed operation is reported and does not stop the batch. Returns counts of
+    succeeded and failed operations.
+    """
+    if order not in ORDERS:
+        raise ValueError(f"Unknown order: {order}")
+    summary = {"succeeded": 0, "failed": 0}
+    queue: "asyncio.Queue[Optional[tuple]]" = asyncio.Queue(maxsize=concurrency * 2)
+    window = asyncio.Semaphore(concurrency * WINDOW_PER_WORKER)
+    # Input order: results that finished before an earlier operation, by position
+    held: Dict[int, Dict[str, Any]] = {}
+    next_position = 0
+
+    def finish(position: int, result: Dict[str, Any]) -> None:
+        nonlocal next_position
+        summary["succeeded" if result["status"] == "ok" else "failed"] += 1
+        if order == "completion":
+            emit(result)
+            window.release()
+            return
+        held[position] = result
+        while next_position in held:
+            emit(held.pop(next_position))
+            next_position += 1
+            window.release()
+
+    async def worker() -> None:
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            position, index, operation = item
+            finish(position, await _run_operation(client, index, operation))
+
+    iterator = iter(operations)
+    workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+    try:
+        position = 0
+        while True:
+            entry = await _next(iterator)
+            if entry is None:
+                break
+            await window.acquire()
+            await queue.put((position, *entry))
+            position += 1
+        for _ in workers:
+            await queue.put(None)
+        await asyncio.gather(*workers)
+    finally:
+        for task in workers:
+            task.cancel()
+
+    return summary
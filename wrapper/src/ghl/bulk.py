@@ -0,0 +1,50 @@
+import asyncio
+from itertools import islice
+from typing import Dict, Any, Iterable, Iterator, Callable, Awaitable, AsyncIterator
+import httpx
+
+DEFAULT_CONCURRENCY = 16
+
+def unique_ids(ids: Iterable[str]) -> Iterator[str]:
+    """IDs in first-seen order, without blanks or repeats."""
+    seen = set()
+    for value in ids:
+        value = (value or "").strip()
+        if value and value not in seen:
+            seen.add(value)
+            yield value
+
+def is_missing(error: Exception) -> bool:
+    return isinstance(error, httpx.HTTPStatusError) and error.response.status_code == 404
+
+async def _fetch_one(fetch: Callable[[str], Awaitable[Any]], item_id: str) -> Dict[str, Any]:
+    try:
+        return {"id": item_id, "status": "ok", "result": await fetch(item_id)}
+    except Exception as e:
+        if is_missing(e):
+            return {"id": item_id, "status": "missing"}
+        return {"id": item_id, "status": "error", "error": str(e)}
+
+async def fetch_many(fetch: Callable[[str], Awaitable[Any]], ids: Iterable[str],
+                     concurrency: int = DEFAULT_CONCURRENCY) -> AsyncIterator[Dict[str, Any]]:
+    """Awaits fetch(id) once per distinct ID, `concurrency` at a time, yielding results as they complete.
+
+    A result is {"id", "status": "ok", "result"}, {"id", "status": "missing"} when
+    the API answers 404, or {"id", "status": "error", "error"}; none of them stops
+    the run. Pacing, retries and the response cache are left to the client behind
+    `fetch`.
+    """
+    pending = unique_ids(ids)
+    running: set = set()
+    try:
+        while True:
+            for item_id in islice(pending, concurrency - len(running)):
+                running.add(asyncio.create_task(_fetch_one(fetch, item_id)))
+            if not running:
+                return
+            finished, running = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in finished:
+                yield task.result()
+    finally:
+        for task in running:
+            task.cancel()
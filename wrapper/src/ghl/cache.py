@@ -0,0 +1,278 @@
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Dict, Any, Callable, Mapping, Tuple, Union
+from urllib.parse import urlencode
+import httpx
+
+# Slow-changing reference routes and how long (seconds) their GET responses stay fresh.
+# Patterns must match the whole request path.
+DEFAULT_TTLS: Dict[str, float] = {
+    r"/opportunities/pipelines/?": 3600,
+    r"/calendars/?": 3600,
+    r"/calendars/(?!events)[^/]+/?": 3600,
+    r"/objects/?": 3600,
+    r"/objects/[^/]+/?": 3600,
+    r"/workflows/?": 3600,
+    r"/locations/(?!search)[^/]+/?": 3600,
+}
+
+# Single records, which change far more often than reference data. Opt in with
+# ResponseCache(ttls={**DEFAULT_TTLS, **RECORD_TTLS}) (or "cache_records" in the CLI)
+# when repeated lookups of the same IDs matter more than seeing edits made elsewhere.
+RECORD_TTLS: Dict[str, float] = {
+    r"/contacts/(?!search|upsert|business)[^/]+/?": 300,
+    r"/opportunities/(?!search|pipelines|upsert)[^/]+/?": 300,
+    r"/conversations/(?!search|messages)[^/]+/?": 300,
+    r"/objects/[^/]+/records/(?!search)[^/]+/?": 300,
+}
+
+# POST routes that only read data and must not invalidate anything
+READ_ONLY_POSTS = (re.compile(r".*/search/?"), re.compile(r"/oauth/locationToken"))
+
+def tenant_key(location_id: Optional[str], credential: Optional[str]) -> str:
+    """Scopes cache entries to one location and credential without storing the credential itself."""
+    digest = hashlib.sha256((credential or "").encode()).hexdigest()[:16]
+    return f"{location_id or ''}:{digest}"
+
+def cache_key(path: str, params: Optional[Mapping[str, Any]] = None, tenant: Optional[str] = None) -> str:
+    items = sorted((k, str(v)) for k, v in (params or {}).items() if v is not None)
+    key = f"{path}?{urlencode(items)}" if items else path
+    return f"{tenant} {key}" if tenant else key
+
+def is_mutation(method: str, path: str) -> bool:
+    if method.lower() not in ("post", "put", "patch", "delete"):
+        return False
+    if method.lower() == "post" and any(p.fullmatch(path) for p in READ_ONLY_POSTS):
+        return False
+    return True
+
+def affects(written_path: str, cached_path: str) -> bool:
+    """True if a write to written_path can change what a GET of cached_path returns.
+
+    That is the resource itself, anything nested under it, and every collection
+    above it (a PUT /calendars/abc changes the GET /calendars/ listing too).
+    """
+    written = written_path.rstrip("/")
+    cached = cached_path.rstrip("/")
+    return (written == cached
+            or cached.startswith(written + "/")
+            or written.startswith(cached + "/"))
+
+class BaseResponseCache:
+    """Per-route TTL rules shared by the cache backends.
+
+    Backends implement get/set/invalidate/clear/stats; GHLClient only talks to
+    that interface.
+    """
+
+    def __init__(self, ttls: Optional[Mapping[str, float]] = None):
+        self._ttls = [(re.compile(pattern), ttl) for pattern, ttl in (DEFAULT_TTLS if ttls is None else ttls).items()]
+
+    def ttl_for(self, path: str) -> Optional[float]:
+        for pattern, ttl in self._ttls:
+            if pattern.fullmatch(path):
+                return ttl
+        return None
+
+class ResponseCache(BaseResponseCache):
+    """In-memory TTL + LRU cache for GET responses.
+
+    Only paths matching one of the `ttls` patterns are cached. Once more than
+    `max_entries` responses are held the least recently used one is dropped.
+    """
+
+    def __init__(self, max_entries: int = 512, ttls: Optional[Mapping[str, float]] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        super().__init__(ttls)
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, str, httpx.Response]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[httpx.Response]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= self._clock():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[2]
+
+    def set(self, key: str, path: str, response: httpx.Response) -> None:
+        ttl = self.ttl_for(path)
+        if not ttl:
+            return
+        with self._lock:
+            self._entries[key] = (self._clock() + ttl, path, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, path: str) -> int:
+        with self._lock:
+            stale = [key for key, (_, cached_path, _) in self._entries.items() if affects(path, cached_path)]
+            for key in stale:
+                del self._entries[key]
+            return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+class SQLiteResponseCache(BaseResponseCache):
+    """On-disk GET response cache shared by every process that opens the same file.
+
+    SQLite's WAL mode and busy timeout make concurrent CLI invocations safe:
+    readers never block, and writers wait for each other instead of failing.
+    Entries are evicted least recently used first once either `max_entries`
+    or `max_bytes` of response bodies is exceeded.
+    """
+
+    def __init__(self, path: Union[str, Path], max_entries: int = 2000, max_bytes: int = 50 * 1024 * 1024,
+                 ttls: Optional[Mapping[str, float]] = None, clock: Callable[[], float] = time.time):
+        super().__init__(ttls)
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), timeout=30.0, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                path TEXT NOT NULL,
+                expires_at REAL NOT NULL,
+                last_used REAL NOT NULL,
+                status INTEGER NOT NULL,
+                content_type TEXT,
+                content BLOB NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used);
+            CREATE TABLE IF NOT EXISTS counters (name TEXT PRIMARY KEY, value INTEGER NOT NULL);
+        """)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def _bump(self, name: str, amount: int = 1) -> None:
+        self._conn.execute(
+            "INSERT INTO counters (name, value) VALUES (?, ?) ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+            (name, amount),
+        )
+
+    def get(self, key: str) -> Optional[httpx.Response]:
+        now = self._clock()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT expires_at, path, status, content_type, content FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None or row[0] <= now:
+                    if row is not None:
+                        self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    self._bump("misses")
+                    self._conn.execute("COMMIT")
+                    return None
+                self._conn.execute("UPDATE responses SET last_used = ? WHERE key = ?", (now, key))
+                self._bump("hits")
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+        _, path, status, content_type, content = row
+        headers = {"content-type": content_type} if content_type else {}
+        return httpx.Response(status, headers=headers, content=content, request=httpx.Request("GET", path))
+
+    def set(self, key: str, path: str, response: httpx.Response) -> None:
+        ttl = self.ttl_for(path)
+        if not ttl:
+            return
+        now = self._clock()
+        content_type = response.headers.get("content-type")
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, path, expires_at, last_used, status, content_type, content) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, path, now + ttl, now, response.status_code, content_type, response.content),
+                )
+                self._evict()
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def _evict(self) -> None:
+        count, size = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(LENGTH(content)), 0) FROM responses").fetchone()
+        if count <= self.max_entries and size <= self.max_bytes:
+            return
+
+        evicted = 0
+        for key, length in self._conn.execute("SELECT key, LENGTH(content) FROM responses ORDER BY last_used").fetchall():
+            if count <= self.max_entries and size <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            count -= 1
+            size -= length
+            evicted += 1
+        self._bump("evictions", evicted)
+
+    def invalidate(self, path: str) -> int:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                rows = self._conn.execute("SELECT key, path FROM responses").fetchall()
+                stale = [(key,) for key, cached_path in rows if affects(path, cached_path)]
+                self._conn.executemany("DELETE FROM responses WHERE key = ?", stale)
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.execute("DELETE FROM counters")
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            entries, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(LENGTH(content)), 0) FROM responses"
+            ).fetchone()
+            counters = dict(self._conn.execute("SELECT name, value FROM counters").fetchall())
+        return {
+            "entries": entries,
+            "bytes": size,
+            "hits": counters.get("hits", 0),
+            "misses": counters.get("misses", 0),
+            "evictions": counters.get("evictions", 0),
+        }
@@ -1,62 +1,143 @@
+import asyncio
+import threading
+import time
 import httpx
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple, Iterator, AsyncIterator
+from . import codec
+from .jsonstream import ArrayStream, iter_array
+from .cache import ResponseCache, cache_key, is_mutation, tenant_key
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .tokens import TokenStore
 
-class GHLClient:
+class _CodecResponse(httpx.Response):
+    """httpx.Response whose json() decodes with ghl.codec (orjson when installed)."""
+
+    def json(self, **kwargs: Any) -> Any:
+        return codec.loads(self.content)
+
+def _with_codec(response: httpx.Response) -> httpx.Response:
+    # Exact type check: test doubles built with spec=httpx.Response keep their own json()
+    if type(response) is httpx.Response and codec.BACKEND != "json":
+        response.__class__ = _CodecResponse
+    return response
+
+class _BaseGHLClient:
+    """State and response handling shared by the sync and async clients."""
     BASE_URL = "https://services.leadconnectorhq.com"
+    API_VERSION = "2021-07-28"
+    # Refresh this many seconds before the access token expires
+    REFRESH_MARGIN = 60.0
 
-    def __init__(self, api_key: str, location_id: Optional[str] = None, client: Optional[httpx.Client] = None,
-                 client_id: Optional[str] = None, client_secret: Optional[str] = None, refresh_token: Optional[str] = None):
+    def __init__(self, api_key: str, location_id: Optional[str] = None,
+                 client_id: Optional[str] = None, client_secret: Optional[str] = None, refresh_token: Optional[str] = None,
+                 rate_limiter: Optional[RateLimiter] = None, retry_policy: Optional[RetryPolicy] = None,
+                 cache: Optional[ResponseCache] = None, token_expires_at: Optional[float] = None,
+                 token_store: Optional[TokenStore] = None, token_key: Optional[str] = None):
         self.api_key = api_key
         self.location_id = location_id
         self.client_id = client_id
         self.client_secret = client_secret
         self.refresh_token = refresh_token
+        # Epoch seconds at which api_key stops being valid, when known
+        self.token_expires_at = token_expires_at
+        # Paces requests per location; pass a shared RateLimiter to pool budgets across clients
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.retry_policy = retry_policy or RetryPolicy()
+        # Optional GET response cache for slow-changing reference data
+        self.cache = cache
+        # Optional store sharing OAuth tokens with other processes
+        self.token_store = token_store
+        self._token_key = token_key
 
-        headers = {
-            "Authorization": f"Bearer {api_key}",
-            "Version": "2021-07-28"
-        }
+        if token_store is not None:
+            stored = token_store.load(self.token_key)
+            if stored:
+                # The store is at least as new as anything we were handed: refresh
+                # tokens rotate, so the configured one may already be spent.
+                self._set_token(stored)
+        if not self.api_key and self.refresh_token and self.token_expires_at is None:
+            # No access token yet: get one before the first request
+            self.token_expires_at = 0.0
 
-        self.client = client or httpx.Client(
-            base_url=self.BASE_URL,
-            headers=headers,
-            timeout=30.0
-        )
+    @property
+    def token_key(self) -> str:
+        """Identifies this OAuth install in the token store."""
+        return self._token_key or f"{self.client_id or ''}:{self.location_id or ''}"
 
-    def refresh_access_token(self) -> Dict[str, Any]:
-        """Refreshes the access token using the refresh token."""
-        if not (self.client_id and self.client_secret and self.refresh_token):
+    def _default_headers(self) -> Dict[str, str]:
+        return {
+            "Authorization": f"Bearer {self.api_key}",
+            "Version": self.API_VERSION
+        }
+
+    def _token_request_data(self, refresh_token: Optional[str] = None) -> Dict[str, str]:
+        refresh_token = refresh_token or self.refresh_token
+        if not (self.client_id and self.client_secret and refresh_token):
             raise ValueError("client_id, client_secret, and refresh_token are required for token refresh")
 
-        url = f"{self.BASE_URL}/oauth/token"
-        data = {
+        return {
             "client_id": self.client_id,
             "client_secret": self.client_secret,
             "grant_type": "refresh_token",
-            "refresh_token": self.refresh_token,
+            "refresh_token": refresh_token,
             "user_type": "Location"
         }
 
-        # Use a separate client for the refresh call to avoid headers from the main client
-        with httpx.Client() as token_client:
-            response = token_client.post(url, data=data)
-
-        # Handle response manually here as we don't want to trigger recursion via _handle_response
-        try:
-            response.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            # We can try to enrich the error message here too
-            raise e
-
-        token_data = response.json()
+    def _set_token(self, token_data: Dict[str, Any]) -> None:
         self.api_key = token_data["access_token"]
-        if "refresh_token" in token_data:
+        if token_data.get("refresh_token"):
             self.refresh_token = token_data["refresh_token"]
+        if token_data.get("expires_in"):
+            self.token_expires_at = time.time() + float(token_data["expires_in"])
+        elif token_data.get("expires_at") is not None:
+            self.token_expires_at = float(token_data["expires_at"])
+
+    def _apply_token(self, token_data: Dict[str, Any]) -> None:
+        self._set_token(token_data)
 
         # Update the main client headers
         self.client.headers["Authorization"] = f"Bearer {self.api_key}"
 
-        return token_data
+    def _expiring(self, expires_at: Optional[float]) -> bool:
+        return expires_at is not None and time.time() >= expires_at - self.REFRESH_MARGIN
+
+    def _can_refresh(self) -> bool:
+        """Whether refresh_access_token can get a new access token (a refresh token by default)."""
+        return bool(self.refresh_token)
+
+    def _token_expiring(self) -> bool:
+        return self._can_refresh() and self._expiring(self.token_expires_at)
+
+    def _stored_newer_token(self, stored: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Tokens another process refreshed while we waited for the store lock, if any."""
+        if stored and stored["access_token"] != self.api_key and not self._expiring(stored.get("expires_at")):
+            return stored
+        return None
+
+    @property
+    def cache_tenant(self) -> str:
+        """Keeps cached responses from being served to another location or credential.
+
+        OAuth installs are identified by their token key, which survives token
+        refreshes; any other client by its access token.
+        """
+        credential = self.token_key if self.client_id or self._token_key else self.api_key
+        return tenant_key(self.location_id, credential)
+
+    def _cache_lookup(self, method: str, url: str, params: Optional[Dict[str, Any]]) -> Tuple[Optional[str], Optional[httpx.Response]]:
+        if self.cache is None or method != "get" or self.cache.ttl_for(url) is None:
+            return None, None
+        key = cache_key(url, params, self.cache_tenant)
+        return key, self.cache.get(key)
+
+    def _cache_store(self, key: Optional[str], url: str, response: httpx.Response) -> None:
+        if key is not None:
+            self.cache.set(key, url, response)
+
+    def _invalidate(self, method: str, url: str) -> None:
+        if self.cache is not None and is_mutation(method, url):
+            self.cache.invalidate(url)
 
     def _handle_response(self, response: httpx.Response) -> httpx.Response:
         try:
@@ -89,34 +170,320 @@ class GHLClient:
 
         return response
 
+    @staticmethod
+    def _body_kwargs(json: Optional[Dict[str, Any]], params: Optional[Dict[str, Any]],
+                     data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        kwargs: Dict[str, Any] = {"json": json, "params": params}
+        if data is not None:
+            # Form-encoded body, for the /oauth routes
+            kwargs["data"] = data
+        return kwargs
+
+    @staticmethod
+    def _stream_kwargs(params: Optional[Dict[str, Any]], json: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        kwargs: Dict[str, Any] = {"stream": True, "params": params}
+        if json is not None:
+            kwargs["json"] = json
+        return kwargs
+
+class GHLClient(_BaseGHLClient):
+    def __init__(self, api_key: str, location_id: Optional[str] = None, client: Optional[httpx.Client] = None,
+                 client_id: Optional[str] = None, client_secret: Optional[str] = None, refresh_token: Optional[str] = None,
+                 rate_limiter: Optional[RateLimiter] = None, retry_policy: Optional[RetryPolicy] = None,
+                 cache: Optional[ResponseCache] = None, token_expires_at: Optional[float] = None,
+                 token_store: Optional[TokenStore] = None, token_key: Optional[str] = None):
+        super().__init__(api_key, location_id, client_id, client_secret, refresh_token, rate_limiter, retry_policy, cache,
+                         token_expires_at, token_store, token_key)
+
+        self.client = client or httpx.Client(
+            base_url=self.BASE_URL,
+            headers=self._default_headers(),
+            timeout=30.0
+        )
+        # Kept separately so the token call never carries the main client's headers,
+        # and reused so refreshes do not pay for a new TLS handshake
+        self._token_client: Optional[httpx.Client] = None
+        self._refresh_lock = threading.Lock()
+
+    def close(self) -> None:
+        self.client.close()
+        if self._token_client is not None:
+            self._token_client.close()
+
+    def refresh_access_token(self) -> Dict[str, Any]:
+        """Refreshes the access token using the refresh token."""
+        if self.token_store is None:
+            token_data = self._exchange_token()
+            self._apply_token(token_data)
+            return token_data
+
+        with self.token_store.acquire(self.token_key) as lease:
+            token_data = self._stored_newer_token(lease.current)
+            if token_data is None:
+                token_data = self._exchange_token((lease.current or {}).get("refresh_token"))
+                lease.save(token_data)
+            self._apply_token(token_data)
+        return token_data
+
+    def _exchange_token(self, refresh_token: Optional[str] = None) -> Dict[str, Any]:
+        data = self._token_request_data(refresh_token)
+        url = f"{self.BASE_URL}/oauth/token"
+
+        if self._token_client is None:
+            self._token_client = httpx.Client(timeout=30.0)
+        response = self._token_client.post(url, data=data)
+
+        # Handle response manually here as we don't want to trigger recursion via _handle_response
+        response.raise_for_status()
+
+        return response.json()
+
+    def _send(self, method: str, url: str, stream: bool = False, **kwargs) -> httpx.Response:
+        self.rate_limiter.acquire(self.location_id)
+        if stream:
+            response = self.client.send(self.client.build_request(method.upper(), url, **kwargs), stream=True)
+            if response.is_error:
+                # Error bodies are small and _handle_response wants to read them
+                try:
+                    response.read()
+                finally:
+                    response.close()
+        else:
+            response = getattr(self.client, method)(url, **kwargs)
+        self.rate_limiter.update_from_response(self.location_id, response)
+        return response
+
     def _make_request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        key, cached = self._cache_lookup(method, url, kwargs.get("params"))
+        if cached is not None:
+            return _with_codec(cached)
+
         try:
-            response = getattr(self.client, method)(url, **kwargs)
+            response = self._request_with_retries(method, url, **kwargs)
+        finally:
+            self._invalidate(method, url)
+
+        self._cache_store(key, url, response)
+        return _with_codec(response)
+
+    def _request_with_retries(self, method: str, url: str, **kwargs) -> httpx.Response:
+        retry = self.retry_policy.start()
+        while True:
+            try:
+                return self._request_once(method, url, **kwargs)
+            except (httpx.HTTPStatusError, httpx.TransportError) as e:
+                delay = retry.next_delay(method, url, e)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+
+    def _refresh_once(self, stale_token: str) -> None:
+        """Single-flight refresh: only the first caller holding `stale_token` refreshes.
+
+        Everyone else waits on the lock and then finds a newer token already in place,
+        so a burst of 401s costs one token exchange and never rotates refresh_token twice.
+        """
+        with self._refresh_lock:
+            if self.api_key == stale_token:
+                self.refresh_access_token()
+
+    def _request_once(self, method: str, url: str, **kwargs) -> httpx.Response:
+        if self._token_expiring():
+            self._refresh_once(self.api_key)
+
+        token = self.api_key
+        try:
+            response = self._send(method, url, **kwargs)
             return self._handle_response(response)
         except httpx.HTTPStatusError as e:
             # Check for 401 and if we have refresh capabilities
-            if e.response.status_code == 401 and self.refresh_token:
-                try:
-                    self.refresh_access_token()
-                    # Retry the original request with new token
-                    response = getattr(self.client, method)(url, **kwargs)
-                    return self._handle_response(response)
-                except Exception:
-                    # If refresh fails, or retry fails, raise the original error (or the new one).
-                    # Raising the original error might be less confusing if refresh failed silently,
-                    # but if refresh failed explicitly, we should probably know.
-                    # Let's raise the new error if refresh failed.
-                    raise
+            if e.response.status_code == 401 and self._can_refresh():
+                # If refresh fails, or the retry fails, the new error propagates.
+                self._refresh_once(token)
+                # Retry the original request with new token
+                response = self._send(method, url, **kwargs)
+                return self._handle_response(response)
             raise e
 
     def get(self, url: str, params: Optional[Dict[str, Any]] = None) -> httpx.Response:
         return self._make_request("get", url, params=params)
 
-    def post(self, url: str, json: Optional[Dict[str, Any]] = None, params: Optional[Dict[str, Any]] = None) -> httpx.Response:
-        return self._make_request("post", url, json=json, params=params)
+    def post(self, url: str, json: Optional[Dict[str, Any]] = None, params: Optional[Dict[str, Any]] = None,
+             data: Optional[Dict[str, Any]] = None) -> httpx.Response:
+        return self._make_request("post", url, **self._body_kwargs(json, params, data))
 
     def put(self, url: str, json: Optional[Dict[str, Any]] = None, params: Optional[Dict[str, Any]] = None) -> httpx.Response:
         return self._make_request("put", url, json=json, params=params)
 
     def delete(self, url: str, params: Optional[Dict[str, Any]] = None) -> httpx.Response:
         return self._make_request("delete", url, params=params)
+
+    def stream_items(self, url: str, path: str, params: Optional[Dict[str, Any]] = None, method: str = "get",
+                     json: Optional[Dict[str, Any]] = None, rest: Optional[Dict[str, Any]] = None) -> Iterator[Any]:
+        """Yields the elements of the array at `path` (e.g. "contacts" or "messages.messages") as the body arrives.
+
+        The body is parsed incrementally (see ghl.jsonstream), so memory holds one
+        element rather than the whole response. Retries, rate limiting and token
+        refresh apply until the body starts; responses are never cached. When `rest`
+        is given it receives the other fields of the response (meta, cursors) once
+        the body is complete.
+        """
+        response = self._request_with_retries(method, url, **self._stream_kwargs(params, json))
+        try:
+            yield from iter_array(response.iter_bytes(), path.split(".") if path else (), rest)
+        finally:
+            response.close()
+
+class AsyncGHLClient(_BaseGHLClient):
+    """asyncio counterpart of GHLClient built on httpx.AsyncClient.
+
+    Every request method is a coroutine, so many requests can be in flight on
+    one event loop. Use it as an async context manager (or call aclose()) to
+    release pooled connections.
+    """
+
+    def __init__(self, api_key: str, location_id: Optional[str] = None, client: Optional[httpx.AsyncClient] = None,
+                 client_id: Optional[str] = None, client_secret: Optional[str] = None, refresh_token: Optional[str] = None,
+                 rate_limiter: Optional[RateLimiter] = None, retry_policy: Optional[RetryPolicy] = None,
+                 cache: Optional[ResponseCache] = None, token_expires_at: Optional[float] = None,
+                 token_store: Optional[TokenStore] = None, token_key: Optional[str] = None):
+        super().__init__(api_key, location_id, client_id, client_secret, refresh_token, rate_limiter, retry_policy, cache,
+                         token_expires_at, token_store, token_key)
+
+        self.client = client or httpx.AsyncClient(
+            base_url=self.BASE_URL,
+            headers=self._default_headers(),
+            timeout=30.0
+        )
+        self._token_client: Optional[httpx.AsyncClient] = None
+        self._refresh_lock = asyncio.Lock()
+
+    async def __aenter__(self) -> "AsyncGHLClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+        if self._token_client is not None:
+            await self._token_client.aclose()
+
+    async def refresh_access_token(self) -> Dict[str, Any]:
+        """Refreshes the access token using the refresh token."""
+        if self.token_store is None:
+            token_data = await self._exchange_token()
+            self._apply_token(token_data)
+            return token_data
+
+        # Waiting on the store's file lock must not block the event loop
+        lease = await asyncio.to_thread(self.token_store.acquire, self.token_key)
+        try:
+            token_data = self._stored_newer_token(lease.current)
+            if token_data is None:
+                token_data = await self._exchange_token((lease.current or {}).get("refresh_token"))
+                lease.save(token_data)
+        except BaseException:
+            await asyncio.to_thread(lease.abort)
+            raise
+        await asyncio.to_thread(lease.release)
+        self._apply_token(token_data)
+        return token_data
+
+    async def _exchange_token(self, refresh_token: Optional[str] = None) -> Dict[str, Any]:
+        data = self._token_request_data(refresh_token)
+        url = f"{self.BASE_URL}/oauth/token"
+
+        if self._token_client is None:
+            self._token_client = httpx.AsyncClient(timeout=30.0)
+        response = await self._token_client.post(url, data=data)
+
+        response.raise_for_status()
+
+        return response.json()
+
+    async def _send(self, method: str, url: str, stream: bool = False, **kwargs) -> httpx.Response:
+        await self.rate_limiter.acquire_async(self.location_id)
+        if stream:
+            response = await self.client.send(self.client.build_request(method.upper(), url, **kwargs), stream=True)
+            if response.is_error:
+                try:
+                    await response.aread()
+                finally:
+                    await response.aclose()
+        else:
+            response = await getattr(self.client, method)(url, **kwargs)
+        self.rate_limiter.update_from_response(self.location_id, response)
+        return response
+
+    async def _make_request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        key, cached = self._cache_lookup(method, url, kwargs.get("params"))
+        if cached is not None:
+            return _with_codec(cached)
+
+        try:
+            response = await self._request_with_retries(method, url, **kwargs)
+        finally:
+            self._invalidate(method, url)
+
+        self._cache_store(key, url, response)
+        return _with_codec(response)
+
+    async def _request_with_retries(self, method: str, url: str, **kwargs) -> httpx.Response:
+        retry = self.retry_policy.start()
+        while True:
+            try:
+                return await self._request_once(method, url, **kwargs)
+            except (httpx.HTTPStatusError, httpx.TransportError) as e:
+                delay = retry.next_delay(method, url, e)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+
+    async def _refresh_once(self, stale_token: str) -> None:
+        async with self._refresh_lock:
+            if self.api_key == stale_token:
+                await self.refresh_access_token()
+
+    async def _request_once(self, method: str, url: str, **kwargs) -> httpx.Response:
+        if self._token_expiring():
+            await self._refresh_once(self.api_key)
+
+        token = self.api_key
+        try:
+            response = await self._send(method, url, **kwargs)
+            return self._handle_response(response)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 401 and self._can_refresh():
+                await self._refresh_once(token)
+                response = await self._send(method, url, **kwargs)
+                return self._handle_response(response)
+            raise e
+
+    async def get(self, url: str, params: Optional[Dict[str, Any]] = None) -> httpx.Response:
+        return await self._make_request("get", url, params=params)
+
+    async def post(self, url: str, json: Optional[Dict[str, Any]] = None, params: Optional[Dict[str, Any]] = None,
+                   data: Optional[Dict[str, Any]] = None) -> httpx.Response:
+        return await self._make_request("post", url, **self._body_kwargs(json, params, data))
+
+    async def put(self, url: str, json: Optional[Dict[str, Any]] = None, params: Optional[Dict[str, Any]] = None) -> httpx.Response:
+        return await self._make_request("put", url, json=json, params=params)
+
+    async def delete(self, url: str, params: Optional[Dict[str, Any]] = None) -> httpx.Response:
+        return await self._make_request("delete", url, params=params)
+
+    async def stream_items(self, url: str, path: str, params: Optional[Dict[str, Any]] = None, method: str = "get",
+                           json: Optional[Dict[str, Any]] = None, rest: Optional[Dict[str, Any]] = None) -> AsyncIterator[Any]:
+        """Async counterpart of GHLClient.stream_items."""
+        response = await self._request_with_retries(method, url, **self._stream_kwargs(params, json))
+        try:
+            parser = ArrayStream(path.split(".") if path else ())
+            async for chunk in response.aiter_bytes():
+                for item in parser.feed(chunk):
+                    yield item
+            remainder = parser.close()
+            if rest is not None and isinstance(remainder, dict):
+                rest.update(remainder)
+        finally:
+            await response.aclose()
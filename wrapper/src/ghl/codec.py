@@ -0,0 +1,46 @@
+import json
+import os
+from typing import Any, Union
+
+# Optional dependency: install with `pip install ghl-wrapper[fast]`
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the extra
+    orjson = None
+
+def _pick_backend() -> str:
+    # GHL_JSON=json forces the standard library, e.g. to compare output
+    if orjson is not None and os.environ.get("GHL_JSON", "").lower() != "json":
+        return "orjson"
+    return "json"
+
+BACKEND = _pick_backend()
+
+def use(backend: str) -> None:
+    """Switches between "orjson" and "json" at runtime."""
+    global BACKEND
+    if backend not in ("orjson", "json"):
+        raise ValueError(f"Unknown JSON backend: {backend}")
+    if backend == "orjson" and orjson is None:
+        raise ImportError("orjson is not installed: pip install 'ghl-wrapper[fast]'")
+    BACKEND = backend
+
+def loads(data: Union[bytes, str]) -> Any:
+    if BACKEND == "orjson":
+        return orjson.loads(data)
+    return json.loads(data)
+
+def dump_bytes(obj: Any, pretty: bool = False) -> bytes:
+    """Serializes to UTF-8; compact unless `pretty` (two-space indent)."""
+    if BACKEND == "orjson":
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0))
+        except TypeError:
+            # orjson rejects what the stdlib accepts, e.g. integers beyond 64 bits
+            pass
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode()
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+def dumps(obj: Any, pretty: bool = False) -> str:
+    return dump_bytes(obj, pretty).decode()
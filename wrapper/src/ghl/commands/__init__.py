@@ -0,0 +1,54 @@
+import importlib
+import click
+
+# Command groups imported on first use: name -> ("module:attribute" in ghl.commands, short help).
+# The help text is repeated here so `ghl --help` can list them without importing anything.
+COMMANDS = {
+    "contacts": ("contacts:contacts_group", "Contact management"),
+    "conversations": ("conversations:conversations_group", "Conversation management"),
+    "opportunities": ("opportunities:opportunities_group", "Opportunity management"),
+    "calendars": ("calendars:calendars_group", "Calendar management"),
+    "workflows": ("workflows:workflows_group", "Workflow management"),
+    "objects": ("objects:objects_group", "Custom Object management"),
+    "locations": ("locations:locations_group", "Location (Sub-account) management"),
+    "fanout": ("fanout:fanout", "Run a report across many locations at once"),
+    "batch": ("batch:batch", "Run a JSONL stream of operations concurrently"),
+    "sync": ("sync:sync", "Update the local mirror used by --local reads"),
+    "serve": ("serve:serve", "Run a warm daemon that ghl commands forward to"),
+}
+
+class LazyGroup(click.Group):
+    """click.Group whose subcommands are imported only when they are run or asked for help."""
+
+    def __init__(self, *args, lazy_commands=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = dict(lazy_commands or {})
+
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_commands))
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name not in self.commands and cmd_name in self.lazy_commands:
+            self.add_command(self._load(cmd_name), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load(self, cmd_name):
+        module_name, attribute = self.lazy_commands[cmd_name][0].split(":")
+        module = importlib.import_module(f"{__name__}.{module_name}")
+        return getattr(module, attribute)
+
+    def format_commands(self, ctx, formatter):
+        # Same layout as click.Group, but unloaded commands use their registered help
+        names = [name for name in self.list_commands(ctx)
+                 if name not in self.commands or not self.commands[name].hidden]
+        if not names:
+            return
+        limit = formatter.width - 6 - max(len(name) for name in names)
+        rows = []
+        for name in names:
+            if name in self.commands:
+                rows.append((name, self.commands[name].get_short_help_str(limit)))
+            else:
+                rows.append((name, self.lazy_commands[name][1]))
+        with formatter.section("Commands"):
+            formatter.write_dl(rows)
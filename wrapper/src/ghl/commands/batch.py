@@ -0,0 +1,39 @@
+import asyncio
+import click
+import json
+import sys
+from ..cli import _client, _echo_line, _async_client
+from .. import batch as batch_ops
+
+@click.command('batch')
+@click.argument('source', type=click.Path(exists=True, dir_okay=False, allow_dash=True), default='-')
+@click.option('--concurrency', default=batch_ops.DEFAULT_CONCURRENCY, show_default=True, help='Operations in flight at once')
+@click.option('--order', type=click.Choice(batch_ops.ORDERS), default='input', show_default=True,
+              help='Emit results in input order or as they complete')
+@click.pass_context
+def batch(ctx, source, concurrency, order):
+    """Run a JSONL stream of operations concurrently
+
+    Each input line is {"resource": "contacts", "action": "update", "id": "...",
+    "payload": {...}} (custom object records also take "schemaKey"). Reads SOURCE,
+    or stdin by default, and prints one JSON result per operation. A summary goes
+    to stderr.
+    """
+    client = _client(ctx)
+    if not client:
+        click.echo("Error: API Key is missing.", err=True)
+        sys.exit(1)
+
+    try:
+        with click.open_file(source, 'r') as infile:
+            operations = batch_ops.read_operations(infile)
+
+            async def run():
+                async with _async_client(client) as async_client:
+                    return await batch_ops.run_batch(async_client, operations, _echo_line, concurrency, order)
+
+            summary = asyncio.run(run())
+        click.echo(json.dumps(summary), err=True)
+    except Exception as e:
+        click.echo(json.dumps({"error": str(e)}), err=True)
+        sys.exit(1)
@@ -0,0 +1,147 @@
+import asyncio
+import click
+import json
+import sys
+from ..cli import _client, _echo_json, _answer_locally, _async_client
+from .. import enrich
+from ..endpoints import calendars
+from ..endpoints.aio import calendars as aio_calendars
+
+@click.group()
+def calendars_group():
+    """Calendar management"""
+    pass
+
+@calendars_group.command('list')
+@click.option('--group-id', default=None, help='Filter by group ID')
+@click.option('--local', is_flag=True, help='Answer from the local mirror (see ghl sync)')
+@click.pass_context
+def calendars_list(ctx, group_id, local):
+    """List calendars"""
+    if local:
+        def read(mirror, location_id):
+            result = mirror.list_calendars(location_id)
+            if group_id:
+                result["calendars"] = [c for c in result["calendars"] if c.get("groupId") == group_id]
+            return result
+        return _answer_locally(ctx, read)
+
+    client = _client(ctx)
+    if not client:
+        click.echo("Error: API Key is missing.", err=True)
+        sys.exit(1)
+
+    try:
+        result = calendars.list_calendars(client, group_id=group_id)
+        _echo_json(result)
+    except Exception as e:
+        click.echo(json.dumps({"error": str(e)}), err=True)
+        sys.exit(1)
+
+@calendars_group.command('get')
+@click.argument('calendar_id')
+@click.pass_context
+def calendars_get(ctx, calendar_id):
+    """Get a calendar by ID"""
+    client = _client(ctx)
+    if not client:
+        click.echo("Error: API Key is missing.", err=True)
+        sys.exit(1)
+
+    try:
+        result = calendars.get_calendar(client, calendar_id)
+        _echo_json(result)
+    except Exception as e:
+        click.echo(json.dumps({"error": str(e)}), err=True)
+        sys.exit(1)
+
+@calendars_group.command('create')
+@click.option('--data', help='JSON data for creation')
+@click.option('--file', type=click.File('r'), help='JSON file for creation')
+@click.pass_context
+def calendars_create(ctx, data, file):
+    """Create a calendar"""
+    client = _client(ctx)
+    if not client:
+        click.echo("Error: API Key is missing.", err=True)
+        sys.exit(1)
+
+    if data:
+        payload = json.loads(data)
+    elif file:
+        payload = json.load(file)
+    else:
+        click.echo("Error: Must provide --data or --file", err=True)
+        sys.exit(1)
+
+    try:
+        result = calendars.create_calendar(client, payload)
+        _echo_json(result)
+    except Exception as e:
+        click.echo(json.dumps({"error": str(e)}), err=True)
+        sys.exit(1)
+
+@calendars_group.command('update')
+@click.argument('calendar_id')
+@click.option('--data', required=True, help='JSON data for update')
+@click.pass_context
+def calendars_update(ctx, calendar_id, data):
+    """Update a calendar"""
+    client = _client(ctx)
+    if not client:
+        click.echo("Error: API Key is missing.", err=True)
+        sys.exit(1)
+
+    try:
+        payload = json.loads(data)
+        result = calendars.update_calendar(client, calendar_id, payload)
+        _echo_json(result)
+    except Exception as e:
+        click.echo(json.dumps({"error": str(e)}), err=True)
+        sys.exit(1)
+
+@calendars_group.command('delete')
+@click.argument('calendar_id')
+@click.pass_context
+def calendars_delete(ctx, calendar_id):
+    """Delete a calendar"""
+    client = _client(ctx)
+    if not client:
+        click.echo("Error: API Key is missing.", err=True)
+        sys.exit(1)
+
+    try:
+        result = calendars.delete_calendar(client, calendar_id)
+        _echo_json(result)
+    except Exception as e:
+        click.echo(json.dumps({"error": str(e)}), err=True)
+        sys.exit(1)
+
+@calendars_group.command('events')
+@click.option('--start-time', required=True, help='Start time (millis)')
+@click.option('--end-time', required=True, help='End time (millis)')
+@click.option('--calendar-id', default=None, help='Filter by calendar ID')
+@click.option('--with-contact', is_flag=True, help="Join each event with its contact (one request per distinct contact)")
+@click.option('--contact-fields', default=None, help='Contact fields to join (default: name, email, phone, tags and a few more)')
+@click.pass_context
+def calendars_events(ctx, start_time, end_time, calendar_id, with_contact, contact_fields):
+    """List calendar events"""
+    client = _client(ctx)
+    if not client:
+        click.echo("Error: API Key is missing.", err=True)
+        sys.exit(1)
+
+    try:
+        if with_contact:
+            async def run():
+                async with _async_client(client) as async_client:
+                    page = await aio_calendars.list_events(async_client, start_time, end_time, calendar_id=calendar_id)
+                    return await enrich.enrich_page(async_client, page, "events", fields=contact_fields)
+            _echo_json(asyncio.run(run()))
+            return
+
+        result = calendars.list_events(client, start_time, end_time, calendar_id=calendar_id)
+        _echo_json(result)
+    except Exception as e:
+        click.echo(json.dumps({"error": str(e)}), err=True)
+        sys.exit(1)
@@ -0,0 +1,265 @@
+import asyncio
+import click
+import json
+import sys
+from contextlib import ExitStack
+from ..cli import _client, _echo_json, _echo_line, _answer_locally, _async_client, _many, _fetch_many, _answer_many_locally
+from .. import importer, export, bulk
+from ..endpoints import contacts
+from ..endpoints.aio import contacts as aio_contacts
+
+@click.group()
+def contacts_group():
+    """Contact management"""
+    pass
+
+@contacts_group.command('list')
+@click.option('--limit', default=20, help='Limit number of results')
+@click.option('--query', default=None, help='Search query')
+@click.option('--fields', default=None, help='Comma-separated fields to include (dotted paths allowed, e.g. customFields[id=abc].value)')
+@click.option('--all', 'fetch_all', is_flag=True, help='Follow the cursor through every page, one JSON contact per line')
+@click.option('-v', '--verbose', count=True, help='Verbosity level')
+@click.option('--local', is_flag=True, help='Answer from the local mirror (see ghl sync)')
+@click.pass_context
+def contacts_list(ctx, limit, query, fields, fetch_all, verbose, local):
+    """List contacts"""
+    if local:
+        def read(mirror, location_id):
+            result = mirror.list_contacts(location_id, limit, query)
+            result["contacts"] = contacts._filter_fields(result["contacts"], fields, verbose)
+            return result
+        return _answer_locally(ctx, read)
+
+    client = _client(ctx)
+    if not client:
+        click.echo("Error: API Key is missing.", err=True)
+        sys.exit(1)
+
+    try:
+        if fetch_all:
+            for contact in contacts.iter_contacts(client, query=query, fields=fields, verbose=verbose):
+                _echo_line(contact)
+            return
+
+        result = contacts.list_contacts(client, limit, query, fields, verbose)
+        _echo_json(result)
+    except Exception as e:
+        click.echo(json.dumps({"error": str(e)}), err=True)
+        sys.exit(1)
+
+@contacts_group.command('get')
+@click.argument('contact_ids', nargs=-1, required=True)
+@click.option('--fields', default=None, help='Comma-separated fields to include (dotted paths allowed, e.g. customFields[id=abc].value)')
+@click.option('-v', '--verbose', count=True, help='Verbosity level')
+@click.option('--local', is_flag=True, help='Answer from the local mirror (see ghl sync)')
+@click.option('--concurrency', default=bulk.DEFAULT_CONCURRENCY, show_default=True, help='Requests in flight when fetching several IDs')
+@click.pass_context
+def contacts_get(ctx, contact_ids, fields, verbose, local, concurrency):
+    """Get contacts by ID
+
+    With several IDs (or `-` to read them from stdin), prints one JSON contact per
+    line as they arrive; IDs that were not found are listed on stderr.
+    """
+    if _many(contact_ids):
+        if local:
+            def read_one(mirror, location_id, contact_id):
+                contact = mirror.get_contact(location_id, contact_id)
+                return None if contact is None else contacts._filter_fields(contact, fields, verbose)
+            return _answer_many_locally(ctx, contact_ids, read_one)
+        return _fetch_many(ctx, contact_ids, lambda client, ids: aio_contacts.get_many_contacts(
+            client, ids, fields, verbose, concurrency))
+
+    contact_id = contact_ids[0]
+    if local:
+        def read(mirror, location_id):
+            contact = mirror.get_contact(location_id, contact_id)
+            if contact is None:
+                raise LookupError(f"Contact {contact_id} is not in the local mirror")
+            return contacts._filter_fields(contact, fields, verbose)
+        return _answer_locally(ctx, read)
+
+    client = _client(ctx)
+    if not client:
+        click.echo("Error: API Key is missing.", err=True)
+        sys.exit(1)
+
+    try:
+        result = contacts.get_contact(client, contact_id, fields, verbose)
+        _echo_json(result)
+    except Exception as e:
+        click.echo(json.dumps({"error": str(e)}), err=True)
+        sys.exit(1)
+
+@contacts_group.command('create')
+@click.option('--data', help='JSON data for creation')
+@click.option('--file', type=click.File('r'), help='JSON file for creation')
+@click.pass_context
+def contacts_create(ctx, data, file):
+    """Create a contact"""
+    client = _client(ctx)
+    if not client:
+        click.echo("Error: API Key is missing.", err=True)
+        sys.exit(1)
+
+    if data:
+        payload = json.loads(data)
+    elif file:
+        payload = json.load(file)
+    else:
+        click.echo("Error: Must provide --data or --file", err=True)
+        sys.exit(1)
+
+    try:
+        result = contacts.create_contact(client, payload)
+        _echo_json(result)
+    except Exception as e:
+        click.echo(json.dumps({"error": str(e)}), err=True)
+        sys.exit(1)
+
+@contacts_group.command('update')
+@click.argument('contact_id')
+@click.option('--data', required=True, help='JSON data for update')
+@click.pass_context
+def contacts_update(ctx, contact_id, data):
+    """Update a contact"""
+    client = _client(ctx)
+    if not client:
+        click.echo("Error: API Key is missing.", err=True)
+        sys.exit(1)
+
+    try:
+        payload = json.loads(data)
+        result = contacts.update_contact(client, contact_id, payload)
+        _echo_json(result)
+    except Exception as e:
+        click.echo(json.dumps({"error": str(e)}), err=True)
+        sys.exit(1)
+
+@contacts_group.command('delete')
+@click.argument('contact_id')
+@click.pass_context
+def contacts_delete(ctx, contact_id):
+    """Delete a contact"""
+    client = _client(ctx)
+    if not client:
+        click.echo("Error: API Key is missing.", err=True)
+        sys.exit(1)
+
+    try:
+        result = contacts.delete_contact(client, contact_id)
+        _echo_json(result)
+    except Exception as e:
+        click.echo(json.dumps({"error": str(e)}), err=True)
+        sys.exit(1)
+
+@contacts_group.command('search')
+@click.option('--query', default=None, help='Search query (with --local: e.g. "email:*@example.com tag:vip")')
+@click.option('--filter', 'filters', multiple=True, help='Server-side filter FIELD:OPERATOR[:VALUE], e.g. tags:contains:vip (repeatable)')
+@click.option('--sort', 'sort', multiple=True, help='Sort FIELD[:asc|desc], e.g. dateAdded:desc (repeatable)')
+@click.option('--limit', default=100, help='Limit number of results')
+@click.option('--all', 'fetch_all', is_flag=True, help='Follow searchAfter through every match, one JSON contact per line')
+@click.option('--fields', default=None, help='Comma-separated fields to include (dotted paths allowed, e.g. customFields[id=abc].value)')
+@click.option('-v', '--verbose', count=True, help='Verbosity level')
+@click.option('--local', is_flag=True, help='Search the indexed local mirror (see ghl sync)')
+@click.pass_context
+def contacts_search(ctx, query, filters, sort, limit, fetch_all, fields, verbose, local):
+    """Search contacts"""
+    if local:
+        if not query:
+            click.echo("Error: --local needs --query.", err=True)
+            sys.exit(1)
+
+        def read(mirror, location_id):
+            result = mirror.search_contacts(location_id, query, limit)
+            result["contacts"] = contacts._filter_fields(result["contacts"], fields, verbose)
+            return result
+        return _answer_locally(ctx, read)
+
+    client = _client(ctx)
+    if not client:
+        click.echo("Error: API Key is missing.", err=True)
+        sys.exit(1)
+
+    try:
+        parsed_filters = [contacts.parse_filter(f) for f in filters] or None
+        parsed_sort = [contacts.parse_sort(s) for s in sort] or None
+        if fetch_all:
+            for contact in contacts.iter_search(client, query, parsed_filters, parsed_sort, fields, verbose):
+                _echo_line(contact)
+            return
+
+        result = contacts.search_contacts(client, query, fields, verbose, parsed_filters, parsed_sort, limit)
+        _echo_json(result)
+    except Exception as e:
+        click.echo(json.dumps({"error": str(e)}), err=True)
+        sys.exit(1)
+
+@contacts_group.command('import')
+@click.argument('source', type=click.Path(exists=True, dir_okay=False, allow_dash=True))
+@click.option('--format', 'fmt', type=click.Choice(['csv', 'jsonl']), default=None, help='Input format (default: from the file extension)')
+@click.option('--concurrency', default=importer.DEFAULT_CONCURRENCY, show_default=True, help='Upserts in flight at once')
+@click.option('--journal', type=click.Path(dir_okay=False), default=None, help='Checkpoint of imported rows (default: SOURCE.journal)')
+@click.option('--report', type=click.Path(dir_okay=False, allow_dash=True), default=None, help='NDJSON per-row results (default: SOURCE.report.ndjson)')
+@click.option('--restart', is_flag=True, help='Discard the journal and import every row again')
+@click.pass_context
+def contacts_import(ctx, source, fmt, concurrency, journal, report, restart):
+    """Upsert contacts from a CSV or JSONL file, resuming from the journal"""
+    client = _client(ctx)
+    if not client:
+        click.echo("Error: API Key is missing.", err=True)
+        sys.exit(1)
+
+    from_stdin = source == '-'
+    if from_stdin and not fmt:
+        click.echo("Error: --format is required when reading from stdin", err=True)
+        sys.exit(1)
+    if not from_stdin:
+        journal = journal or f"{source}.journal"
+        report = report or f"{source}.report.ndjson"
+
+    if restart and journal:
+        with open(journal, "w"):
+            pass
+
+    journal_log = importer.ImportJournal(journal) if journal else None
+    try:
+        fmt = fmt or importer.detect_format(source)
+        with ExitStack() as stack:
+            infile = sys.stdin if from_stdin else stack.enter_context(open(source, 'r', newline=''))
+            # Appended to, so a resumed import keeps the earlier runs' results
+            report_file = stack.enter_context(click.open_file(report, 'a')) if report else None
+            rows = importer.read_rows(infile, fmt)
+
+            async def run():
+                async with _async_client(client) as async_client:
+                    return await importer.import_contacts(async_client, rows, concurrency, journal_log, report_file)
+
+            result = asyncio.run(run())
+        _echo_json(result)
+    except Exception as e:
+        click.echo(json.dumps({"error": str(e)}), err=True)
+        sys.exit(1)
+    finally:
+        if journal_log is not None:
+            journal_log.close()
+
+@contacts_group.command('export')
+@click.option('--out', required=True, type=click.Path(dir_okay=False), help='File to write')
+@click.option('--format', 'fmt', type=click.Choice(export.FORMATS), default='jsonl', show_default=True, help='Output format (parquet needs the [parquet] extra)')
+@click.option('--fields', default=None, help='Comma-separated fields to include (CSV columns)')
+@click.option('--query', default=None, help='Search query')
+@click.option('--restart', is_flag=True, help='Ignore a saved cursor and export from the beginning')
+@click.pass_context
+def contacts_export(ctx, out, fmt, fields, query, restart):
+    """Stream every contact to a file, resuming an interrupted export"""
+    client = _client(ctx)
+    if not client:
+        click.echo("Error: API Key is missing.", err=True)
+        sys.exit(1)
+
+    try:
+        result = export.export_contacts(client, out, fmt, fields=fields, query=query, restart=restart)
+        _echo_json(result)
+    except Exception as e:
+        click.echo(json.dumps({"error": str(e)}), err=True)
+        sys.exit(1)
@@ -0,0 +1,158 @@
+import asyncio
+import click
+import json
+import sys
+from ..cli import _client, _echo_json, _echo_line, _many, _fetch_many, _async_client, _join_field
+from .. import bulk, enrich
+from ..endpoints import conversations
+from ..endpoints.aio import conversations as aio_conversations
+
+@click.group()
+def conversations_group():
+    """Conversation management"""
+    pass
+
+@conversations_group.command('list')
+@click.option('--limit', default=20, help='Limit number of results')
+@click.option('--query', default=None, help='Search query')
+@click.option('--status', default=None, help='Filter by status (all, read, unread, starred, recents)')
+@click.option('--fields', default=None, help='Comma-separated fields (dotted paths allowed) to keep per conversation')
+@click.option('--with-contact', is_flag=True, help="Join each conversation with its contact (one request per distinct contact)")
+@click.option('--contact-fields', default=None, help='Contact fields to join (default: name, email, phone, tags and a few more)')
+@click.pass_context
+def conversations_list(ctx, limit, query, status, fields, with_contact, contact_fields):
+    """List conversations"""
+    client = _client(ctx)
+    if not client:
+        click.echo("Error: API Key is missing.", err=True)
+        sys.exit(1)
+
+    try:
+        if with_contact:
+            async def run():
+                async with _async_client(client) as async_client:
+                    page = await aio_conversations.list_conversations(async_client, limit, query, status,
+                                                                      fields=_join_field(fields, "contactId"))
+                    return await enrich.enrich_page(async_client, page, "conversations", fields=contact_fields)
+            _echo_json(asyncio.run(run()))
+            return
+
+        result = conversations.list_conversations(client, limit, query, status, fields=fields)
+        _echo_json(result)
+    except Exception as e:
+        click.echo(json.dumps({"error": str(e)}), err=True)
+        sys.exit(1)
+
+@conversations_group.command('get')
+@click.argument('conversation_ids', nargs=-1, required=True)
+@click.option('--concurrency', default=bulk.DEFAULT_CONCURRENCY, show_default=True, help='Requests in flight when fetching several IDs')
+@click.pass_context
+def conversations_get(ctx, conversation_ids, concurrency):
+    """Get conversations by ID
+
+    With several IDs (or `-` to read them from stdin), prints one JSON conversation per
+    line as they arrive; IDs that were not found are listed on stderr.
+    """
+    if _many(conversation_ids):
+        return _fetch_many(ctx, conversation_ids, lambda client, ids: aio_conversations.get_many_conversations(
+            client, ids, concurrency))
+
+    conversation_id = conversation_ids[0]
+    client = _client(ctx)
+    if not client:
+        click.echo("Error: API Key is missing.", err=True)
+        sys.exit(1)
+
+    try:
+        result = conversations.get_conversation(client, conversation_id)
+        _echo_json(result)
+    except Exception as e:
+        click.echo(json.dumps({"error": str(e)}), err=True)
+        sys.exit(1)
+
+@conversations_group.command('create')
+@click.option('--data', help='JSON data for creation')
+@click.option('--file', type=click.File('r'), help='JSON file for creation')
+@click.pass_context
+def conversations_create(ctx, data, file):
+    """Create a conversation"""
+    client = _client(ctx)
+    if not client:
+        click.echo("Error: API Key is missing.", err=True)
+        sys.exit(1)
+
+    if data:
+        payload = json.loads(data)
+    elif file:
+        payload = json.load(file)
+    else:
+        click.echo("Error: Must provide --data or --file", err=True)
+        sys.exit(1)
+
+    try:
+        result = conversations.create_conversation(client, payload)
+        _echo_json(result)
+    except Exception as e:
+        click.echo(json.dumps({"error": str(e)}), err=True)
+        sys.exit(1)
+
+@conversations_group.command('update')
+@click.argument('conversation_id')
+@click.option('--data', required=True, help='JSON data for update')
+@click.pass_context
+def conversations_update(ctx, conversation_id, data):
+    """Update a conversation"""
+    client = _client(ctx)
+    if not client:
+        click.echo("Error: API Key is missing.", err=True)
+        sys.exit(1)
+
+    try:
+        payload = json.loads(data)
+        result = conversations.update_conversation(client, conversation_id, payload)
+        _echo_json(result)
+    except Exception as e:
+        click.echo(json.dumps({"error": str(e)}), err=True)
+        sys.exit(1)
+
+@conversations_group.command('delete')
+@click.argument('conversation_id')
+@click.pass_context
+def conversations_delete(ctx, conversation_id):
+    """Delete a conversation"""
+    client = _client(ctx)
+    if not client:
+        click.echo("Error: API Key is missing.", err=True)
+        sys.exit(1)
+
+    try:
+        result = conversations.delete_conversation(client, conversation_id)
+        _echo_json(result)
+    except Exception as e:
+        click.echo(json.dumps({"error": str(e)}), err=True)
+        sys.exit(1)
+
+@conversations_group.command('messages')
+@click.argument('conversation_id')
+@click.option('--limit', default=20, help='Limit number of messages')
+@click.option('--all', 'fetch_all', is_flag=True, help='Stream every message, one JSON message per line')
+@click.option('--type', 'message_type', default=None, help='Only messages of this type (with --all)')
+@click.pass_context
+def conversations_messages(ctx, conversation_id, limit, fetch_all, message_type):
+    """Get messages for a conversation"""
+    client = _client(ctx)
+    if not client:
+        click.echo("Error: API Key is missing.", err=True)
+        sys.exit(1)
+
+    try:
+        if fetch_all:
+            for message in conversations.iter_messages(client, conversation_id, message_type=message_type):
+                _echo_line(message)
+            return
+
+        result = conversations.get_messages(client, conversation_id, limit)
+        _echo_json(result)
+    except Exception as e:
+        click.echo(json.dumps({"error": str(e)}), err=True)
+        sys.exit(1)
@@ -0,0 +1,60 @@
+import asyncio
+import click
+import json
+import sys
+from ..cli import _client, _echo_line, _async_client
+from .. import fanout as fanout_ops
+from ..endpoints.aio import contacts, opportunities, conversations, calendars, workflows, objects, locations
+
+# report -> call(client, fields); item streams yield one output line per record
+REPORTS = {
+    "location": lambda client, fields: locations.get_location(client, client.location_id),
+    "contacts": lambda client, fields: contacts.iter_contacts(client, fields=fields),
+    "opportunities": lambda client, fields: opportunities.iter_opportunities(client, fields=fields),
+    "conversations": lambda client, fields: conversations.list_conversations(client, location_id=client.location_id, fields=fields),
+    "calendars": lambda client, fields: calendars.list_calendars(client, client.location_id),
+    "workflows": lambda client, fields: workflows.list_workflows(client, client.location_id),
+    "pipelines": lambda client, fields: opportunities.list_pipelines(client),
+    "schemas": lambda client, fields: objects.list_schemas(client, client.location_id),
+}
+
+@click.command('fanout')
+@click.argument('report', type=click.Choice(sorted(REPORTS)))
+@click.option('--location', 'location_ids', multiple=True, help='Location ID to include (repeatable; default: every location)')
+@click.option('--company-id', envvar='GHL_COMPANY_ID', default=None, help='Agency company ID (also GHL_COMPANY_ID)')
+@click.option('--app-id', envvar='GHL_APP_ID', default=None,
+              help='Only the locations where this OAuth app is installed (also GHL_APP_ID)')
+@click.option('--concurrency', default=fanout_ops.DEFAULT_CONCURRENCY, show_default=True, help='Locations in flight at once')
+@click.option('--location-tokens/--no-location-tokens', default=True, show_default=True,
+              help='Mint a location token per location, or reuse the agency key')
+@click.option('--fields', default=None, help='Comma-separated fields to keep (dot paths allowed)')
+@click.pass_context
+def fanout(ctx, report, location_ids, company_id, app_id, concurrency, location_tokens, fields):
+    """Run a report across many locations at once
+
+    Prints one JSON line per result, tagged with its locationId:
+    {"locationId": "...", "data": {...}}, or {"locationId": "...", "error": "..."}
+    for a location that failed. A summary goes to stderr.
+    """
+    client = _client(ctx)
+    if not client:
+        click.echo("Error: API Key is missing.", err=True)
+        sys.exit(1)
+
+    call = REPORTS[report]
+    try:
+        async def run():
+            summary = {"results": 0, "failed": 0}
+            async with _async_client(client) as agency:
+                results = fanout_ops.fan_out(agency, lambda location: call(location, fields), location_ids or None,
+                                             company_id, concurrency, location_tokens, app_id)
+                async for result in results:
+                    summary["failed" if "error" in result else "results"] += 1
+                    _echo_line(result)
+            return summary
+
+        summary = asyncio.run(run())
+        click.echo(json.dumps(summary), err=True)
+    except Exception as e:
+        click.echo(json.dumps({"error": str(e)}), err=True)
+        sys.exit(1)
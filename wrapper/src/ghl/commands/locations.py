@@ -0,0 +1,116 @@
+import click
+import json
+import sys
+from ..cli import _client, _echo_json, _echo_line
+from ..endpoints import locations
+
+@click.group()
+def locations_group():
+    """Location (Sub-account) management"""
+    pass
+
+@locations_group.command('list')
+@click.option('--limit', default=10, help='Limit number of results')
+@click.option('--skip', default=0, help='Skip number of results')
+@click.option('--email', default=None, help='Filter by email')
+@click.option('--company-id', default=None, help='Filter by company ID')
+@click.option('--all', 'fetch_all', is_flag=True, help='Fetch every page, one JSON location per line')
+@click.pass_context
+def locations_list(ctx, limit, skip, email, company_id, fetch_all):
+    """List locations"""
+    client = _client(ctx)
+    if not client:
+        click.echo("Error: API Key is missing.", err=True)
+        sys.exit(1)
+
+    try:
+        if fetch_all:
+            for location in locations.iter_locations(client, email=email, company_id=company_id):
+                _echo_line(location)
+            return
+
+        result = locations.list_locations(client, limit, skip, email, company_id)
+        _echo_json(result)
+    except Exception as e:
+        click.echo(json.dumps({"error": str(e)}), err=True)
+        sys.exit(1)
+
+@locations_group.command('get')
+@click.argument('location_id')
+@click.pass_context
+def locations_get(ctx, location_id):
+    """Get a location by ID"""
+    client = _client(ctx)
+    if not client:
+        click.echo("Error: API Key is missing.", err=True)
+        sys.exit(1)
+
+    try:
+        result = locations.get_location(client, location_id)
+        _echo_json(result)
+    except Exception as e:
+        click.echo(json.dumps({"error": str(e)}), err=True)
+        sys.exit(1)
+
+@locations_group.command('create')
+@click.option('--data', help='JSON data for creation')
+@click.option('--file', type=click.File('r'), help='JSON file for creation')
+@click.pass_context
+def locations_create(ctx, data, file):
+    """Create a location"""
+    client = _client(ctx)
+    if not client:
+        click.echo("Error: API Key is missing.", err=True)
+        sys.exit(1)
+
+    if data:
+        payload = json.loads(data)
+    elif file:
+        payload = json.load(file)
+    else:
+        click.echo("Error: Must provide --data or --file", err=True)
+        sys.exit(1)
+
+    try:
+        result = locations.create_location(client, payload)
+        _echo_json(result)
+    except Exception as e:
+        click.echo(json.dumps({"error": str(e)}), err=True)
+        sys.exit(1)
+
+@locations_group.command('update')
+@click.argument('location_id')
+@click.option('--data', required=True, help='JSON data for update')
+@click.pass_context
+def locations_update(ctx, location_id, data):
+    """Update a location"""
+    client = _client(ctx)
+    if not client:
+        click.echo("Error: API Key is missing.", err=True)
+        sys.exit(1)
+
+    try:
+        payload = json.loads(data)
+        result = locations.update_location(client, location_id, payload)
+        _echo_json(result)
+    except Exception as e:
+        click.echo(json.dumps({"error": str(e)}), err=True)
+        sys.exit(1)
+
+@locations_group.command('delete')
+@click.argument('location_id')
+@click.option('--delete-twilio-account', is_flag=True, help='Delete associated Twilio account')
+@click.pass_context
+def locations_delete(ctx, location_id, delete_twilio_account):
+    """Delete a location"""
+    client = _client(ctx)
+    if not client:
+        click.echo("Error: API Key is missing.", err=True)
+        sys.exit(1)
+
+    try:
+        result = locations.delete_location(client, location_id, delete_twilio_account)
+        _echo_json(result)
+    except Exception as e:
+        click.echo(json.dumps({"error": str(e)}), err=True)
+        sys.exit(1)
@@ -0,0 +1,192 @@
+import click
+import json
+import sys
+from ..cli import _client, _echo_json, _echo_line, _answer_locally, _many, _fetch_many
+from .. import export, bulk
+from ..projection import project_page
+from ..endpoints import objects
+from ..endpoints.aio import objects as aio_objects
+
+@click.group()
+def objects_group():
+    """Custom Object management"""
+    pass
+
+@objects_group.command('list-schemas')
+@click.pass_context
+def objects_list_schemas(ctx):
+    """List object schemas"""
+    client = _client(ctx)
+    if not client:
+        click.echo("Error: API Key is missing.", err=True)
+        sys.exit(1)
+
+    try:
+        result = objects.list_schemas(client)
+        _echo_json(result)
+    except Exception as e:
+        click.echo(json.dumps({"error": str(e)}), err=True)
+        sys.exit(1)
+
+@objects_group.command('get-schema')
+@click.argument('key')
+@click.pass_context
+def objects_get_schema(ctx, key):
+    """Get object schema by key"""
+    client = _client(ctx)
+    if not client:
+        click.echo("Error: API Key is missing.", err=True)
+        sys.exit(1)
+
+    try:
+        result = objects.get_schema(client, key)
+        _echo_json(result)
+    except Exception as e:
+        click.echo(json.dumps({"error": str(e)}), err=True)
+        sys.exit(1)
+
+@objects_group.command('list')
+@click.argument('schema_key')
+@click.option('--limit', default=20, help='Limit number of results')
+@click.option('--query', default=None, help='Search query')
+@click.option('--all', 'fetch_all', is_flag=True, help='Fetch every page, one JSON record per line')
+@click.option('--fields', default=None, help='Comma-separated fields (dotted paths allowed) to keep per record, e.g. id,properties.name')
+@click.option('--local', is_flag=True, help='Answer from the local mirror (see ghl sync)')
+@click.pass_context
+def objects_list_records(ctx, schema_key, limit, query, fetch_all, fields, local):
+    """List records for a schema"""
+    if local:
+        return _answer_locally(ctx, lambda mirror, location_id: project_page(
+            mirror.list_records(location_id, schema_key, limit, query), "records", fields))
+
+    client = _client(ctx)
+    if not client:
+        click.echo("Error: API Key is missing.", err=True)
+        sys.exit(1)
+
+    try:
+        if fetch_all:
+            for record in objects.iter_records(client, schema_key, query=query, fields=fields):
+                _echo_line(record)
+            return
+
+        result = objects.list_records(client, schema_key, limit, query, fields=fields)
+        _echo_json(result)
+    except Exception as e:
+        click.echo(json.dumps({"error": str(e)}), err=True)
+        sys.exit(1)
+
+@objects_group.command('get')
+@click.argument('schema_key')
+@click.argument('record_ids', nargs=-1, required=True)
+@click.option('--concurrency', default=bulk.DEFAULT_CONCURRENCY, show_default=True, help='Requests in flight when fetching several IDs')
+@click.pass_context
+def objects_get_record(ctx, schema_key, record_ids, concurrency):
+    """Get records by ID
+
+    With several IDs (or `-` to read them from stdin), prints one JSON record per
+    line as they arrive; IDs that were not found are listed on stderr.
+    """
+    if _many(record_ids):
+        return _fetch_many(ctx, record_ids, lambda client, ids: aio_objects.get_many_records(
+            client, schema_key, ids, concurrency))
+
+    record_id = record_ids[0]
+    client = _client(ctx)
+    if not client:
+        click.echo("Error: API Key is missing.", err=True)
+        sys.exit(1)
+
+    try:
+        result = objects.get_record(client, schema_key, record_id)
+        _echo_json(result)
+    except Exception as e:
+        click.echo(json.dumps({"error": str(e)}), err=True)
+        sys.exit(1)
+
+@objects_group.command('create')
+@click.argument('schema_key')
+@click.option('--data', help='JSON data for creation')
+@click.option('--file', type=click.File('r'), help='JSON file for creation')
+@click.pass_context
+def objects_create_record(ctx, schema_key, data, file):
+    """Create a record"""
+    client = _client(ctx)
+    if not client:
+        click.echo("Error: API Key is missing.", err=True)
+        sys.exit(1)
+
+    if data:
+        payload = json.loads(data)
+    elif file:
+        payload = json.load(file)
+    else:
+        click.echo("Error: Must provide --data or --file", err=True)
+        sys.exit(1)
+
+    try:
+        result = objects.create_record(client, schema_key, payload)
+        _echo_json(result)
+    except Exception as e:
+        click.echo(json.dumps({"error": str(e)}), err=True)
+        sys.exit(1)
+
+@objects_group.command('update')
+@click.argument('schema_key')
+@click.argument('record_id')
+@click.option('--data', required=True, help='JSON data for update')
+@click.pass_context
+def objects_update_record(ctx, schema_key, record_id, data):
+    """Update a record"""
+    client = _client(ctx)
+    if not client:
+        click.echo("Error: API Key is missing.", err=True)
+        sys.exit(1)
+
+    try:
+        payload = json.loads(data)
+        result = objects.update_record(client, schema_key, record_id, payload)
+        _echo_json(result)
+    except Exception as e:
+        click.echo(json.dumps({"error": str(e)}), err=True)
+        sys.exit(1)
+
+@objects_group.command('delete')
+@click.argument('schema_key')
+@click.argument('record_id')
+@click.pass_context
+def objects_delete_record(ctx, schema_key, record_id):
+    """Delete a record"""
+    client = _client(ctx)
+    if not client:
+        click.echo("Error: API Key is missing.", err=True)
+        sys.exit(1)
+
+    try:
+        result = objects.delete_record(client, schema_key, record_id)
+        _echo_json(result)
+    except Exception as e:
+        click.echo(json.dumps({"error": str(e)}), err=True)
+        sys.exit(1)
+
+@objects_group.command('export')
+@click.argument('schema_key')
+@click.option('--out', required=True, type=click.Path(dir_okay=False), help='File to write')
+@click.option('--format', 'fmt', type=click.Choice(export.FORMATS), default='jsonl', show_default=True, help='Output format (parquet needs the [parquet] extra)')
+@click.option('--fields', default=None, help='Comma-separated fields to include (dotted paths allowed, e.g. customFields[id=abc].value)')
+@click.option('--query', default=None, help='Search query')
+@click.option('--restart', is_flag=True, help='Ignore a saved cursor and export from the beginning')
+@click.pass_context
+def objects_export(ctx, schema_key, out, fmt, fields, query, restart):
+    """Stream every record of a schema to a file, resuming an interrupted export"""
+    client = _client(ctx)
+    if not client:
+        click.echo("Error: API Key is missing.", err=True)
+        sys.exit(1)
+
+    try:
+        result = export.export_records(client, schema_key, out, fmt, fields=fields, query=query, restart=restart)
+        _echo_json(result)
+    except Exception as e:
+        click.echo(json.dumps({"error": str(e)}), err=True)
+        sys.exit(1)
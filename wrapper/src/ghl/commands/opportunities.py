@@ -0,0 +1,201 @@
+import asyncio
+import click
+import json
+import sys
+from ..cli import _client, _echo_json, _echo_line, _answer_locally, _many, _fetch_many, _async_client, _join_field
+from .. import export, bulk, enrich
+from ..projection import project_page
+from ..endpoints import opportunities
+from ..endpoints.aio import opportunities as aio_opportunities
+
+@click.group()
+def opportunities_group():
+    """Opportunity management"""
+    pass
+
+@opportunities_group.command('list')
+@click.option('--limit', default=20, help='Limit number of results')
+@click.option('--query', default=None, help='Search query')
+@click.option('--pipeline-id', default=None, help='Filter by pipeline ID')
+@click.option('--status', default=None, help='Filter by status (open, won, lost, abandoned, all)')
+@click.option('--all', 'fetch_all', is_flag=True, help='Follow the cursor through every page, one JSON opportunity per line')
+@click.option('--fields', default=None, help='Comma-separated fields (dotted paths allowed) to keep per opportunity')
+@click.option('--local', is_flag=True, help='Answer from the local mirror (see ghl sync)')
+@click.option('--with-contact', is_flag=True, help="Join each opportunity with its contact (one request per distinct contact)")
+@click.option('--contact-fields', default=None, help='Contact fields to join (default: name, email, phone, tags and a few more)')
+@click.pass_context
+def opportunities_list(ctx, limit, query, pipeline_id, status, fetch_all, fields, local, with_contact, contact_fields):
+    """List opportunities"""
+    if local:
+        if with_contact:
+            raise click.UsageError("--with-contact reads contacts from the API and cannot be combined with --local")
+        return _answer_locally(ctx, lambda mirror, location_id: project_page(
+            mirror.list_opportunities(location_id, limit, query, pipeline_id, status), "opportunities", fields))
+
+    client = _client(ctx)
+    if not client:
+        click.echo("Error: API Key is missing.", err=True)
+        sys.exit(1)
+
+    try:
+        if with_contact:
+            return _list_with_contacts(client, limit, query, pipeline_id, status, fetch_all,
+                                       _join_field(fields, "contactId"), contact_fields)
+
+        if fetch_all:
+            for opportunity in opportunities.iter_opportunities(client, query=query, pipeline_id=pipeline_id, status=status, fields=fields):
+                _echo_line(opportunity)
+            return
+
+        result = opportunities.list_opportunities(client, limit, query, pipeline_id, status, fields=fields)
+        _echo_json(result)
+    except Exception as e:
+        click.echo(json.dumps({"error": str(e)}), err=True)
+        sys.exit(1)
+
+def _list_with_contacts(client, limit, query, pipeline_id, status, fetch_all, fields, contact_fields):
+    async def run():
+        async with _async_client(client) as async_client:
+            if fetch_all:
+                stream = aio_opportunities.iter_opportunities(async_client, query=query, pipeline_id=pipeline_id,
+                                                              status=status, fields=fields)
+                async for opportunity in enrich.enrich(async_client, stream, fields=contact_fields):
+                    _echo_line(opportunity)
+                return
+            page = await aio_opportunities.list_opportunities(async_client, limit, query, pipeline_id, status, fields=fields)
+            _echo_json(await enrich.enrich_page(async_client, page, "opportunities", fields=contact_fields))
+
+    asyncio.run(run())
+
+@opportunities_group.command('get')
+@click.argument('opportunity_ids', nargs=-1, required=True)
+@click.option('--concurrency', default=bulk.DEFAULT_CONCURRENCY, show_default=True, help='Requests in flight when fetching several IDs')
+@click.pass_context
+def opportunities_get(ctx, opportunity_ids, concurrency):
+    """Get opportunities by ID
+
+    With several IDs (or `-` to read them from stdin), prints one JSON opportunity per
+    line as they arrive; IDs that were not found are listed on stderr.
+    """
+    if _many(opportunity_ids):
+        return _fetch_many(ctx, opportunity_ids, lambda client, ids: aio_opportunities.get_many_opportunities(
+            client, ids, concurrency))
+
+    opportunity_id = opportunity_ids[0]
+    client = _client(ctx)
+    if not client:
+        click.echo("Error: API Key is missing.", err=True)
+        sys.exit(1)
+
+    try:
+        result = opportunities.get_opportunity(client, opportunity_id)
+        _echo_json(result)
+    except Exception as e:
+        click.echo(json.dumps({"error": str(e)}), err=True)
+        sys.exit(1)
+
+@opportunities_group.command('create')
+@click.option('--data', help='JSON data for creation')
+@click.option('--file', type=click.File('r'), help='JSON file for creation')
+@click.pass_context
+def opportunities_create(ctx, data, file):
+    """Create an opportunity"""
+    client = _client(ctx)
+    if not client:
+        click.echo("Error: API Key is missing.", err=True)
+        sys.exit(1)
+
+    if data:
+        payload = json.loads(data)
+    elif file:
+        payload = json.load(file)
+    else:
+        click.echo("Error: Must provide --data or --file", err=True)
+        sys.exit(1)
+
+    try:
+        result = opportunities.create_opportunity(client, payload)
+        _echo_json(result)
+    except Exception as e:
+        click.echo(json.dumps({"error": str(e)}), err=True)
+        sys.exit(1)
+
+@opportunities_group.command('update')
+@click.argument('opportunity_id')
+@click.option('--data', required=True, help='JSON data for update')
+@click.pass_context
+def opportunities_update(ctx, opportunity_id, data):
+    """Update an opportunity"""
+    client = _client(ctx)
+    if not client:
+        click.echo("Error: API Key is missing.", err=True)
+        sys.exit(1)
+
+    try:
+        payload = json.loads(data)
+        result = opportunities.update_opportunity(client, opportunity_id, payload)
+        _echo_json(result)
+    except Exception as e:
+        click.echo(json.dumps({"error": str(e)}), err=True)
+        sys.exit(1)
+
+@opportunities_group.command('delete')
+@click.argument('opportunity_id')
+@click.pass_context
+def opportunities_delete(ctx, opportunity_id):
+    """Delete an opportunity"""
+    client = _client(ctx)
+    if not client:
+        click.echo("Error: API Key is missing.", err=True)
+        sys.exit(1)
+
+    try:
+        result = opportunities.delete_opportunity(client, opportunity_id)
+        _echo_json(result)
+    except Exception as e:
+        click.echo(json.dumps({"error": str(e)}), err=True)
+        sys.exit(1)
+
+@opportunities_group.command('pipelines')
+@click.option('--local', is_flag=True, help='Answer from the local mirror (see ghl sync)')
+@click.pass_context
+def opportunities_pipelines(ctx, local):
+    """List pipelines"""
+    if local:
+        return _answer_locally(ctx, lambda mirror, location_id: mirror.list_pipelines(location_id))
+
+    client = _client(ctx)
+    if not client:
+        click.echo("Error: API Key is missing.", err=True)
+        sys.exit(1)
+
+    try:
+        result = opportunities.list_pipelines(client)
+        _echo_json(result)
+    except Exception as e:
+        click.echo(json.dumps({"error": str(e)}), err=True)
+        sys.exit(1)
+
+@opportunities_group.command('export')
+@click.option('--out', required=True, type=click.Path(dir_okay=False), help='File to write')
+@click.option('--format', 'fmt', type=click.Choice(export.FORMATS), default='jsonl', show_default=True, help='Output format (parquet needs the [parquet] extra)')
+@click.option('--fields', default=None, help='Comma-separated fields to include (dotted paths allowed, e.g. customFields[id=abc].value)')
+@click.option('--query', default=None, help='Search query')
+@click.option('--pipeline-id', default=None, help='Filter by pipeline ID')
+@click.option('--status', default=None, help='Filter by status (open, won, lost, abandoned, all)')
+@click.option('--restart', is_flag=True, help='Ignore a saved cursor and export from the beginning')
+@click.pass_context
+def opportunities_export(ctx, out, fmt, fields, query, pipeline_id, status, restart):
+    """Stream every opportunity to a file, resuming an interrupted export"""
+    client = _client(ctx)
+    if not client:
+        click.echo("Error: API Key is missing.", err=True)
+        sys.exit(1)
+
+    try:
+        result = export.export_opportunities(client, out, fmt, fields=fields, query=query, pipeline_id=pipeline_id,
+                                             status=status, restart=restart)
+        _echo_json(result)
+    except Exception as e:
+        click.echo(json.dumps({"error": str(e)}), err=True)
+        sys.exit(1)
@@ -0,0 +1,31 @@
+import click
+import json
+import sys
+from pathlib import Path
+from ..cli import cli
+from .. import daemon
+
+@click.command('serve')
+@click.option('--socket', 'socket_file', type=click.Path(dir_okay=False), default=None,
+              help='Unix socket to listen on (default: ~/.config/ghl/ghl.sock, or GHL_SOCKET)')
+@click.option('--stop', is_flag=True, help='Stop the running daemon')
+def serve(socket_file, stop):
+    """Run a warm daemon that ghl commands forward to
+
+    While it runs, every `ghl` invocation is sent over the socket and runs in this
+    process, reusing its clients, connections, caches and rate-limit state. Set
+    GHL_NO_DAEMON=1 to bypass it.
+    """
+    path = Path(socket_file) if socket_file else daemon.socket_path()
+    try:
+        if stop:
+            if not daemon.stop(path):
+                click.echo(json.dumps({"error": f"ghl serve is not running on {path}"}), err=True)
+                sys.exit(1)
+            return
+        server = daemon.Daemon(path, cli)
+        click.echo(f"ghl serve listening on {path}", err=True)
+        server.serve_until_stopped()
+    except Exception as e:
+        click.echo(json.dumps({"error": str(e)}), err=True)
+        sys.exit(1)
@@ -0,0 +1,39 @@
+import click
+import json
+import sys
+from ..cli import _client, _echo_json, _answer_locally, _open_mirror
+from ..mirror import RESOURCES
+
+@click.command('sync')
+@click.option('--full', is_flag=True, help='Re-read everything, picking up deletions and opportunity edits')
+@click.option('--only', default=None, help=f'Comma-separated resources to sync ({", ".join(RESOURCES)})')
+@click.option('--object', 'schema_keys', multiple=True, help='Custom object schema key to mirror (default: every custom object)')
+@click.option('--status', 'show_status', is_flag=True, help='Show what the mirror holds instead of syncing')
+@click.option('--load', 'load_file', type=click.Path(exists=True, dir_okay=False), default=None,
+              help='Load contacts from a JSONL export (ghl contacts export) instead of the API')
+@click.pass_context
+def sync(ctx, full, only, schema_keys, show_status, load_file):
+    """Update the local mirror used by --local reads"""
+    if show_status:
+        return _answer_locally(ctx, lambda mirror, location_id: mirror.status(location_id))
+    if load_file:
+        def load(mirror, location_id):
+            with open(load_file, 'r') as f:
+                return mirror.load_contacts(location_id, (json.loads(line) for line in f if line.strip()))
+        return _answer_locally(ctx, load)
+
+    client = _client(ctx)
+    if not client:
+        click.echo("Error: API Key is missing.", err=True)
+        sys.exit(1)
+
+    try:
+        mirror = _open_mirror()
+        try:
+            result = mirror.sync(client, only.split(",") if only else None, full, list(schema_keys) or None)
+        finally:
+            mirror.close()
+        _echo_json(result)
+    except Exception as e:
+        click.echo(json.dumps({"error": str(e)}), err=True)
+        sys.exit(1)
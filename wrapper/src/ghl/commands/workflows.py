@@ -0,0 +1,26 @@
+import click
+import json
+import sys
+from ..cli import _client, _echo_json
+from ..endpoints import workflows
+
+@click.group()
+def workflows_group():
+    """Workflow management"""
+    pass
+
+@workflows_group.command('list')
+@click.pass_context
+def workflows_list(ctx):
+    """List workflows"""
+    client = _client(ctx)
+    if not client:
+        click.echo("Error: API Key is missing.", err=True)
+        sys.exit(1)
+
+    try:
+        result = workflows.list_workflows(client)
+        _echo_json(result)
+    except Exception as e:
+        click.echo(json.dumps({"error": str(e)}), err=True)
+        sys.exit(1)
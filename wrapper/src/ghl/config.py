@@ -1,10 +1,21 @@
 import os
 import json
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Optional, Dict, Any
 
 CONFIG_DIR = Path.home() / ".config" / "ghl"
 CONFIG_FILE = CONFIG_DIR / "config.json"
+CACHE_FILE = CONFIG_DIR / "cache.db"
+TOKENS_FILE = CONFIG_DIR / "tokens.db"
+MIRROR_FILE = CONFIG_DIR / "mirror.db"
+# Unix socket of `ghl serve` (GHL_SOCKET overrides it)
+SOCKET_FILE = CONFIG_DIR / "ghl.sock"
+
+def _env_flag(name: str) -> Optional[bool]:
+    value = os.environ.get(name)
+    if value is None or value == "":
+        return None
+    return value.strip().lower() in ("1", "true", "yes", "on")
 
 def get_config_from_file() -> Dict[str, str]:
     if not CONFIG_FILE.exists():
@@ -15,14 +26,33 @@ def get_config_from_file() -> Dict[str, str]:
     except Exception:
         return {}
 
-def get_config(api_key: Optional[str] = None, location_id: Optional[str] = None) -> Dict[str, Optional[str]]:
+def get_config(api_key: Optional[str] = None, location_id: Optional[str] = None, cache: Optional[bool] = None) -> Dict[str, Any]:
     file_config = get_config_from_file()
 
     # Priority: args > env > file
     final_api_key = api_key or os.environ.get("GHL_API_KEY") or file_config.get("api_key")
     final_location_id = location_id or os.environ.get("GHL_LOCATION_ID") or file_config.get("location_id")
 
+    # OAuth credentials for token refresh; env > file
+    oauth = {
+        name: os.environ.get(f"GHL_{name.upper()}") or file_config.get(name)
+        for name in ("client_id", "client_secret", "refresh_token")
+    }
+
+    final_cache = cache
+    if final_cache is None:
+        final_cache = _env_flag("GHL_CACHE")
+    if final_cache is None:
+        final_cache = bool(file_config.get("cache", False))
+
+    cache_records = _env_flag("GHL_CACHE_RECORDS")
+    if cache_records is None:
+        cache_records = bool(file_config.get("cache_records", False))
+
     return {
         "api_key": final_api_key,
-        "location_id": final_location_id
+        "location_id": final_location_id,
+        "cache": final_cache,
+        "cache_records": cache_records,
+        **oauth
     }
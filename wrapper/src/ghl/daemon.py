@@ -0,0 +1,248 @@
+import io
+import json
+import os
+import socket
+import socketserver
+import struct
+import sys
+import threading
+import traceback
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Callable, BinaryIO, Iterator
+from .config import SOCKET_FILE
+
+# Reply frames: channel byte + payload length, then the payload. The last frame is
+# _EXIT with the exit status as its payload.
+_HEADER = struct.Struct("!BI")
+_EXIT, _STDOUT, _STDERR = 0, 1, 2
+
+# Commands that always run in the calling process (batch reads stdin by default)
+LOCAL_COMMANDS = ("serve", "batch")
+
+# Warm clients the daemon keeps, one per distinct configuration
+MAX_CLIENTS = 16
+
+def socket_path() -> Path:
+    return Path(os.environ.get("GHL_SOCKET") or SOCKET_FILE)
+
+def _forwardable(argv: List[str]) -> bool:
+    if os.environ.get("GHL_NO_DAEMON"):
+        return False
+    # `-` reads this process's stdin, which the daemon cannot see
+    return not any(arg == "-" or arg in LOCAL_COMMANDS for arg in argv)
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    data = bytearray()
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError("ghl serve closed the connection")
+        data += chunk
+    return bytes(data)
+
+def _connect(path: Path) -> Optional[socket.socket]:
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(path))
+    except (FileNotFoundError, ConnectionRefusedError):
+        # Not running, or a socket left behind by a daemon that died
+        sock.close()
+        return None
+    return sock
+
+def _request(sock: socket.socket, request: Dict[str, Any], stdout: BinaryIO, stderr: BinaryIO) -> int:
+    sock.sendall(json.dumps(request).encode() + b"\n")
+    while True:
+        channel, size = _HEADER.unpack(_recv_exact(sock, _HEADER.size))
+        payload = _recv_exact(sock, size)
+        if channel == _EXIT:
+            return int(payload)
+        stream = stdout if channel == _STDOUT else stderr
+        stream.write(payload)
+        stream.flush()
+
+def forward(argv: List[str], path: Optional[Path] = None, stdout: Optional[BinaryIO] = None,
+            stderr: Optional[BinaryIO] = None) -> Optional[int]:
+    """Runs a ghl command line in the `ghl serve` daemon, copying its output here.
+
+    Returns the command's exit status, or None when no daemon is listening (or the
+    command has to run locally) so the caller runs it itself. The caller's GHL_*
+    environment and working directory go with the request.
+    """
+    if not _forwardable(argv):
+        return None
+    sock = _connect(path or socket_path())
+    if sock is None:
+        return None
+
+    request = {
+        "argv": argv,
+        "env": {k: v for k, v in os.environ.items() if k.startswith("GHL_")},
+        "cwd": os.getcwd(),
+    }
+    try:
+        return _request(sock, request, stdout or sys.stdout.buffer, stderr or sys.stderr.buffer)
+    except ConnectionError as e:
+        # The command may already have had effects, so it is not re-run locally
+        (stderr or sys.stderr.buffer).write(json.dumps({"error": str(e)}).encode() + b"\n")
+        return 1
+    finally:
+        sock.close()
+
+def stop(path: Optional[Path] = None) -> bool:
+    """Asks a running daemon to exit; False if none is listening."""
+    sock = _connect(path or socket_path())
+    if sock is None:
+        return False
+    try:
+        _request(sock, {"stop": True}, io.BytesIO(), io.BytesIO())
+    finally:
+        sock.close()
+    return True
+
+class ClientPool:
+    """Warm clients keyed by their configuration, least recently used evicted (and closed) first."""
+
+    def __init__(self, max_clients: int = MAX_CLIENTS):
+        self.max_clients = max_clients
+        self._clients: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, config: Dict[str, Any], build: Callable[[], Any]) -> Any:
+        key = json.dumps(config, sort_keys=True, default=str)
+        with self._lock:
+            if key in self._clients:
+                self._clients.move_to_end(key)
+                return self._clients[key]
+            client = self._clients[key] = build()
+            while len(self._clients) > self.max_clients:
+                _, evicted = self._clients.popitem(last=False)
+                if evicted is not None:
+                    evicted.close()
+            return client
+
+    def close(self) -> None:
+        with self._lock:
+            for client in self._clients.values():
+                if client is not None:
+                    client.close()
+            self._clients.clear()
+
+class _FrameWriter(io.RawIOBase):
+    def __init__(self, sock: socket.socket, channel: int):
+        self._sock = sock
+        self._channel = channel
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._sock.sendall(_HEADER.pack(self._channel, len(data)) + bytes(data))
+        return len(data)
+
+def _text_stream(sock: socket.socket, channel: int) -> io.TextIOWrapper:
+    # Line buffered, so --all streams reach the caller line by line
+    return io.TextIOWrapper(io.BufferedWriter(_FrameWriter(sock, channel)), encoding="utf-8", line_buffering=True)
+
+@contextmanager
+def _caller_process(env: Dict[str, str], cwd: Optional[str], stdout: io.TextIOWrapper,
+                    stderr: io.TextIOWrapper) -> Iterator[None]:
+    """Makes this process look like the caller's (streams, GHL_* environment, working
+    directory) for the length of one command."""
+    saved_streams = sys.stdin, sys.stdout, sys.stderr
+    saved_env = {k: v for k, v in os.environ.items() if k.startswith("GHL_")}
+    saved_cwd = os.getcwd()
+    for key in saved_env:
+        del os.environ[key]
+    os.environ.update(env)
+    sys.stdin, sys.stdout, sys.stderr = io.TextIOWrapper(io.BytesIO(), encoding="utf-8"), stdout, stderr
+    try:
+        if cwd:
+            os.chdir(cwd)
+        yield
+    finally:
+        sys.stdin, sys.stdout, sys.stderr = saved_streams
+        for key in [k for k in os.environ if k.startswith("GHL_")]:
+            del os.environ[key]
+        os.environ.update(saved_env)
+        os.chdir(saved_cwd)
+
+class Daemon(socketserver.UnixStreamServer):
+    """Serves forwarded command lines, one at a time, from a warm process.
+
+    Clients built for a command stay in a ClientPool (with their connections,
+    response cache and tokens) and share one RateLimiter, so later commands skip
+    the imports, the DNS lookup and the TLS handshake.
+    """
+
+    def __init__(self, path: Path, cli: Any, max_clients: int = MAX_CLIENTS):
+        # Imported here: every `ghl` run imports this module to call forward()
+        from .ratelimit import RateLimiter
+        self.path = Path(path)
+        self.cli = cli
+        self.pool = ClientPool(max_clients)
+        self.rate_limiter = RateLimiter()
+        self._lock = threading.Lock()
+
+        running = _connect(self.path)
+        if running is not None:
+            running.close()
+            raise RuntimeError(f"ghl serve is already listening on {self.path}")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.path.exists():
+            self.path.unlink()
+        previous = os.umask(0o077)  # only this user may connect
+        try:
+            super().__init__(str(self.path), _Handler)
+        finally:
+            os.umask(previous)
+
+    def run(self, request: Dict[str, Any], sock: socket.socket) -> int:
+        stdout, stderr = _text_stream(sock, _STDOUT), _text_stream(sock, _STDERR)
+        obj = {"pool": self.pool, "rate_limiter": self.rate_limiter}
+        with self._lock, _caller_process(request.get("env", {}), request.get("cwd"), stdout, stderr):
+            try:
+                self.cli.main(args=list(request["argv"]), prog_name="ghl", obj=obj)
+                code = 0
+            except SystemExit as e:
+                code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+            except Exception:
+                traceback.print_exc()
+                code = 1
+            stdout.flush()
+            stderr.flush()
+        return code
+
+    def serve_until_stopped(self) -> None:
+        """Serves in the foreground until stop() or Ctrl-C, then removes the socket."""
+        try:
+            self.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.server_close()
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.pool.close()
+        if self.path.exists():
+            self.path.unlink()
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        request = json.loads(self.rfile.readline() or b"{}")
+        if request.get("stop"):
+            # shutdown() waits for serve_forever, which is running this handler
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+            code = 0
+        elif "argv" in request:
+            try:
+                code = self.server.run(request, self.connection)
+            except OSError:
+                # The caller went away (e.g. `| head`)
+                return
+        else:
+            code = 2
+        self.connection.sendall(_HEADER.pack(_EXIT, len(str(code))) + str(code).encode())
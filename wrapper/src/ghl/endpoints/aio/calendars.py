@@ -0,0 +1,74 @@
+from typing import Optional, Dict, Any
+from ...client import AsyncGHLClient
+
+async def list_calendars(client: AsyncGHLClient, location_id: Optional[str] = None, group_id: Optional[str] = None) -> Dict[str, Any]:
+    params = {}
+    if location_id:
+        params["locationId"] = location_id
+    elif client.location_id:
+        params["locationId"] = client.location_id
+    if group_id:
+        params["groupId"] = group_id
+
+    response = await client.get("/calendars/", params=params)
+    response.raise_for_status()
+    return response.json()
+
+async def get_calendar(client: AsyncGHLClient, calendar_id: str) -> Dict[str, Any]:
+    response = await client.get(f"/calendars/{calendar_id}")
+    response.raise_for_status()
+    return response.json()
+
+async def create_calendar(client: AsyncGHLClient, data: Dict[str, Any]) -> Dict[str, Any]:
+    response = await client.post("/calendars/", json=data)
+    response.raise_for_status()
+    return response.json()
+
+async def update_calendar(client: AsyncGHLClient, calendar_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    response = await client.put(f"/calendars/{calendar_id}", json=data)
+    response.raise_for_status()
+    return response.json()
+
+async def delete_calendar(client: AsyncGHLClient, calendar_id: str) -> Dict[str, Any]:
+    response = await client.delete(f"/calendars/{calendar_id}")
+    response.raise_for_status()
+    return response.json()
+
+async def list_events(client: AsyncGHLClient, start_time: str, end_time: str, calendar_id: Optional[str] = None, group_id: Optional[str] = None, user_id: Optional[str] = None) -> Dict[str, Any]:
+    params = {
+        "startTime": start_time,
+        "endTime": end_time
+    }
+    if client.location_id:
+        params["locationId"] = client.location_id
+
+    if calendar_id:
+        params["calendarId"] = calendar_id
+    if group_id:
+        params["groupId"] = group_id
+    if user_id:
+        params["userId"] = user_id
+
+    response = await client.get("/calendars/events", params=params)
+    response.raise_for_status()
+    return response.json()
+
+async def get_event(client: AsyncGHLClient, event_id: str) -> Dict[str, Any]:
+    response = await client.get(f"/calendars/events/appointments/{event_id}")
+    response.raise_for_status()
+    return response.json()
+
+async def create_event(client: AsyncGHLClient, data: Dict[str, Any]) -> Dict[str, Any]:
+    response = await client.post("/calendars/events/appointments", json=data)
+    response.raise_for_status()
+    return response.json()
+
+async def update_event(client: AsyncGHLClient, event_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    response = await client.put(f"/calendars/events/appointments/{event_id}", json=data)
+    response.raise_for_status()
+    return response.json()
+
+async def delete_event(client: AsyncGHLClient, event_id: str) -> Dict[str, Any]:
+    response = await client.delete(f"/calendars/events/{event_id}")
+    response.raise_for_status()
+    return response.json()
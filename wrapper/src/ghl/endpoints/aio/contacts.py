@@ -0,0 +1,109 @@
+from typing import Optional, Dict, Any, List, Iterable, AsyncIterator
+from ...client import AsyncGHLClient
+from ..contacts import _filter_fields, _page_params, _search_body, _next_search_after, MAX_PAGE_SIZE, SEARCH_PAGE_SIZE
+from ...pagination import next_cursor, aprefetch, DEFAULT_PREFETCH
+from ...bulk import fetch_many, DEFAULT_CONCURRENCY
+
+async def list_contacts(client: AsyncGHLClient, limit: int = 20, query: Optional[str] = None, fields: Optional[str] = None, verbose: int = 0) -> Dict[str, Any]:
+    params = {"limit": limit}
+    if query:
+        params["query"] = query
+
+    response = await client.get("/contacts/", params=params)
+    response.raise_for_status()
+    data = response.json()
+
+    contacts = data.get("contacts", [])
+    filtered_contacts = _filter_fields(contacts, fields, verbose)
+
+    return {"contacts": filtered_contacts, "meta": data.get("meta", {})}
+
+async def iter_contact_pages(client: AsyncGHLClient, page_size: int = MAX_PAGE_SIZE, query: Optional[str] = None,
+                             start_after: Optional[int] = None, start_after_id: Optional[str] = None) -> AsyncIterator[Dict[str, Any]]:
+    params = _page_params(client, page_size, query)
+    cursor = (start_after, start_after_id) if start_after_id else None
+
+    while True:
+        if cursor:
+            params["startAfter"], params["startAfterId"] = cursor
+
+        response = await client.get("/contacts/", params=dict(params))
+        response.raise_for_status()
+        data = response.json()
+        yield data
+
+        cursor = next_cursor(data.get("contacts", []), data.get("meta"), page_size, cursor)
+        if cursor is None:
+            return
+
+async def iter_contacts(client: AsyncGHLClient, page_size: int = MAX_PAGE_SIZE, query: Optional[str] = None,
+                        fields: Optional[str] = None, verbose: int = 0, prefetch_depth: int = DEFAULT_PREFETCH) -> AsyncIterator[Dict[str, Any]]:
+    async for page in aprefetch(iter_contact_pages(client, page_size, query), prefetch_depth):
+        for contact in _filter_fields(page.get("contacts", []), fields, verbose):
+            yield contact
+
+async def get_contact(client: AsyncGHLClient, contact_id: str, fields: Optional[str] = None, verbose: int = 0) -> Dict[str, Any]:
+    response = await client.get(f"/contacts/{contact_id}")
+    response.raise_for_status()
+    data = response.json()
+
+    contact = data.get("contact", {})
+    return _filter_fields(contact, fields, verbose)
+
+async def get_many_contacts(client: AsyncGHLClient, contact_ids: Iterable[str], fields: Optional[str] = None, verbose: int = 0,
+                            concurrency: int = DEFAULT_CONCURRENCY) -> AsyncIterator[Dict[str, Any]]:
+    """get_contact for each distinct ID, concurrently; yields bulk.fetch_many results as they complete."""
+    async for result in fetch_many(lambda contact_id: get_contact(client, contact_id, fields, verbose), contact_ids, concurrency):
+        yield result
+
+async def create_contact(client: AsyncGHLClient, data: Dict[str, Any]) -> Dict[str, Any]:
+    response = await client.post("/contacts/", json=data)
+    response.raise_for_status()
+    return response.json()
+
+async def upsert_contact(client: AsyncGHLClient, data: Dict[str, Any]) -> Dict[str, Any]:
+    response = await client.post("/contacts/upsert", json=data)
+    response.raise_for_status()
+    return response.json()
+
+async def update_contact(client: AsyncGHLClient, contact_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    response = await client.put(f"/contacts/{contact_id}", json=data)
+    response.raise_for_status()
+    return response.json()
+
+async def delete_contact(client: AsyncGHLClient, contact_id: str) -> Dict[str, Any]:
+    response = await client.delete(f"/contacts/{contact_id}")
+    response.raise_for_status()
+    return response.json()
+
+async def search_contacts(client: AsyncGHLClient, query: Optional[str] = None, fields: Optional[str] = None, verbose: int = 0,
+                          filters: Optional[List[Dict[str, Any]]] = None, sort: Optional[List[Dict[str, str]]] = None,
+                          limit: int = 20) -> Dict[str, Any]:
+    response = await client.post("/contacts/search", json=_search_body(client, query, filters, sort, limit))
+    response.raise_for_status()
+    data = response.json()
+
+    return {"contacts": _filter_fields(data.get("contacts", []), fields, verbose), "total": data.get("total")}
+
+async def iter_search_pages(client: AsyncGHLClient, query: Optional[str] = None, filters: Optional[List[Dict[str, Any]]] = None,
+                            sort: Optional[List[Dict[str, str]]] = None, page_size: int = SEARCH_PAGE_SIZE) -> AsyncIterator[Dict[str, Any]]:
+    body = _search_body(client, query, filters, sort, page_size)
+
+    while True:
+        response = await client.post("/contacts/search", json=dict(body))
+        response.raise_for_status()
+        data = response.json()
+        yield data
+
+        search_after = _next_search_after(data.get("contacts", []), page_size, body.get("searchAfter"))
+        if search_after is None:
+            return
+        body.pop("page", None)
+        body["searchAfter"] = search_after
+
+async def iter_search(client: AsyncGHLClient, query: Optional[str] = None, filters: Optional[List[Dict[str, Any]]] = None,
+                      sort: Optional[List[Dict[str, str]]] = None, fields: Optional[str] = None, verbose: int = 0,
+                      page_size: int = SEARCH_PAGE_SIZE, prefetch_depth: int = DEFAULT_PREFETCH) -> AsyncIterator[Dict[str, Any]]:
+    async for page in aprefetch(iter_search_pages(client, query, filters, sort, page_size), prefetch_depth):
+        for contact in _filter_fields(page.get("contacts", []), fields, verbose):
+            yield contact
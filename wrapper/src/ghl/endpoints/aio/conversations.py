@@ -0,0 +1,67 @@
+from typing import Optional, Dict, Any, Iterable, AsyncIterator
+from ...client import AsyncGHLClient
+from ...bulk import fetch_many, DEFAULT_CONCURRENCY
+from ...projection import project_page
+from ..conversations import MESSAGES_PAGE_SIZE, _messages_params, _next_message_id
+
+async def list_conversations(client: AsyncGHLClient, limit: int = 20, query: Optional[str] = None, status: Optional[str] = None, location_id: Optional[str] = None,
+                             fields: Optional[str] = None) -> Dict[str, Any]:
+    params = {"limit": limit}
+    if query:
+        params["query"] = query
+    if status:
+        params["status"] = status
+    if location_id:
+        params["locationId"] = location_id
+    elif client.location_id:
+        params["locationId"] = client.location_id
+
+    response = await client.get("/conversations/search", params=params)
+    response.raise_for_status()
+    return project_page(response.json(), "conversations", fields)
+
+async def get_conversation(client: AsyncGHLClient, conversation_id: str) -> Dict[str, Any]:
+    response = await client.get(f"/conversations/{conversation_id}")
+    response.raise_for_status()
+    return response.json()
+
+async def get_many_conversations(client: AsyncGHLClient, conversation_ids: Iterable[str],
+                                 concurrency: int = DEFAULT_CONCURRENCY) -> AsyncIterator[Dict[str, Any]]:
+    """get_conversation for each distinct ID, concurrently; yields bulk.fetch_many results as they complete."""
+    async for result in fetch_many(lambda conversation_id: get_conversation(client, conversation_id), conversation_ids, concurrency):
+        yield result
+
+async def create_conversation(client: AsyncGHLClient, data: Dict[str, Any]) -> Dict[str, Any]:
+    response = await client.post("/conversations/", json=data)
+    response.raise_for_status()
+    return response.json()
+
+async def update_conversation(client: AsyncGHLClient, conversation_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    response = await client.put(f"/conversations/{conversation_id}", json=data)
+    response.raise_for_status()
+    return response.json()
+
+async def delete_conversation(client: AsyncGHLClient, conversation_id: str) -> Dict[str, Any]:
+    response = await client.delete(f"/conversations/{conversation_id}")
+    response.raise_for_status()
+    return response.json()
+
+async def get_messages(client: AsyncGHLClient, conversation_id: str, limit: int = 20) -> Dict[str, Any]:
+    params = {"limit": limit}
+    response = await client.get(f"/conversations/{conversation_id}/messages", params=params)
+    response.raise_for_status()
+    return response.json()
+
+async def iter_messages(client: AsyncGHLClient, conversation_id: str, page_size: int = MESSAGES_PAGE_SIZE,
+                        message_type: Optional[str] = None) -> AsyncIterator[Dict[str, Any]]:
+    params = _messages_params(page_size, message_type)
+    last_message_id = None
+    while True:
+        rest: Dict[str, Any] = {}
+        async for message in client.stream_items(f"/conversations/{conversation_id}/messages", "messages.messages",
+                                                 params=dict(params), rest=rest):
+            yield message
+        last_message_id = _next_message_id(rest, last_message_id)
+        if last_message_id is None:
+            return
+        params["lastMessageId"] = last_message_id
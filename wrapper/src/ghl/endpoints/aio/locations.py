@@ -0,0 +1,75 @@
+import asyncio
+from typing import Optional, Dict, Any, List, AsyncIterator
+from ...client import AsyncGHLClient
+from ...pagination import aprefetch, DEFAULT_PREFETCH
+from ..locations import _search_params, MAX_PAGE_SIZE
+
+# Pages list_all_locations requests at once
+PARALLEL_PAGES = 4
+
+async def list_locations(client: AsyncGHLClient, limit: int = 10, skip: int = 0, email: Optional[str] = None, company_id: Optional[str] = None) -> Dict[str, Any]:
+    params = _search_params(limit, skip, email, company_id)
+
+    response = await client.get("/locations/search", params=params)
+    response.raise_for_status()
+    return response.json()
+
+async def iter_location_pages(client: AsyncGHLClient, page_size: int = MAX_PAGE_SIZE, email: Optional[str] = None, company_id: Optional[str] = None,
+                              skip: int = 0) -> AsyncIterator[Dict[str, Any]]:
+    while True:
+        params = _search_params(page_size, skip, email, company_id)
+        response = await client.get("/locations/search", params=params)
+        response.raise_for_status()
+        data = response.json()
+        yield data
+
+        if len(data.get("locations", [])) < page_size:
+            return
+        skip += page_size
+
+async def iter_locations(client: AsyncGHLClient, page_size: int = MAX_PAGE_SIZE, email: Optional[str] = None, company_id: Optional[str] = None,
+                         prefetch_depth: int = DEFAULT_PREFETCH) -> AsyncIterator[Dict[str, Any]]:
+    async for page in aprefetch(iter_location_pages(client, page_size, email, company_id), prefetch_depth):
+        for location in page.get("locations", []):
+            yield location
+
+async def list_all_locations(client: AsyncGHLClient, page_size: int = MAX_PAGE_SIZE, email: Optional[str] = None,
+                             company_id: Optional[str] = None, parallel: int = PARALLEL_PAGES) -> List[Dict[str, Any]]:
+    """Every matching location, fetching `parallel` pages at a time.
+
+    /locations/search reports no total, so pages are requested in waves of
+    consecutive skips until one comes back short; the last wave may fetch a few
+    empty pages.
+    """
+    locations: List[Dict[str, Any]] = []
+    skip = 0
+    while True:
+        pages = await asyncio.gather(*(list_locations(client, page_size, skip + i * page_size, email, company_id)
+                                       for i in range(parallel)))
+        for page in pages:
+            items = page.get("locations", [])
+            locations.extend(items)
+            if len(items) < page_size:
+                return locations
+        skip += parallel * page_size
+
+async def get_location(client: AsyncGHLClient, location_id: str) -> Dict[str, Any]:
+    response = await client.get(f"/locations/{location_id}")
+    response.raise_for_status()
+    return response.json()
+
+async def create_location(client: AsyncGHLClient, data: Dict[str, Any]) -> Dict[str, Any]:
+    response = await client.post("/locations/", json=data)
+    response.raise_for_status()
+    return response.json()
+
+async def update_location(client: AsyncGHLClient, location_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    response = await client.put(f"/locations/{location_id}", json=data)
+    response.raise_for_status()
+    return response.json()
+
+async def delete_location(client: AsyncGHLClient, location_id: str, delete_twilio_account: bool = False) -> Dict[str, Any]:
+    params = {"deleteTwilioAccount": delete_twilio_account}
+    response = await client.delete(f"/locations/{location_id}", params=params)
+    response.raise_for_status()
+    return response.json()
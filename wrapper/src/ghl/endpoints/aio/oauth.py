@@ -0,0 +1,28 @@
+import asyncio
+from typing import Optional, Dict, Any, List
+from ...client import AsyncGHLClient
+from ..oauth import _installed_params
+
+async def get_location_token(client: AsyncGHLClient, company_id: str, location_id: str) -> Dict[str, Any]:
+    response = await client.post("/oauth/locationToken", data={"companyId": company_id, "locationId": location_id})
+    response.raise_for_status()
+    return response.json()
+
+async def list_installed_locations(client: AsyncGHLClient, company_id: str, app_id: str, limit: int = 100, skip: int = 0,
+                                   query: Optional[str] = None, is_installed: Optional[bool] = True) -> Dict[str, Any]:
+    params = _installed_params(company_id, app_id, limit, skip, query, is_installed)
+    response = await client.get("/oauth/installedLocations", params=params)
+    response.raise_for_status()
+    return response.json()
+
+async def list_all_installed_locations(client: AsyncGHLClient, company_id: str, app_id: str,
+                                       page_size: int = 100) -> List[Dict[str, Any]]:
+    """Every location where the app is installed; after the first page (which carries
+    the count), the remaining pages are fetched at once."""
+    first = await list_installed_locations(client, company_id, app_id, page_size)
+    locations = list(first.get("locations", []))
+    skips = range(page_size, int(first.get("count") or 0), page_size)
+    pages = await asyncio.gather(*(list_installed_locations(client, company_id, app_id, page_size, skip) for skip in skips))
+    for page in pages:
+        locations.extend(page.get("locations", []))
+    return locations
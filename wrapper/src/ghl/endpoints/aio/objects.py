@@ -0,0 +1,84 @@
+from typing import Optional, Dict, Any, Iterable, AsyncIterator
+from ...client import AsyncGHLClient
+from ...bulk import fetch_many, DEFAULT_CONCURRENCY
+from ...pagination import aprefetch, DEFAULT_PREFETCH
+from ...projection import project, project_page
+from ..objects import _records_body, _is_last_page, MAX_PAGE_SIZE
+
+async def list_schemas(client: AsyncGHLClient, location_id: Optional[str] = None) -> Dict[str, Any]:
+    params = {}
+    if location_id:
+        params["locationId"] = location_id
+    elif client.location_id:
+        params["locationId"] = client.location_id
+
+    response = await client.get("/objects/", params=params)
+    response.raise_for_status()
+    return response.json()
+
+async def get_schema(client: AsyncGHLClient, key: str, location_id: Optional[str] = None) -> Dict[str, Any]:
+    params = {}
+    if location_id:
+        params["locationId"] = location_id
+    elif client.location_id:
+        params["locationId"] = client.location_id
+
+    response = await client.get(f"/objects/{key}", params=params)
+    response.raise_for_status()
+    return response.json()
+
+async def list_records(client: AsyncGHLClient, schema_key: str, limit: int = 20, query: Optional[str] = None, location_id: Optional[str] = None,
+                       fields: Optional[str] = None) -> Dict[str, Any]:
+    data = _records_body(client, limit, 1, query, location_id)
+
+    response = await client.post(f"/objects/{schema_key}/records/search", json=data)
+    response.raise_for_status()
+    return project_page(response.json(), "records", fields)
+
+async def iter_record_pages(client: AsyncGHLClient, schema_key: str, page_size: int = MAX_PAGE_SIZE, query: Optional[str] = None,
+                            location_id: Optional[str] = None, start_page: int = 1) -> AsyncIterator[Dict[str, Any]]:
+    page = start_page
+    while True:
+        data = _records_body(client, page_size, page, query, location_id)
+        response = await client.post(f"/objects/{schema_key}/records/search", json=data)
+        response.raise_for_status()
+        result = response.json()
+        yield result
+
+        if _is_last_page(result, page, page_size):
+            return
+        page += 1
+
+async def iter_records(client: AsyncGHLClient, schema_key: str, page_size: int = MAX_PAGE_SIZE, query: Optional[str] = None,
+                       location_id: Optional[str] = None, prefetch_depth: int = DEFAULT_PREFETCH,
+                       fields: Optional[str] = None) -> AsyncIterator[Dict[str, Any]]:
+    pages = iter_record_pages(client, schema_key, page_size, query, location_id)
+    async for page in aprefetch(pages, prefetch_depth):
+        for record in project(page.get("records", []), fields):
+            yield record
+
+async def get_record(client: AsyncGHLClient, schema_key: str, record_id: str) -> Dict[str, Any]:
+    response = await client.get(f"/objects/{schema_key}/records/{record_id}")
+    response.raise_for_status()
+    return response.json()
+
+async def get_many_records(client: AsyncGHLClient, schema_key: str, record_ids: Iterable[str],
+                           concurrency: int = DEFAULT_CONCURRENCY) -> AsyncIterator[Dict[str, Any]]:
+    """get_record for each distinct ID, concurrently; yields bulk.fetch_many results as they complete."""
+    async for result in fetch_many(lambda record_id: get_record(client, schema_key, record_id), record_ids, concurrency):
+        yield result
+
+async def create_record(client: AsyncGHLClient, schema_key: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    response = await client.post(f"/objects/{schema_key}/records", json=data)
+    response.raise_for_status()
+    return response.json()
+
+async def update_record(client: AsyncGHLClient, schema_key: str, record_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    response = await client.put(f"/objects/{schema_key}/records/{record_id}", json=data)
+    response.raise_for_status()
+    return response.json()
+
+async def delete_record(client: AsyncGHLClient, schema_key: str, record_id: str) -> Dict[str, Any]:
+    response = await client.delete(f"/objects/{schema_key}/records/{record_id}")
+    response.raise_for_status()
+    return response.json()
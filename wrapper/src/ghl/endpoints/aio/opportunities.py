@@ -0,0 +1,75 @@
+from typing import Optional, Dict, Any, Iterable, AsyncIterator
+from ...client import AsyncGHLClient
+from ...bulk import fetch_many, DEFAULT_CONCURRENCY
+from ...pagination import next_cursor, aprefetch, DEFAULT_PREFETCH
+from ...projection import project, project_page
+from ..opportunities import _search_params, MAX_PAGE_SIZE
+
+async def list_opportunities(client: AsyncGHLClient, limit: int = 20, query: Optional[str] = None, pipeline_id: Optional[str] = None, status: Optional[str] = None,
+                             fields: Optional[str] = None) -> Dict[str, Any]:
+    params = _search_params(client, limit, query, pipeline_id, status)
+
+    response = await client.get("/opportunities/search", params=params)
+    response.raise_for_status()
+    return project_page(response.json(), "opportunities", fields)
+
+async def iter_opportunity_pages(client: AsyncGHLClient, page_size: int = MAX_PAGE_SIZE, query: Optional[str] = None, pipeline_id: Optional[str] = None,
+                                 status: Optional[str] = None, start_after: Optional[int] = None, start_after_id: Optional[str] = None) -> AsyncIterator[Dict[str, Any]]:
+    params = _search_params(client, page_size, query, pipeline_id, status)
+    cursor = (start_after, start_after_id) if start_after_id else None
+
+    while True:
+        if cursor:
+            params["startAfter"], params["startAfterId"] = cursor
+
+        response = await client.get("/opportunities/search", params=dict(params))
+        response.raise_for_status()
+        data = response.json()
+        yield data
+
+        cursor = next_cursor(data.get("opportunities", []), data.get("meta"), page_size, cursor)
+        if cursor is None:
+            return
+
+async def iter_opportunities(client: AsyncGHLClient, page_size: int = MAX_PAGE_SIZE, query: Optional[str] = None, pipeline_id: Optional[str] = None,
+                             status: Optional[str] = None, prefetch_depth: int = DEFAULT_PREFETCH,
+                             fields: Optional[str] = None) -> AsyncIterator[Dict[str, Any]]:
+    pages = iter_opportunity_pages(client, page_size, query, pipeline_id, status)
+    async for page in aprefetch(pages, prefetch_depth):
+        for opportunity in project(page.get("opportunities", []), fields):
+            yield opportunity
+
+async def get_opportunity(client: AsyncGHLClient, opportunity_id: str) -> Dict[str, Any]:
+    response = await client.get(f"/opportunities/{opportunity_id}")
+    response.raise_for_status()
+    return response.json()
+
+async def get_many_opportunities(client: AsyncGHLClient, opportunity_ids: Iterable[str],
+                                 concurrency: int = DEFAULT_CONCURRENCY) -> AsyncIterator[Dict[str, Any]]:
+    """get_opportunity for each distinct ID, concurrently; yields bulk.fetch_many results as they complete."""
+    async for result in fetch_many(lambda opportunity_id: get_opportunity(client, opportunity_id), opportunity_ids, concurrency):
+        yield result
+
+async def create_opportunity(client: AsyncGHLClient, data: Dict[str, Any]) -> Dict[str, Any]:
+    response = await client.post("/opportunities/", json=data)
+    response.raise_for_status()
+    return response.json()
+
+async def update_opportunity(client: AsyncGHLClient, opportunity_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    response = await client.put(f"/opportunities/{opportunity_id}", json=data)
+    response.raise_for_status()
+    return response.json()
+
+async def delete_opportunity(client: AsyncGHLClient, opportunity_id: str) -> Dict[str, Any]:
+    response = await client.delete(f"/opportunities/{opportunity_id}")
+    response.raise_for_status()
+    return response.json()
+
+async def list_pipelines(client: AsyncGHLClient) -> Dict[str, Any]:
+    params = {}
+    if client.location_id:
+        params["locationId"] = client.location_id
+
+    response = await client.get("/opportunities/pipelines", params=params)
+    response.raise_for_status()
+    return response.json()
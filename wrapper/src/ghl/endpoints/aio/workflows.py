@@ -0,0 +1,13 @@
+from typing import Optional, Dict, Any
+from ...client import AsyncGHLClient
+
+async def list_workflows(client: AsyncGHLClient, location_id: Optional[str] = None) -> Dict[str, Any]:
+    params = {}
+    if location_id:
+        params["locationId"] = location_id
+    elif client.location_id:
+        params["locationId"] = client.location_id
+
+    response = await client.get("/workflows/", params=params)
+    response.raise_for_status()
+    return response.json()
@@ -1,26 +1,31 @@
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Iterator
 from ..client import GHLClient
+from ..pagination import next_cursor, prefetch, DEFAULT_PREFETCH
+from ..projection import project
 
 ESSENTIAL_FIELDS = ["id", "email", "name", "firstName", "lastName"]
 COMMON_FIELDS = ESSENTIAL_FIELDS + ["phone", "tags", "source", "dateAdded"]
+_ESSENTIAL, _COMMON = tuple(ESSENTIAL_FIELDS), tuple(COMMON_FIELDS)
 
-def _filter_fields(data: Any, fields: Optional[str], verbose: int) -> Any:
-    if isinstance(data, list):
-        return [_filter_fields(item, fields, verbose) for item in data]
+# Largest page GET /contacts/ accepts
+MAX_PAGE_SIZE = 100
+
+# Page size used when streaming POST /contacts/search results
+SEARCH_PAGE_SIZE = 100
 
-    if not isinstance(data, dict):
-        return data
+# Operators POST /contacts/search accepts in a filter
+FILTER_OPERATORS = ("eq", "not_eq", "contains", "not_contains", "exists", "not_exists", "range")
 
+def _filter_fields(data: Any, fields: Optional[str], verbose: int) -> Any:
+    """Projects a contact or list of contacts onto `fields` (dotted paths allowed; see ghl.projection).
+
+    Without fields, -v keeps COMMON_FIELDS, -vv keeps everything and the default is ESSENTIAL_FIELDS.
+    """
     if fields:
-        selected = fields.split(",")
-    elif verbose >= 2:
+        return project(data, fields)
+    if verbose >= 2:
         return data # All fields
-    elif verbose == 1:
-        selected = COMMON_FIELDS
-    else:
-        selected = ESSENTIAL_FIELDS
-
-    return {k: data.get(k) for k in selected if k in data}
+    return project(data, _COMMON if verbose == 1 else _ESSENTIAL)
 
 def list_contacts(client: GHLClient, limit: int = 20, query: Optional[str] = None, fields: Optional[str] = None, verbose: int = 0) -> Dict[str, Any]:
     params = {"limit": limit}
@@ -36,6 +41,39 @@ def list_contacts(client: GHLClient, limit: int = 20, query: Optional[str] = Non
 
     return {"contacts": filtered_contacts, "meta": data.get("meta", {})}
 
+def _page_params(client: Any, page_size: int, query: Optional[str]) -> Dict[str, Any]:
+    params = {"limit": page_size}
+    if query:
+        params["query"] = query
+    if client.location_id:
+        params["locationId"] = client.location_id
+    return params
+
+def iter_contact_pages(client: GHLClient, page_size: int = MAX_PAGE_SIZE, query: Optional[str] = None,
+                       start_after: Optional[int] = None, start_after_id: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """Yields raw GET /contacts/ pages, following the startAfter/startAfterId cursor."""
+    params = _page_params(client, page_size, query)
+    cursor = (start_after, start_after_id) if start_after_id else None
+
+    while True:
+        if cursor:
+            params["startAfter"], params["startAfterId"] = cursor
+
+        response = client.get("/contacts/", params=dict(params))
+        response.raise_for_status()
+        data = response.json()
+        yield data
+
+        cursor = next_cursor(data.get("contacts", []), data.get("meta"), page_size, cursor)
+        if cursor is None:
+            return
+
+def iter_contacts(client: GHLClient, page_size: int = MAX_PAGE_SIZE, query: Optional[str] = None,
+                  fields: Optional[str] = None, verbose: int = 0, prefetch_depth: int = DEFAULT_PREFETCH) -> Iterator[Dict[str, Any]]:
+    """Yields every contact in the location one at a time, fetching the next pages in the background."""
+    for page in prefetch(iter_contact_pages(client, page_size, query), prefetch_depth):
+        yield from _filter_fields(page.get("contacts", []), fields, verbose)
+
 def get_contact(client: GHLClient, contact_id: str, fields: Optional[str] = None, verbose: int = 0) -> Dict[str, Any]:
     response = client.get(f"/contacts/{contact_id}")
     response.raise_for_status()
@@ -49,6 +87,12 @@ def create_contact(client: GHLClient, data: Dict[str, Any]) -> Dict[str, Any]:
     response.raise_for_status()
     return response.json()
 
+def upsert_contact(client: GHLClient, data: Dict[str, Any]) -> Dict[str, Any]:
+    """Creates or updates the contact matching data's email/phone, per the location's duplicate settings."""
+    response = client.post("/contacts/upsert", json=data)
+    response.raise_for_status()
+    return response.json()
+
 def update_contact(client: GHLClient, contact_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
     response = client.put(f"/contacts/{contact_id}", json=data)
     response.raise_for_status()
@@ -59,84 +103,108 @@ def delete_contact(client: GHLClient, contact_id: str) -> Dict[str, Any]:
     response.raise_for_status()
     return response.json()
 
-def search_contacts(client: GHLClient, query: str, fields: Optional[str] = None, verbose: int = 0) -> Dict[str, Any]:
-    # Using POST /contacts/search as per AGENTS.md search command implication
-    # but the query param in AGENTS.md example `ghl contacts search --query "email:*@example.com"`
-    # looks like it might map to `GET /contacts/` with query, OR `POST /contacts/search` with a body.
-    # The `apps/contacts.json` shows `POST /contacts/search` takes a `SearchBodyV2DTO`.
-    # But `GET /contacts/` takes a `query` param.
-
-    # If the user provides a raw query string, it's ambiguous which endpoint to use if we follow strict REST.
-    # However, `AGENTS.md` distinguishes `list` (limit, query) and `search` (query).
-
-    # Let's assume `search` uses the Advanced Search POST endpoint.
-    # But for simplicity and to match the CLI example `email:*@example.com`,
-    # maybe we should construct the body for the search endpoint?
-
-    # Actually, let's look at `apps/contacts.json` for `POST /contacts/search`.
-    # It references `SearchBodyV2DTO`.
-
-    # For now, I'll implement `search` to take a dictionary or just pass the query if it's simple.
-    # But wait, the CLI example is `ghl contacts search --query "email:*@example.com"`.
-    # This looks like a Lucene query or similar.
-    # If I look at `GET /contacts/` params, it has `query`.
-
-    # If I look at `POST /contacts/search` description: "Search contacts based on combinations of advanced filters."
-
-    # If I assume the user passes a JSON string as query for advanced search?
-    # Or maybe the "query" in `ghl contacts search` is intended to be the `q` or `query` param in `GET /contacts/search`?
-    # Wait, `GET /contacts/search` is not in the paths I saw.
-    # There is `/contacts/search/duplicate` (GET).
-    # And `/contacts/search` (POST).
-
-    # Let's assume for now that `search` creates a request to `POST /contacts/search`.
-    # If the query is a simple string, maybe we put it in `query` field if it exists in schema?
-    # `apps/contacts.json` -> `SearchBodyV2DTO`. It's empty in the snippet I saw:
-    # "SearchBodyV2DTO": { "type": "object", "properties": {} }
-    # That's unhelpful.
-
-    # Let's look at `GET /contacts/` again. It has `query`.
-
-    # Maybe `ghl contacts list` uses `GET /contacts/` and `ghl contacts search` ALSO uses `GET /contacts/` but is just an alias?
-    # No, `AGENTS.md` lists them separately.
-
-    # "ghl contacts search --query "email:*@example.com""
-    # If this is mapped to `POST /contacts/search`, we need to know the body structure.
-
-    # Let's implement `search` to take a raw body for now (passed via --data maybe?), but the CLI spec says `--query`.
-
-    # If I look closely at `AGENTS.md`:
-    # `ghl contacts search --query "email:*@example.com"`
-
-    # This might be using the `GET /contacts/` endpoint but emphasizing the search capability.
-    # OR it's using `POST /contacts/search` with a crafted body.
-
-    # Let's stick to: `list` uses `GET /contacts/` (with query param support).
-    # `search`: I'll assume it uses `POST /contacts/search` and expects the user to provide the body, OR if `query` is provided, maybe it tries to construct a filter.
-    # Without the schema for `SearchBodyV2DTO`, it's hard to guess.
-
-    # I will check if there is another file `common-schemas.json` or something that has `SearchBodyV2DTO`?
-    # The snippet had `"SearchBodyV2DTO": { "type": "object", "properties": {} }`.
-
-    # Let's implement `search` to basically do what `list` does but maybe with different defaults or intent?
-    # Or maybe I should just use `GET /contacts/` for `search` as well if `query` is passed.
-
-    # Actually, let's implement `search` as a wrapper around `POST /contacts/search` and require a JSON body for now if `query` is not compatible.
-    # BUT, the CLI spec defines `--query` string.
-
-    # Let's look at `docs/contacts/` if it existed. It doesn't.
-    # `apps/contacts.json` description says: "Documentation Link - https://doc.clickup.com/8631005/d/h/87cpx-158396/6e629989abe7fad"
-
-    # I'll implement `list` fully.
-    # For `search`, I'll implement it to use `POST /contacts/search` and pass the query in the body as `{"query": query}` if that's a reasonable guess, or just support `kwargs` to build the body.
-
-    # Re-reading `AGENTS.md`:
-    # `ghl contacts search --query "email:*@example.com"`
-
-    # If I treat `search` as `GET /contacts/?query=...` it would be same as list.
-
-    # Let's implement `search` to use `POST /contacts/search` and if `query` is provided, try to use it.
-    # Since I don't know the body, I'll pass it as `{"query": query}`.
+def contact_filter(field: str, operator: str, value: Any = None) -> Dict[str, Any]:
+    """One POST /contacts/search filter, e.g. contact_filter("tags", "contains", "vip").
+
+    Custom fields are addressed as "customFields.<field id>". range takes a dict
+    of gt/gte/lt/lte bounds; exists and not_exists take no value.
+    """
+    if operator not in FILTER_OPERATORS:
+        raise ValueError(f"Unknown filter operator: {operator} (use one of {', '.join(FILTER_OPERATORS)})")
+    result = {"field": field, "operator": operator}
+    if value is not None:
+        result["value"] = value
+    return result
+
+def all_of(*filters: Dict[str, Any]) -> Dict[str, Any]:
+    return {"group": "AND", "filters": list(filters)}
+
+def any_of(*filters: Dict[str, Any]) -> Dict[str, Any]:
+    return {"group": "OR", "filters": list(filters)}
+
+def parse_filter(expression: str) -> Dict[str, Any]:
+    """Parses the CLI form FIELD:OPERATOR[:VALUE], e.g. "tags:contains:vip".
+
+    A range value is written FROM..TO (inclusive, either side optional), so
+    "dateAdded:range:2024-01-01..2024-01-31".
+    """
+    parts = expression.split(":", 2)
+    if len(parts) < 2 or not parts[0]:
+        raise ValueError(f"Invalid filter {expression!r}; expected FIELD:OPERATOR[:VALUE]")
+    field, operator = parts[0], parts[1]
+    value: Any = parts[2] if len(parts) == 3 else None
+    if operator == "range":
+        start, sep, end = (value or "").partition("..")
+        if not sep or not (start or end):
+            raise ValueError(f"Invalid range in {expression!r}; expected FROM..TO")
+        value = {k: v for k, v in (("gte", start), ("lte", end)) if v}
+    elif value is None and operator not in ("exists", "not_exists"):
+        raise ValueError(f"Filter {expression!r} needs a value")
+    return contact_filter(field, operator, value)
+
+def parse_sort(expression: str) -> Dict[str, str]:
+    """Parses FIELD[:asc|desc] into a sort entry."""
+    field, _, direction = expression.partition(":")
+    direction = direction or "asc"
+    if direction not in ("asc", "desc"):
+        raise ValueError(f"Invalid sort direction: {direction}")
+    return {"field": field, "direction": direction}
+
+def _search_body(client: Any, query: Optional[str], filters: Optional[List[Dict[str, Any]]],
+                 sort: Optional[List[Dict[str, str]]], page_size: int) -> Dict[str, Any]:
+    body: Dict[str, Any] = {"pageLimit": page_size, "page": 1}
+    if client.location_id:
+        body["locationId"] = client.location_id
+    if query:
+        body["query"] = query
+    if filters:
+        body["filters"] = filters
+    if sort:
+        body["sort"] = sort
+    return body
+
+def _next_search_after(contacts: List[Dict[str, Any]], page_size: int, previous: Optional[List[Any]]) -> Optional[List[Any]]:
+    """searchAfter cursor for the next page: the sort values of the last contact, or None at the end."""
+    if len(contacts) < page_size:
+        return None
+    following = contacts[-1].get("searchAfter")
+    if not following or following == previous:
+        return None
+    return following
+
+def search_contacts(client: GHLClient, query: Optional[str] = None, fields: Optional[str] = None, verbose: int = 0,
+                    filters: Optional[List[Dict[str, Any]]] = None, sort: Optional[List[Dict[str, str]]] = None,
+                    limit: int = 20) -> Dict[str, Any]:
+    """First page of POST /contacts/search; filters are evaluated by the server (see contact_filter())."""
+    response = client.post("/contacts/search", json=_search_body(client, query, filters, sort, limit))
+    response.raise_for_status()
+    data = response.json()
 
-    pass
-    return {}
+    return {"contacts": _filter_fields(data.get("contacts", []), fields, verbose), "total": data.get("total")}
+
+def iter_search_pages(client: GHLClient, query: Optional[str] = None, filters: Optional[List[Dict[str, Any]]] = None,
+                      sort: Optional[List[Dict[str, str]]] = None, page_size: int = SEARCH_PAGE_SIZE) -> Iterator[Dict[str, Any]]:
+    """Yields raw POST /contacts/search pages, following the searchAfter cursor.
+
+    searchAfter is not capped the way page numbers are, so this reaches every match.
+    """
+    body = _search_body(client, query, filters, sort, page_size)
+
+    while True:
+        response = client.post("/contacts/search", json=dict(body))
+        response.raise_for_status()
+        data = response.json()
+        yield data
+
+        search_after = _next_search_after(data.get("contacts", []), page_size, body.get("searchAfter"))
+        if search_after is None:
+            return
+        body.pop("page", None)
+        body["searchAfter"] = search_after
+
+def iter_search(client: GHLClient, query: Optional[str] = None, filters: Optional[List[Dict[str, Any]]] = None,
+                sort: Optional[List[Dict[str, str]]] = None, fields: Optional[str] = None, verbose: int = 0,
+                page_size: int = SEARCH_PAGE_SIZE, prefetch_depth: int = DEFAULT_PREFETCH) -> Iterator[Dict[str, Any]]:
+    """Yields every contact matching the search one at a time, fetching the next pages in the background."""
+    for page in prefetch(iter_search_pages(client, query, filters, sort, page_size), prefetch_depth):
+        yield from _filter_fields(page.get("contacts", []), fields, verbose)
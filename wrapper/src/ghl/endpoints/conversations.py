@@ -1,7 +1,9 @@
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterator
 from ..client import GHLClient
+from ..projection import project_page
 
-def list_conversations(client: GHLClient, limit: int = 20, query: Optional[str] = None, status: Optional[str] = None, location_id: Optional[str] = None) -> Dict[str, Any]:
+def list_conversations(client: GHLClient, limit: int = 20, query: Optional[str] = None, status: Optional[str] = None, location_id: Optional[str] = None,
+                       fields: Optional[str] = None) -> Dict[str, Any]:
     params = {"limit": limit}
     if query:
         params["query"] = query
@@ -14,7 +16,7 @@ def list_conversations(client: GHLClient, limit: int = 20, query: Optional[str]
 
     response = client.get("/conversations/search", params=params)
     response.raise_for_status()
-    return response.json()
+    return project_page(response.json(), "conversations", fields)
 
 def get_conversation(client: GHLClient, conversation_id: str) -> Dict[str, Any]:
     response = client.get(f"/conversations/{conversation_id}")
@@ -36,8 +38,42 @@ def delete_conversation(client: GHLClient, conversation_id: str) -> Dict[str, An
     response.raise_for_status()
     return response.json()
 
+# Largest page GET /conversations/{id}/messages accepts
+MESSAGES_PAGE_SIZE = 100
+
 def get_messages(client: GHLClient, conversation_id: str, limit: int = 20) -> Dict[str, Any]:
     params = {"limit": limit}
     response = client.get(f"/conversations/{conversation_id}/messages", params=params)
     response.raise_for_status()
     return response.json()
+
+def _messages_params(page_size: int, message_type: Optional[str]) -> Dict[str, Any]:
+    params: Dict[str, Any] = {"limit": page_size}
+    if message_type:
+        params["type"] = message_type
+    return params
+
+def _next_message_id(rest: Dict[str, Any], last_message_id: Optional[str]) -> Optional[str]:
+    """lastMessageId cursor for the following page, or None when there is none."""
+    page = rest.get("messages") or {}
+    following = page.get("lastMessageId")
+    if not page.get("nextPage") or not following or following == last_message_id:
+        return None
+    return following
+
+def iter_messages(client: GHLClient, conversation_id: str, page_size: int = MESSAGES_PAGE_SIZE,
+                  message_type: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """Yields every message of a conversation, decoding each page as it streams in.
+
+    Follows lastMessageId while the response says nextPage.
+    """
+    params = _messages_params(page_size, message_type)
+    last_message_id = None
+    while True:
+        rest: Dict[str, Any] = {}
+        yield from client.stream_items(f"/conversations/{conversation_id}/messages", "messages.messages",
+                                       params=dict(params), rest=rest)
+        last_message_id = _next_message_id(rest, last_message_id)
+        if last_message_id is None:
+            return
+        params["lastMessageId"] = last_message_id
@@ -1,7 +1,11 @@
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterator
 from ..client import GHLClient
+from ..pagination import prefetch, DEFAULT_PREFETCH
 
-def list_locations(client: GHLClient, limit: int = 10, skip: int = 0, email: Optional[str] = None, company_id: Optional[str] = None) -> Dict[str, Any]:
+# Largest page /locations/search accepts
+MAX_PAGE_SIZE = 100
+
+def _search_params(limit: int, skip: int, email: Optional[str], company_id: Optional[str]) -> Dict[str, Any]:
     params = {
         "limit": limit,
         "skip": skip
@@ -10,11 +14,35 @@ def list_locations(client: GHLClient, limit: int = 10, skip: int = 0, email: Opt
         params["email"] = email
     if company_id:
         params["companyId"] = company_id
+    return params
+
+def list_locations(client: GHLClient, limit: int = 10, skip: int = 0, email: Optional[str] = None, company_id: Optional[str] = None) -> Dict[str, Any]:
+    params = _search_params(limit, skip, email, company_id)
 
     response = client.get("/locations/search", params=params)
     response.raise_for_status()
     return response.json()
 
+def iter_location_pages(client: GHLClient, page_size: int = MAX_PAGE_SIZE, email: Optional[str] = None, company_id: Optional[str] = None,
+                        skip: int = 0) -> Iterator[Dict[str, Any]]:
+    """Yields raw /locations/search pages using skip/limit paging."""
+    while True:
+        params = _search_params(page_size, skip, email, company_id)
+        response = client.get("/locations/search", params=params)
+        response.raise_for_status()
+        data = response.json()
+        yield data
+
+        if len(data.get("locations", [])) < page_size:
+            return
+        skip += page_size
+
+def iter_locations(client: GHLClient, page_size: int = MAX_PAGE_SIZE, email: Optional[str] = None, company_id: Optional[str] = None,
+                   prefetch_depth: int = DEFAULT_PREFETCH) -> Iterator[Dict[str, Any]]:
+    """Yields every matching location, fetching the next pages in the background."""
+    for page in prefetch(iter_location_pages(client, page_size, email, company_id), prefetch_depth):
+        yield from page.get("locations", [])
+
 def get_location(client: GHLClient, location_id: str) -> Dict[str, Any]:
     response = client.get(f"/locations/{location_id}")
     response.raise_for_status()
@@ -0,0 +1,28 @@
+from typing import Optional, Dict, Any
+from ..client import GHLClient
+
+def _installed_params(company_id: str, app_id: str, limit: int, skip: int, query: Optional[str],
+                      is_installed: Optional[bool]) -> Dict[str, Any]:
+    params: Dict[str, Any] = {"companyId": company_id, "appId": app_id, "limit": limit, "skip": skip}
+    if query:
+        params["query"] = query
+    if is_installed is not None:
+        params["isInstalled"] = str(is_installed).lower()
+    return params
+
+def get_location_token(client: GHLClient, company_id: str, location_id: str) -> Dict[str, Any]:
+    """Exchanges the client's agency token for a token scoped to one location.
+
+    The response carries access_token, expires_in (seconds) and locationId.
+    """
+    response = client.post("/oauth/locationToken", data={"companyId": company_id, "locationId": location_id})
+    response.raise_for_status()
+    return response.json()
+
+def list_installed_locations(client: GHLClient, company_id: str, app_id: str, limit: int = 100, skip: int = 0,
+                             query: Optional[str] = None, is_installed: Optional[bool] = True) -> Dict[str, Any]:
+    """Locations of the company where the app is installed ({"locations": [...], "count": N})."""
+    params = _installed_params(company_id, app_id, limit, skip, query, is_installed)
+    response = client.get("/oauth/installedLocations", params=params)
+    response.raise_for_status()
+    return response.json()
@@ -1,5 +1,10 @@
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterator
 from ..client import GHLClient
+from ..pagination import prefetch, DEFAULT_PREFETCH
+from ..projection import project, project_page
+
+# Largest pageLimit the records search accepts
+MAX_PAGE_SIZE = 100
 
 def list_schemas(client: GHLClient, location_id: Optional[str] = None) -> Dict[str, Any]:
     params = {}
@@ -23,10 +28,10 @@ def get_schema(client: GHLClient, key: str, location_id: Optional[str] = None) -
     response.raise_for_status()
     return response.json()
 
-def list_records(client: GHLClient, schema_key: str, limit: int = 20, query: Optional[str] = None, location_id: Optional[str] = None) -> Dict[str, Any]:
+def _records_body(client: Any, limit: int, page: int, query: Optional[str], location_id: Optional[str]) -> Dict[str, Any]:
     data = {
         "pageLimit": limit,
-        "page": 1, # Default to page 1 for now
+        "page": page,
     }
     if query:
         data["query"] = query
@@ -35,10 +40,43 @@ def list_records(client: GHLClient, schema_key: str, limit: int = 20, query: Opt
         data["locationId"] = location_id
     elif client.location_id:
         data["locationId"] = client.location_id
+    return data
+
+def _is_last_page(data: Dict[str, Any], page: int, page_size: int) -> bool:
+    records = data.get("records", [])
+    total = data.get("total")
+    return len(records) < page_size or (isinstance(total, (int, float)) and page * page_size >= total)
+
+def list_records(client: GHLClient, schema_key: str, limit: int = 20, query: Optional[str] = None, location_id: Optional[str] = None,
+                 fields: Optional[str] = None) -> Dict[str, Any]:
+    data = _records_body(client, limit, 1, query, location_id)
 
     response = client.post(f"/objects/{schema_key}/records/search", json=data)
     response.raise_for_status()
-    return response.json()
+    return project_page(response.json(), "records", fields)
+
+def iter_record_pages(client: GHLClient, schema_key: str, page_size: int = MAX_PAGE_SIZE, query: Optional[str] = None,
+                      location_id: Optional[str] = None, start_page: int = 1) -> Iterator[Dict[str, Any]]:
+    """Yields raw record search pages using page/pageLimit paging."""
+    page = start_page
+    while True:
+        data = _records_body(client, page_size, page, query, location_id)
+        response = client.post(f"/objects/{schema_key}/records/search", json=data)
+        response.raise_for_status()
+        result = response.json()
+        yield result
+
+        if _is_last_page(result, page, page_size):
+            return
+        page += 1
+
+def iter_records(client: GHLClient, schema_key: str, page_size: int = MAX_PAGE_SIZE, query: Optional[str] = None,
+                 location_id: Optional[str] = None, prefetch_depth: int = DEFAULT_PREFETCH,
+                 fields: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """Yields every record of a schema, fetching the next pages in the background."""
+    pages = iter_record_pages(client, schema_key, page_size, query, location_id)
+    for page in prefetch(pages, prefetch_depth):
+        yield from project(page.get("records", []), fields)
 
 def get_record(client: GHLClient, schema_key: str, record_id: str) -> Dict[str, Any]:
     response = client.get(f"/objects/{schema_key}/records/{record_id}")
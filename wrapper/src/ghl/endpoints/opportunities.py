@@ -1,7 +1,12 @@
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterator
 from ..client import GHLClient
+from ..pagination import next_cursor, prefetch, DEFAULT_PREFETCH
+from ..projection import project, project_page
 
-def list_opportunities(client: GHLClient, limit: int = 20, query: Optional[str] = None, pipeline_id: Optional[str] = None, status: Optional[str] = None) -> Dict[str, Any]:
+# Largest page GET /opportunities/search accepts
+MAX_PAGE_SIZE = 100
+
+def _search_params(client: Any, limit: int, query: Optional[str], pipeline_id: Optional[str], status: Optional[str]) -> Dict[str, Any]:
     params = {"limit": limit}
     if query:
         params["q"] = query
@@ -12,10 +17,42 @@ def list_opportunities(client: GHLClient, limit: int = 20, query: Optional[str]
 
     if client.location_id:
         params["location_id"] = client.location_id
+    return params
+
+def list_opportunities(client: GHLClient, limit: int = 20, query: Optional[str] = None, pipeline_id: Optional[str] = None, status: Optional[str] = None,
+                       fields: Optional[str] = None) -> Dict[str, Any]:
+    params = _search_params(client, limit, query, pipeline_id, status)
 
     response = client.get("/opportunities/search", params=params)
     response.raise_for_status()
-    return response.json()
+    return project_page(response.json(), "opportunities", fields)
+
+def iter_opportunity_pages(client: GHLClient, page_size: int = MAX_PAGE_SIZE, query: Optional[str] = None, pipeline_id: Optional[str] = None,
+                           status: Optional[str] = None, start_after: Optional[int] = None, start_after_id: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """Yields raw /opportunities/search pages, following the startAfter/startAfterId cursor."""
+    params = _search_params(client, page_size, query, pipeline_id, status)
+    cursor = (start_after, start_after_id) if start_after_id else None
+
+    while True:
+        if cursor:
+            params["startAfter"], params["startAfterId"] = cursor
+
+        response = client.get("/opportunities/search", params=dict(params))
+        response.raise_for_status()
+        data = response.json()
+        yield data
+
+        cursor = next_cursor(data.get("opportunities", []), data.get("meta"), page_size, cursor)
+        if cursor is None:
+            return
+
+def iter_opportunities(client: GHLClient, page_size: int = MAX_PAGE_SIZE, query: Optional[str] = None, pipeline_id: Optional[str] = None,
+                       status: Optional[str] = None, prefetch_depth: int = DEFAULT_PREFETCH,
+                       fields: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """Yields every matching opportunity, fetching the next pages in the background."""
+    pages = iter_opportunity_pages(client, page_size, query, pipeline_id, status)
+    for page in prefetch(pages, prefetch_depth):
+        yield from project(page.get("opportunities", []), fields)
 
 def get_opportunity(client: GHLClient, opportunity_id: str) -> Dict[str, Any]:
     response = client.get(f"/opportunities/{opportunity_id}")
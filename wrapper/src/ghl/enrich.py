@@ -0,0 +1,109 @@
+import asyncio
+from collections import deque
+from typing import Optional, Dict, Any, Union, Iterable, AsyncIterable, AsyncIterator, Awaitable, Callable
+from .bulk import is_missing
+from .client import AsyncGHLClient
+from .endpoints.aio import contacts
+
+DEFAULT_CONCURRENCY = 8
+
+# Records read ahead of the one being emitted, per concurrent lookup
+WINDOW_PER_WORKER = 4
+
+# Contact fields joined by default (contacts.COMMON_FIELDS: name, email, phone, tags, ...)
+DEFAULT_VERBOSE = 1
+
+Records = Union[Iterable[Dict[str, Any]], AsyncIterable[Dict[str, Any]]]
+
+class ContactLookup:
+    """Memoized, concurrency-bounded contact fetches for one enrichment run.
+
+    Each contact ID is fetched at most once; callers asking for an ID already in
+    flight wait on the same request. Contacts that no longer exist resolve to None.
+    """
+
+    def __init__(self, fetch: Callable[[str], Awaitable[Dict[str, Any]]], concurrency: int = DEFAULT_CONCURRENCY):
+        self._fetch = fetch
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._contacts: Dict[str, "asyncio.Task[Optional[Dict[str, Any]]]"] = {}
+
+    @classmethod
+    def for_client(cls, client: AsyncGHLClient, fields: Optional[str] = None, verbose: int = DEFAULT_VERBOSE,
+                   concurrency: int = DEFAULT_CONCURRENCY) -> "ContactLookup":
+        return cls(lambda contact_id: contacts.get_contact(client, contact_id, fields, verbose), concurrency)
+
+    @property
+    def fetched(self) -> int:
+        """Distinct contacts requested so far (the API calls made, one each)."""
+        return len(self._contacts)
+
+    async def _get(self, contact_id: str) -> Optional[Dict[str, Any]]:
+        async with self._semaphore:
+            try:
+                return await self._fetch(contact_id)
+            except Exception as e:
+                if is_missing(e):
+                    return None
+                raise
+
+    def get(self, contact_id: str) -> "asyncio.Task[Optional[Dict[str, Any]]]":
+        """The (shared) task fetching contact_id; starts it on first request."""
+        task = self._contacts.get(contact_id)
+        if task is None:
+            task = self._contacts[contact_id] = asyncio.ensure_future(self._get(contact_id))
+        return task
+
+    def close(self) -> None:
+        for task in self._contacts.values():
+            task.cancel()
+
+async def _aiter(records: Records) -> AsyncIterator[Dict[str, Any]]:
+    if hasattr(records, "__aiter__"):
+        async for record in records:
+            yield record
+    else:
+        for record in records:
+            yield record
+
+async def _join(record: Dict[str, Any], lookup: Optional["asyncio.Task"], key: str) -> Dict[str, Any]:
+    if lookup is None:
+        return {**record, key: None}
+    try:
+        return {**record, key: await asyncio.shield(lookup)}
+    except Exception as e:
+        return {**record, key: None, f"{key}Error": str(e)}
+
+async def with_contacts(lookup: ContactLookup, records: Records, id_field: str = "contactId",
+                        key: str = "contact", window: int = DEFAULT_CONCURRENCY * WINDOW_PER_WORKER) -> AsyncIterator[Dict[str, Any]]:
+    """Yields each record, in order, with its contact under `key`.
+
+    Contact lookups start as records are read, up to `window` records ahead of
+    the one being yielded, so they overlap while the output keeps its order. A
+    record without `id_field`, or whose contact no longer exists, gets None; a
+    lookup that fails gets None plus the error under f"{key}Error".
+    """
+    pending: "deque" = deque()
+    async for record in _aiter(records):
+        contact_id = record.get(id_field)
+        pending.append((record, lookup.get(contact_id) if contact_id else None))
+        if len(pending) >= window:
+            yield await _join(*pending.popleft(), key)
+    while pending:
+        yield await _join(*pending.popleft(), key)
+
+async def enrich(client: AsyncGHLClient, records: Records, id_field: str = "contactId", key: str = "contact",
+                 fields: Optional[str] = None, verbose: int = DEFAULT_VERBOSE,
+                 concurrency: int = DEFAULT_CONCURRENCY) -> AsyncIterator[Dict[str, Any]]:
+    """with_contacts over a fresh ContactLookup: opportunities, calendar events or
+    conversations joined with their contacts, one API call per distinct contact."""
+    lookup = ContactLookup.for_client(client, fields, verbose, concurrency)
+    try:
+        async for record in with_contacts(lookup, records, id_field, key, concurrency * WINDOW_PER_WORKER):
+            yield record
+    finally:
+        lookup.close()
+
+async def enrich_page(client: AsyncGHLClient, page: Dict[str, Any], items_key: str, **options) -> Dict[str, Any]:
+    """A list response (e.g. {"opportunities": [...], "meta": ...}) with its items enriched."""
+    items = [record async for record in enrich(client, page.get(items_key, []), **options)]
+    return {**page, items_key: items}
@@ -0,0 +1,218 @@
+import csv
+import io
+import json
+import os
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Iterator, Tuple, Union, Callable
+from . import codec
+from .client import GHLClient
+from .endpoints import contacts, opportunities, objects
+from .pagination import prefetch, DEFAULT_PREFETCH
+from .projection import project
+
+# parquet needs the optional pyarrow dependency
+FORMATS = ("jsonl", "csv", "parquet")
+
+# CSV columns written when no fields are requested
+CSV_COLUMNS = {
+    "contacts": contacts.COMMON_FIELDS,
+    "opportunities": ["id", "name", "status", "monetaryValue", "pipelineId", "pipelineStageId", "contactId",
+                      "assignedTo", "source", "createdAt", "updatedAt"],
+    "records": ["id", "objectKey", "properties", "owner", "followers", "createdAt", "updatedAt"],
+}
+
+PageSource = Iterator[Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]]
+
+def _open_at(path: Path, offset: Optional[int]):
+    """Opens `path` for binary writing, truncated to `offset` (a fresh file when None)."""
+    if offset is None:
+        return open(path, "wb")
+    f = open(path, "r+b")
+    # Drops whatever a crash left after the last checkpoint
+    f.truncate(offset)
+    f.seek(offset)
+    return f
+
+class JSONLSink:
+    """Writes one JSON object per line."""
+    # Output can be truncated to a checkpoint offset and appended to
+    resumable = True
+
+    def __init__(self, path: Union[str, Path], fields: Optional[List[str]] = None, offset: Optional[int] = None):
+        self._file = _open_at(Path(path), offset)
+
+    def write(self, items: List[Dict[str, Any]]) -> None:
+        for item in items:
+            self._file.write(codec.dump_bytes(item) + b"\n")
+
+    def checkpoint(self) -> int:
+        """Forces written rows to disk and returns the resume offset."""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        return self._file.tell()
+
+    def close(self) -> None:
+        self._file.close()
+
+    def abort(self) -> None:
+        # Everything up to the last checkpoint stays for the next run
+        self.close()
+
+class CSVSink(JSONLSink):
+    """Writes a header row and then one row per item with the given columns.
+
+    Lists of plain values (e.g. tags) are joined with commas; any other nested
+    value is written as JSON.
+    """
+
+    def __init__(self, path: Union[str, Path], fields: List[str], offset: Optional[int] = None):
+        super().__init__(path, fields, offset)
+        self.fields = fields
+        self._text = io.TextIOWrapper(self._file, encoding="utf-8", newline="", write_through=True)
+        self._writer = csv.writer(self._text)
+        if not offset:
+            self._writer.writerow(self.fields)
+
+    @staticmethod
+    def _cell(value: Any) -> Any:
+        if value is None:
+            return ""
+        if isinstance(value, list) and all(not isinstance(v, (dict, list)) for v in value):
+            return ",".join(str(v) for v in value)
+        if isinstance(value, (dict, list)):
+            return json.dumps(value)
+        return value
+
+    def write(self, items: List[Dict[str, Any]]) -> None:
+        self._writer.writerows([self._cell(item.get(field)) for field in self.fields] for item in items)
+
+    def close(self) -> None:
+        self._text.close()
+
+SINKS = {"jsonl": JSONLSink, "csv": CSVSink}
+
+class ExportState:
+    """Checkpoint file recording where an interrupted export should pick up.
+
+    It holds the cursor of the next page, the rows written so far and the byte
+    offset of the output at that point. It is replaced atomically after every
+    page and removed once the export finishes.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        if not self.path.exists():
+            return None
+        with open(self.path, "r") as f:
+            return json.load(f)
+
+    def save(self, state: Dict[str, Any]) -> None:
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp, "w") as f:
+            json.dump(state, f)
+        os.replace(tmp, self.path)
+
+    def clear(self) -> None:
+        if self.path.exists():
+            self.path.unlink()
+
+def open_sink(fmt: str, path: Union[str, Path], fields: Optional[List[str]], offset: Optional[int], resource: str):
+    if fmt == "parquet":
+        # Imported here so pyarrow stays optional
+        from .parquet import ParquetSink
+        return ParquetSink(path, fields, offset, resource)
+    if fmt not in SINKS:
+        raise ValueError(f"Unsupported format: {fmt}")
+    return SINKS[fmt](path, fields or CSV_COLUMNS[resource], offset)
+
+def run_export(pages: Iterator[Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]], sink: JSONLSink,
+               state: ExportState, settings: Dict[str, Any], rows: int = 0) -> Dict[str, Any]:
+    """Writes each (items, next position) page to `sink`, checkpointing after every page."""
+    pages_written = 0
+    try:
+        for items, position in pages:
+            sink.write(items)
+            rows += len(items)
+            pages_written += 1
+            if sink.resumable:
+                state.save({**settings, "position": position, "rows": rows, "offset": sink.checkpoint()})
+    except BaseException:
+        sink.abort()
+        raise
+    sink.close()
+    state.clear()
+    return {"rows": rows, "pages": pages_written}
+
+def _select(items: List[Dict[str, Any]], fields: Optional[str]) -> List[Dict[str, Any]]:
+    # Compiled once per export and cached; nested paths become flat keys such as "attributionSource.medium"
+    return project(items, fields)
+
+def _cursor_source(iter_pages: Callable[[Optional[int], Optional[str]], Iterator[Dict[str, Any]]], key: str,
+                   prefetch_depth: int) -> Callable[[Optional[Dict[str, Any]]], PageSource]:
+    """Page source for endpoints paged with the startAfter/startAfterId cursor."""
+    def source(position: Optional[Dict[str, Any]]) -> PageSource:
+        position = position or {}
+        for page in prefetch(iter_pages(position.get("startAfter"), position.get("startAfterId")), prefetch_depth):
+            meta = page.get("meta") or {}
+            # None marks the end: there is nothing left to resume from
+            following = {"startAfter": meta.get("startAfter"), "startAfterId": meta.get("startAfterId")} if meta.get("startAfterId") else None
+            yield page.get(key, []), following
+    return source
+
+def _export(resource: str, source: Callable[[Optional[Dict[str, Any]]], PageSource], out: Union[str, Path], fmt: str,
+            fields: Optional[str], filters: Dict[str, Any], state_path: Optional[Union[str, Path]], restart: bool) -> Dict[str, Any]:
+    state = ExportState(state_path or f"{out}.cursor")
+    settings = {"resource": resource, "format": fmt, "fields": fields, **filters}
+    saved = None if restart or fmt == "parquet" else state.load()
+    if saved is not None and {k: saved.get(k) for k in settings} != settings:
+        raise ValueError(f"{state.path} belongs to a different export; remove it or pass restart=True")
+
+    sink = open_sink(fmt, out, [f.strip() for f in fields.split(",") if f.strip()] if fields else None, saved["offset"] if saved else None, resource)
+    if saved is not None and saved["position"] is None:
+        # Interrupted after the last page was written
+        pages = iter(())
+    else:
+        pages = ((_select(items, fields), position) for items, position in source(saved["position"] if saved else None))
+    result = run_export(pages, sink, state, settings, saved["rows"] if saved else 0)
+    result["resumed"] = saved is not None
+    return result
+
+def export_contacts(client: GHLClient, out: Union[str, Path], fmt: str = "jsonl", fields: Optional[str] = None,
+                    query: Optional[str] = None, state_path: Optional[Union[str, Path]] = None, restart: bool = False,
+                    page_size: int = contacts.MAX_PAGE_SIZE, prefetch_depth: int = DEFAULT_PREFETCH) -> Dict[str, Any]:
+    """Streams every contact to `out` a page at a time, so memory does not grow with the location.
+
+    Progress is checkpointed to `state_path` (default: OUT.cursor). Calling again
+    with the same arguments after an interruption resumes from the last page
+    written; `restart=True` starts over. Parquet exports always start over.
+    """
+    source = _cursor_source(
+        lambda after, after_id: contacts.iter_contact_pages(client, page_size, query, after, after_id), "contacts", prefetch_depth
+    )
+    return _export("contacts", source, out, fmt, fields, {"query": query}, state_path, restart)
+
+def export_opportunities(client: GHLClient, out: Union[str, Path], fmt: str = "jsonl", fields: Optional[str] = None,
+                         query: Optional[str] = None, pipeline_id: Optional[str] = None, status: Optional[str] = None,
+                         state_path: Optional[Union[str, Path]] = None, restart: bool = False,
+                         page_size: int = opportunities.MAX_PAGE_SIZE, prefetch_depth: int = DEFAULT_PREFETCH) -> Dict[str, Any]:
+    """Streams every matching opportunity to `out`; see export_contacts()."""
+    source = _cursor_source(
+        lambda after, after_id: opportunities.iter_opportunity_pages(client, page_size, query, pipeline_id, status, after, after_id),
+        "opportunities", prefetch_depth,
+    )
+    filters = {"query": query, "pipeline_id": pipeline_id, "status": status}
+    return _export("opportunities", source, out, fmt, fields, filters, state_path, restart)
+
+def export_records(client: GHLClient, schema_key: str, out: Union[str, Path], fmt: str = "jsonl", fields: Optional[str] = None,
+                   query: Optional[str] = None, state_path: Optional[Union[str, Path]] = None, restart: bool = False,
+                   page_size: int = objects.MAX_PAGE_SIZE, prefetch_depth: int = DEFAULT_PREFETCH) -> Dict[str, Any]:
+    """Streams every record of a custom object schema to `out`; see export_contacts()."""
+    def source(position: Optional[Dict[str, Any]]) -> PageSource:
+        start = (position or {}).get("page", 1)
+        pages = objects.iter_record_pages(client, schema_key, page_size, query, start_page=start)
+        for number, page in enumerate(prefetch(pages, prefetch_depth), start):
+            yield page.get("records", []), None if objects._is_last_page(page, number, page_size) else {"page": number + 1}
+
+    return _export("records", source, out, fmt, fields, {"schema_key": schema_key, "query": query}, state_path, restart)
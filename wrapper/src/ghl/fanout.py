@@ -0,0 +1,103 @@
+import asyncio
+from typing import Optional, Dict, Any, List, Iterable, Tuple, Callable, AsyncIterator, AsyncContextManager
+from .client import AsyncGHLClient
+from .endpoints.aio import locations, oauth
+from .location_tokens import LocationTokenManager
+
+DEFAULT_CONCURRENCY = 16
+
+# Results queued ahead of the consumer, per worker
+_BUFFER_PER_WORKER = 4
+
+_DONE = object()
+
+# call(client) returns either an awaitable (one result per location) or an async
+# iterator (one result per item, e.g. iter_contacts)
+Call = Callable[[AsyncGHLClient], Any]
+
+def _location_client(agency: AsyncGHLClient, tokens: Optional[LocationTokenManager], location_id: str,
+                     company_id: Optional[str]) -> AsyncContextManager[AsyncGHLClient]:
+    if tokens is not None:
+        return tokens.lease(location_id, company_id)
+    # The agency key itself (private integration keys that can read every location)
+    return AsyncGHLClient(agency.api_key, location_id, rate_limiter=agency.rate_limiter,
+                          retry_policy=agency.retry_policy, cache=agency.cache)
+
+async def _targets(agency: AsyncGHLClient, location_ids: Optional[Iterable[str]], company_id: Optional[str],
+                   app_id: Optional[str]) -> List[Tuple[str, Optional[str]]]:
+    if location_ids is not None:
+        return [(location_id, company_id) for location_id in location_ids]
+    if app_id:
+        found = await oauth.list_all_installed_locations(agency, company_id, app_id)
+    else:
+        found = await locations.list_all_locations(agency, company_id=company_id)
+    # /oauth/installedLocations names the ID "_id"
+    return [(location.get("id") or location["_id"], location.get("companyId") or company_id) for location in found]
+
+async def _run_location(agency: AsyncGHLClient, tokens: Optional[LocationTokenManager], call: Call, location_id: str,
+                        company_id: Optional[str], results: asyncio.Queue) -> None:
+    try:
+        async with _location_client(agency, tokens, location_id, company_id) as client:
+            outcome = call(client)
+            if hasattr(outcome, "__aiter__"):
+                async for item in outcome:
+                    await results.put({"locationId": location_id, "data": item})
+            else:
+                await results.put({"locationId": location_id, "data": await outcome})
+    except Exception as e:
+        await results.put({"locationId": location_id, "error": str(e)})
+
+async def fan_out(agency: AsyncGHLClient, call: Call, location_ids: Optional[Iterable[str]] = None,
+                  company_id: Optional[str] = None, concurrency: int = DEFAULT_CONCURRENCY,
+                  location_tokens: bool = True, app_id: Optional[str] = None,
+                  tokens: Optional[LocationTokenManager] = None) -> AsyncIterator[Dict[str, Any]]:
+    """Runs call(client) for many locations at once, yielding results as they arrive.
+
+    Without location_ids, every location of the company is listed first (with
+    app_id, only those where the app is installed). Each location gets its own
+    client, and so its own bucket in the agency's RateLimiter: a busy location
+    waits on its own limit, not the others'. Results are {"locationId", "data"},
+    or {"locationId", "error"} for a location that failed; a failure does not stop
+    the others.
+
+    With location_tokens, clients are leased from `tokens`, so tokens minted by an
+    earlier fan-out are reused; without one, a LocationTokenManager is made for
+    this run (keeping its tokens in the agency client's token store, if any).
+    """
+    pending: "asyncio.Queue[Tuple[str, Optional[str]]]" = asyncio.Queue()
+    for target in await _targets(agency, location_ids, company_id, app_id):
+        pending.put_nowait(target)
+    if pending.empty():
+        return
+    workers_count = min(concurrency, pending.qsize())
+    results: asyncio.Queue = asyncio.Queue(maxsize=workers_count * _BUFFER_PER_WORKER)
+    manager = None
+    if location_tokens:
+        manager = tokens
+        if manager is None:
+            # Each location is visited once, so only the ones in flight need a warm client
+            manager = LocationTokenManager(agency, company_id, max_locations=workers_count, token_store=agency.token_store)
+
+    async def worker() -> None:
+        while not pending.empty():
+            location_id, company = pending.get_nowait()
+            await _run_location(agency, manager, call, location_id, company, results)
+
+    async def supervise() -> None:
+        try:
+            await asyncio.gather(*(worker() for _ in range(workers_count)))
+        finally:
+            await results.put(_DONE)
+
+    task = asyncio.create_task(supervise())
+    try:
+        while True:
+            result = await results.get()
+            if result is _DONE:
+                break
+            yield result
+        await task
+    finally:
+        task.cancel()
+        if manager is not None and manager is not tokens:
+            await manager.aclose()
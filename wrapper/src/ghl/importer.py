@@ -0,0 +1,143 @@
+import asyncio
+import csv
+import json
+from pathlib import Path
+from typing import Optional, Dict, Any, Iterable, Iterator, Tuple, Union, TextIO
+from .client import AsyncGHLClient
+from .endpoints.aio import contacts
+
+DEFAULT_CONCURRENCY = 8
+
+# CSV columns that hold comma-separated lists
+LIST_COLUMNS = ("tags",)
+
+def detect_format(path: Union[str, Path]) -> str:
+    suffix = Path(path).suffix.lower()
+    if suffix == ".csv":
+        return "csv"
+    if suffix in (".jsonl", ".ndjson"):
+        return "jsonl"
+    raise ValueError(f"Cannot tell the format of {path}; pass csv or jsonl explicitly")
+
+def _csv_contact(row: Dict[str, Optional[str]]) -> Dict[str, Any]:
+    contact: Dict[str, Any] = {}
+    for column, value in row.items():
+        if column is None or value is None or value.strip() == "":
+            continue
+        value = value.strip()
+        if column in LIST_COLUMNS:
+            contact[column] = [item.strip() for item in value.split(",") if item.strip()]
+        else:
+            contact[column] = value
+    return contact
+
+def read_rows(source: TextIO, fmt: str) -> Iterator[Tuple[int, Union[Dict[str, Any], Exception]]]:
+    """Streams (row index, contact) pairs from CSV or JSONL without loading the file.
+
+    A row that cannot be parsed is yielded as the exception, so the import can
+    report it and carry on. Row indices are stable across runs, which is what the
+    journal relies on.
+    """
+    if fmt == "csv":
+        for index, row in enumerate(csv.DictReader(source)):
+            yield index, _csv_contact(row)
+    elif fmt == "jsonl":
+        for index, line in enumerate(source):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError as e:
+                yield index, e
+                continue
+            yield index, row if isinstance(row, dict) else ValueError("Expected a JSON object")
+    else:
+        raise ValueError(f"Unsupported format: {fmt}")
+
+class ImportJournal:
+    """Append-only checkpoint of the row indices that were imported successfully.
+
+    Every index is flushed as soon as its upsert succeeds, so after a crash a
+    rerun with the same journal skips straight to the rows that are left.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.done = set()
+        if self.path.exists():
+            text = self.path.read_text()
+            # A crash can leave a half-written last line; drop it before appending
+            complete = text[:text.rfind("\n") + 1]
+            if complete != text:
+                self.path.write_text(complete)
+            self.done.update(int(line) for line in complete.split() if line.isdigit())
+        self._file = open(self.path, "a")
+
+    def record(self, index: int) -> None:
+        self.done.add(index)
+        self._file.write(f"{index}\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+async def _upsert_row(client: AsyncGHLClient, index: int, row: Union[Dict[str, Any], Exception]) -> Dict[str, Any]:
+    if isinstance(row, Exception):
+        return {"row": index, "status": "error", "error": f"Invalid row: {row}"}
+
+    if client.location_id and "locationId" not in row:
+        row = {**row, "locationId": client.location_id}
+    try:
+        data = await contacts.upsert_contact(client, row)
+    except Exception as e:
+        return {"row": index, "status": "error", "error": str(e)}
+
+    return {
+        "row": index,
+        "status": "created" if data.get("new") else "updated",
+        "id": (data.get("contact") or {}).get("id"),
+    }
+
+async def import_contacts(client: AsyncGHLClient, rows: Iterable[Tuple[int, Union[Dict[str, Any], Exception]]],
+                          concurrency: int = DEFAULT_CONCURRENCY, journal: Optional[ImportJournal] = None,
+                          report: Optional[TextIO] = None) -> Dict[str, int]:
+    """Upserts rows through POST /contacts/upsert with `concurrency` workers.
+
+    Rows are pulled lazily through a small queue, so memory stays flat however
+    large the input is; pacing is left to the client's rate limiter and retry
+    policy. Rows already in `journal` are skipped. One JSON line per processed
+    row goes to `report`, in completion order. Returns counts per outcome.
+    """
+    summary = {"created": 0, "updated": 0, "failed": 0, "skipped": 0}
+    queue: "asyncio.Queue[Optional[tuple]]" = asyncio.Queue(maxsize=concurrency * 2)
+
+    async def worker() -> None:
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            result = await _upsert_row(client, *item)
+            if result["status"] == "error":
+                summary["failed"] += 1
+            else:
+                summary[result["status"]] += 1
+                if journal is not None:
+                    journal.record(result["row"])
+            if report is not None:
+                report.write(json.dumps(result) + "\n")
+
+    workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+    try:
+        for index, row in rows:
+            if journal is not None and index in journal.done:
+                summary["skipped"] += 1
+                continue
+            await queue.put((index, row))
+        for _ in workers:
+            await queue.put(None)
+        await asyncio.gather(*workers)
+    finally:
+        for task in workers:
+            task.cancel()
+
+    return summary
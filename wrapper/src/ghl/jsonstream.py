@@ -0,0 +1,133 @@
+import re
+from typing import Optional, Any, List, Sequence, Iterable, Iterator
+from . import codec
+
+# A whole string, or a character that changes the parser's state; everything else is
+# skipped in bulk. A lone `"` is a string that has not fully arrived yet.
+_TOKEN = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"|["{}\[\],]', re.S)
+
+_OUTSIDE, _ARRAY = "outside", "array"
+
+class ArrayStream:
+    """Incremental parser yielding the elements of one array inside a JSON document.
+
+    `path` names the array by the object keys leading to it, e.g.
+    ("messages", "messages") for {"messages": {"nextPage": true, "messages": [...]}};
+    an empty path is a top-level array. Feed it byte chunks as they arrive: each
+    element is decoded (with ghl.codec) as soon as its closing byte is seen, so
+    memory holds one element and one chunk, not the whole body.
+
+    Everything outside the array is kept, with the array emptied, and returned
+    by close() (for pagination fields such as meta or nextPage).
+    """
+
+    def __init__(self, path: Sequence[str] = ()):
+        self.path = list(path)
+        self.found = False
+        self._buf = bytearray()
+        self._pos = 0
+        self._mode = _OUTSIDE
+        # Containers enclosing the position, outside the array: [is_object, last key, expecting a key]
+        self._stack: List[list] = []
+        self._skeleton = bytearray()
+        self._copied = 0
+        # Inside the array: where the current element starts, and its nesting depth
+        self._start = 0
+        self._depth = 0
+
+    def _at_target(self) -> bool:
+        return (not self.found and len(self._stack) == len(self.path)
+                and all(is_object and key == want for (is_object, key, _), want in zip(self._stack, self.path)))
+
+    def _element(self, end: int) -> List[Any]:
+        raw = bytes(self._buf[self._start:end])
+        self._start = end + 1
+        return [codec.loads(raw)] if raw.strip() else []
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """Consumes a chunk and returns the elements it completed."""
+        self._buf += chunk
+        buf = self._buf
+        items: List[Any] = []
+        pos = self._pos
+
+        while True:
+            m = _TOKEN.search(buf, pos)
+            if m is None:
+                pos = len(buf)
+                break
+            i, end = m.span()
+            c = buf[i]
+
+            if c == 0x22:  # "
+                if end == i + 1:
+                    # Resume at the opening quote once more bytes arrive
+                    pos = i
+                    break
+                if self._mode == _OUTSIDE and self._stack and self._stack[-1][0] and self._stack[-1][2]:
+                    self._stack[-1][1] = codec.loads(bytes(buf[i:end]))
+                    self._stack[-1][2] = False
+                pos = end
+                continue
+
+            pos = i + 1
+            if self._mode == _ARRAY:
+                if c in b"{[":
+                    self._depth += 1
+                elif c in b"}]" and self._depth:
+                    self._depth -= 1
+                elif c == 0x2C:  # , between elements
+                    if not self._depth:
+                        items.extend(self._element(i))
+                elif c == 0x5D:  # ] closing the array
+                    items.extend(self._element(i))
+                    self._mode = _OUTSIDE
+                    self._copied = i
+                continue
+
+            if c == 0x5B and self._at_target():  # [
+                self.found = True
+                self._skeleton += buf[self._copied:i + 1]
+                self._mode = _ARRAY
+                self._start = i + 1
+                self._depth = 0
+            elif c == 0x7B:  # {
+                self._stack.append([True, None, True])
+            elif c == 0x5B:
+                self._stack.append([False, None, False])
+            elif c in b"}]":
+                if self._stack:
+                    self._stack.pop()
+            elif c == 0x2C and self._stack and self._stack[-1][0]:
+                self._stack[-1][2] = True
+
+        # Drop what is no longer needed: copy the skeleton forward and keep an unfinished element
+        if self._mode == _OUTSIDE:
+            self._skeleton += buf[self._copied:pos]
+            keep = pos
+        else:
+            keep = self._start
+        del buf[:keep]
+        self._pos = pos - keep
+        self._copied = 0
+        self._start -= keep if self._mode == _ARRAY else 0
+        return items
+
+    def close(self) -> Any:
+        """Checks the document ended cleanly and returns the rest of it (the array left empty)."""
+        if self._mode == _ARRAY or self._stack or self._buf.strip():
+            raise ValueError("Truncated JSON document")
+        return codec.loads(bytes(self._skeleton)) if self._skeleton.strip() else None
+
+def iter_array(chunks: Iterable[bytes], path: Sequence[str] = (), rest: Optional[dict] = None) -> Iterator[Any]:
+    """Yields the elements of the array at `path` from an iterable of byte chunks.
+
+    When `rest` is given it is updated, once the document is complete, with the
+    top-level fields outside the array.
+    """
+    parser = ArrayStream(path)
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    remainder = parser.close()
+    if rest is not None and isinstance(remainder, dict):
+        rest.update(remainder)
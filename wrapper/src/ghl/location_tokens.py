@@ -0,0 +1,203 @@
+import asyncio
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager, suppress
+from typing import Optional, Dict, Any, List, AsyncIterator
+from .client import AsyncGHLClient
+from .tokens import TokenStore
+from .endpoints.aio import oauth
+
+# Locations kept warm (token and client) before the least recently used idle one is dropped
+DEFAULT_MAX_LOCATIONS = 256
+
+# The background task re-mints tokens this many seconds before they expire...
+REFRESH_AHEAD = 600.0
+# ...checking this often
+REFRESH_INTERVAL = 60.0
+# Token exchanges one background refresh runs at once
+REFRESH_CONCURRENCY = 8
+
+class _LocationClient(AsyncGHLClient):
+    """A leased location client. It has no app credentials for the OAuth refresh
+    grant, so refreshing it (when its token runs out mid-lease, or on a 401) mints
+    a new location token through the manager instead."""
+
+    def __init__(self, manager: "LocationTokenManager", location_id: str, token: Dict[str, Any]):
+        super().__init__(token["access_token"], location_id, rate_limiter=manager.agency.rate_limiter,
+                         retry_policy=manager.agency.retry_policy)
+        self._manager = manager
+
+    def _can_refresh(self) -> bool:
+        return True
+
+    async def refresh_access_token(self) -> Dict[str, Any]:
+        return await self._manager._renew(self.location_id, self.api_key)
+
+class _Location:
+    def __init__(self, company_id: Optional[str]):
+        self.company_id = company_id
+        self.client: Optional[_LocationClient] = None
+        self.leases = 0
+        # Held while the token is exchanged, so concurrent leases share one exchange
+        self.lock = asyncio.Lock()
+
+class LocationTokenManager:
+    """Location tokens minted from one agency token, each with a warm AsyncGHLClient.
+
+    lease(location_id) hands out the location's pooled client, exchanging the
+    agency token through /oauth/locationToken on first use. Tokens are kept with
+    their expiry and re-minted by a background task before they run out, so
+    callers do not wait on an exchange once a location is warm. Every client shares
+    the agency client's RateLimiter (one bucket per location) and retry policy.
+
+    At most max_locations are kept; beyond that the least recently used location
+    that is not leased is dropped and its client closed. With a TokenStore, tokens
+    also outlive the process, and the next run skips their exchange.
+    """
+
+    def __init__(self, agency: AsyncGHLClient, company_id: Optional[str] = None,
+                 max_locations: int = DEFAULT_MAX_LOCATIONS, token_store: Optional[TokenStore] = None,
+                 refresh_ahead: float = REFRESH_AHEAD, refresh_interval: float = REFRESH_INTERVAL):
+        self.agency = agency
+        self.company_id = company_id
+        self.max_locations = max_locations
+        self.token_store = token_store
+        self.refresh_ahead = refresh_ahead
+        self.refresh_interval = refresh_interval
+        self._locations: "OrderedDict[str, _Location]" = OrderedDict()
+        self._refresher: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self._locations)
+
+    async def __aenter__(self) -> "LocationTokenManager":
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    def start(self) -> None:
+        """Starts the background refresh (lease() does this on first use)."""
+        if self._refresher is None:
+            self._refresher = asyncio.create_task(self._refresh_loop())
+
+    async def aclose(self) -> None:
+        if self._refresher is not None:
+            self._refresher.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._refresher
+            self._refresher = None
+        locations = list(self._locations.values())
+        self._locations.clear()
+        await asyncio.gather(*(location.client.aclose() for location in locations if location.client is not None))
+
+    async def installed_locations(self, app_id: str, company_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Locations of the company where the app is installed, i.e. those it can mint tokens for."""
+        return await oauth.list_all_installed_locations(self.agency, company_id or self.company_id, app_id)
+
+    @asynccontextmanager
+    async def lease(self, location_id: str, company_id: Optional[str] = None) -> AsyncIterator[AsyncGHLClient]:
+        """The location's client, with a token that is good for at least the client's
+        REFRESH_MARGIN. The client stays open (and the location cached) after the block;
+        a leased location is never evicted."""
+        self.start()
+        location = self._locations.get(location_id)
+        if location is None:
+            location = self._locations[location_id] = _Location(company_id or self.company_id)
+        self._locations.move_to_end(location_id)
+        location.leases += 1
+        try:
+            await self._ensure(location_id, location, AsyncGHLClient.REFRESH_MARGIN)
+            yield location.client
+        finally:
+            location.leases -= 1
+            await self._evict()
+
+    async def refresh_expiring(self) -> int:
+        """Re-mints tokens expiring within refresh_ahead; returns how many were due."""
+        due = [(location_id, location) for location_id, location in list(self._locations.items())
+               if location.client is not None and self._stale(location, self.refresh_ahead)]
+        semaphore = asyncio.Semaphore(REFRESH_CONCURRENCY)
+
+        async def refresh(location_id: str, location: _Location) -> None:
+            async with semaphore:
+                try:
+                    await self._ensure(location_id, location, self.refresh_ahead)
+                except Exception:
+                    # Tried again next round, and by lease() once the token is about to expire
+                    pass
+
+        await asyncio.gather(*(refresh(*item) for item in due))
+        return len(due)
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            await self.refresh_expiring()
+
+    @staticmethod
+    def _stale(location: _Location, ahead: float) -> bool:
+        client = location.client
+        if client is None:
+            return True
+        return client.token_expires_at is not None and time.time() >= client.token_expires_at - ahead
+
+    async def _ensure(self, location_id: str, location: _Location, ahead: float) -> None:
+        async with location.lock:
+            # Another lease or the refresher may have exchanged it while we waited
+            if not self._stale(location, ahead):
+                return
+            self._apply(location_id, location, await self._exchange(location_id, location.company_id))
+
+    async def _renew(self, location_id: str, stale_token: str) -> Dict[str, Any]:
+        """A new token for a leased client whose stale_token expired or was rejected."""
+        location = self._locations.get(location_id)
+        if location is None or location.client is None:
+            raise RuntimeError(f"Location {location_id} is no longer managed")
+        async with location.lock:
+            if location.client.api_key == stale_token:
+                self._apply(location_id, location, await self._exchange(location_id, location.company_id, stale_token))
+            return {"access_token": location.client.api_key, "expires_at": location.client.token_expires_at}
+
+    def _apply(self, location_id: str, location: _Location, token: Dict[str, Any]) -> None:
+        # The refresh token stays in the store only: the client renews through _renew
+        token = {k: v for k, v in token.items() if k != "refresh_token"}
+        if location.client is None:
+            location.client = _LocationClient(self, location_id, token)
+        location.client._apply_token(token)
+
+    def _store_key(self, company_id: str, location_id: str) -> str:
+        return f"location:{company_id}:{location_id}"
+
+    async def _exchange(self, location_id: str, company_id: Optional[str],
+                        stale_token: Optional[str] = None) -> Dict[str, Any]:
+        if not company_id:
+            raise ValueError(f"A companyId is needed to mint a token for location {location_id}")
+        key = self._store_key(company_id, location_id)
+        if self.token_store is not None:
+            stored = await asyncio.to_thread(self.token_store.load, key)
+            if (stored and stored["access_token"] != stale_token
+                    and (stored["expires_at"] is None or stored["expires_at"] - time.time() > self.refresh_ahead)):
+                return stored
+
+        try:
+            token = await oauth.get_location_token(self.agency, company_id, location_id)
+        except Exception as e:
+            raise RuntimeError(f"Location token for {location_id}: {e}") from e
+        if self.token_store is not None:
+            # Saved after the exchange: holding the store's write lock across it
+            # would make concurrent exchanges wait on each other
+            token = await asyncio.to_thread(self._save, key, token)
+        return token
+
+    def _save(self, key: str, token: Dict[str, Any]) -> Dict[str, Any]:
+        with self.token_store.acquire(key) as lease:
+            return lease.save(token)
+
+    async def _evict(self) -> None:
+        closing = []
+        idle = [location_id for location_id, location in self._locations.items() if location.leases == 0]
+        while len(self._locations) > self.max_locations and idle:
+            closing.append(self._locations.pop(idle.pop(0)))
+        await asyncio.gather(*(location.client.aclose() for location in closing if location.client is not None))
@@ -0,0 +1,511 @@
+import json
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Iterable, Iterator, Callable, Union
+from . import codec
+from .client import GHLClient
+from .endpoints import contacts, opportunities, calendars, objects
+from .pagination import prefetch
+from .search import compile_query, reverse_email, phone_digits
+
+RESOURCES = ("contacts", "opportunities", "pipelines", "calendars", "records")
+
+_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS contacts (
+        location_id TEXT NOT NULL,
+        id TEXT NOT NULL,
+        name TEXT,
+        email TEXT,
+        phone TEXT,
+        date_added TEXT,
+        date_updated TEXT,
+        synced_at REAL NOT NULL,
+        data TEXT NOT NULL,
+        email_reversed TEXT,
+        phone_digits TEXT,
+        company TEXT,
+        tags TEXT,
+        PRIMARY KEY (location_id, id)
+    );
+    CREATE INDEX IF NOT EXISTS contacts_date_added ON contacts (location_id, date_added);
+    CREATE TABLE IF NOT EXISTS opportunities (
+        location_id TEXT NOT NULL,
+        id TEXT NOT NULL,
+        name TEXT,
+        pipeline_id TEXT,
+        status TEXT,
+        updated_at TEXT,
+        synced_at REAL NOT NULL,
+        data TEXT NOT NULL,
+        PRIMARY KEY (location_id, id)
+    );
+    CREATE INDEX IF NOT EXISTS opportunities_pipeline ON opportunities (location_id, pipeline_id, status);
+    CREATE TABLE IF NOT EXISTS pipelines (
+        location_id TEXT NOT NULL,
+        id TEXT NOT NULL,
+        synced_at REAL NOT NULL,
+        data TEXT NOT NULL,
+        PRIMARY KEY (location_id, id)
+    );
+    CREATE TABLE IF NOT EXISTS calendars (
+        location_id TEXT NOT NULL,
+        id TEXT NOT NULL,
+        synced_at REAL NOT NULL,
+        data TEXT NOT NULL,
+        PRIMARY KEY (location_id, id)
+    );
+    CREATE TABLE IF NOT EXISTS records (
+        location_id TEXT NOT NULL,
+        schema_key TEXT NOT NULL,
+        id TEXT NOT NULL,
+        updated_at TEXT,
+        synced_at REAL NOT NULL,
+        data TEXT NOT NULL,
+        PRIMARY KEY (location_id, schema_key, id)
+    );
+    CREATE TABLE IF NOT EXISTS sync_state (
+        location_id TEXT NOT NULL,
+        resource TEXT NOT NULL,
+        cursor TEXT,
+        high_water TEXT,
+        synced_at REAL NOT NULL,
+        PRIMARY KEY (location_id, resource)
+    );
+"""
+
+# Bumped whenever _SEARCH_SCHEMA changes; older files are upgraded on open
+SCHEMA_VERSION = 1
+
+# Search index over contacts, kept current by triggers: B-tree indexes for
+# field lookups, a tag table and an FTS5 table (external content, so the text
+# is not stored twice). Email and tags are stored lower-cased; phone as digits.
+_SEARCH_SCHEMA = [
+    "CREATE INDEX IF NOT EXISTS contacts_email ON contacts (location_id, email)",
+    "CREATE INDEX IF NOT EXISTS contacts_email_reversed ON contacts (location_id, email_reversed)",
+    "CREATE INDEX IF NOT EXISTS contacts_phone ON contacts (location_id, phone_digits)",
+    """CREATE TABLE IF NOT EXISTS contact_tags (
+        location_id TEXT NOT NULL,
+        tag TEXT NOT NULL,
+        contact_id TEXT NOT NULL,
+        PRIMARY KEY (location_id, tag, contact_id)
+    ) WITHOUT ROWID""",
+    """CREATE VIRTUAL TABLE IF NOT EXISTS contacts_fts USING fts5(
+        name, email, phone, company, tags, content='contacts', content_rowid='rowid', prefix='2 3'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS contacts_index_insert AFTER INSERT ON contacts BEGIN
+        INSERT INTO contacts_fts (rowid, name, email, phone, company, tags)
+            VALUES (new.rowid, new.name, new.email, new.phone, new.company, new.tags);
+        INSERT OR IGNORE INTO contact_tags (location_id, tag, contact_id)
+            SELECT new.location_id, lower(trim(value)), new.id FROM json_each(new.data, '$.tags')
+            WHERE json_type(new.data, '$.tags') = 'array' AND trim(value) != '';
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS contacts_index_delete AFTER DELETE ON contacts BEGIN
+        INSERT INTO contacts_fts (contacts_fts, rowid, name, email, phone, company, tags)
+            VALUES ('delete', old.rowid, old.name, old.email, old.phone, old.company, old.tags);
+        DELETE FROM contact_tags WHERE location_id = old.location_id AND contact_id = old.id;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS contacts_index_update AFTER UPDATE ON contacts BEGIN
+        INSERT INTO contacts_fts (contacts_fts, rowid, name, email, phone, company, tags)
+            VALUES ('delete', old.rowid, old.name, old.email, old.phone, old.company, old.tags);
+        INSERT INTO contacts_fts (rowid, name, email, phone, company, tags)
+            VALUES (new.rowid, new.name, new.email, new.phone, new.company, new.tags);
+        DELETE FROM contact_tags WHERE location_id = old.location_id AND contact_id = old.id;
+        INSERT OR IGNORE INTO contact_tags (location_id, tag, contact_id)
+            SELECT new.location_id, lower(trim(value)), new.id FROM json_each(new.data, '$.tags')
+            WHERE json_type(new.data, '$.tags') = 'array' AND trim(value) != '';
+    END""",
+]
+
+# Columns the search index adds to contacts tables created before it existed
+_SEARCH_COLUMNS = ("email_reversed", "phone_digits", "company", "tags")
+
+# Rows per transaction when loading an export file
+LOAD_BATCH = 1000
+
+# Seconds subtracted from the start of a contacts walk to give its high-water mark,
+# so edits are not missed when the local clock runs ahead of the API's
+HIGH_WATER_OVERLAP = 300.0
+
+def _iso(epoch: float) -> str:
+    """Epoch seconds in the API's dateUpdated format, which compares correctly as text."""
+    return time.strftime("%Y-%m-%dT%H:%M:%S.000Z", time.gmtime(epoch))
+
+def _contact_name(contact: Dict[str, Any]) -> Optional[str]:
+    name = contact.get("contactName") or contact.get("name")
+    if name:
+        return name
+    parts = [contact.get("firstName"), contact.get("lastName")]
+    return " ".join(p for p in parts if p) or None
+
+def _contact_row(location: str, contact: Dict[str, Any], synced_at: float) -> tuple:
+    email = (contact.get("email") or "").strip().lower() or None
+    tags = contact.get("tags")
+    return (
+        location, contact["id"], _contact_name(contact), email, contact.get("phone"), contact.get("dateAdded"),
+        contact.get("dateUpdated"), synced_at, json.dumps(contact), reverse_email(email), phone_digits(contact.get("phone")),
+        contact.get("companyName"), " ".join(str(t) for t in tags) if isinstance(tags, list) else None,
+    )
+
+def _without_search_after(contact: Dict[str, Any]) -> Dict[str, Any]:
+    # POST /contacts/search adds its paging cursor to every contact
+    if "searchAfter" not in contact:
+        return contact
+    return {k: v for k, v in contact.items() if k != "searchAfter"}
+
+# Updates in place rather than REPLACE, which would skip the delete trigger
+_UPSERT_CONTACT = (
+    "INSERT INTO contacts (location_id, id, name, email, phone, date_added, date_updated, synced_at, data, "
+    "email_reversed, phone_digits, company, tags) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT(location_id, id) DO UPDATE SET name = excluded.name, email = excluded.email, phone = excluded.phone, "
+    "date_added = excluded.date_added, date_updated = excluded.date_updated, synced_at = excluded.synced_at, "
+    "data = excluded.data, email_reversed = excluded.email_reversed, phone_digits = excluded.phone_digits, "
+    "company = excluded.company, tags = excluded.tags"
+)
+
+class Mirror:
+    """Local SQLite copy of a location's contacts, opportunities, pipelines, calendars and object records.
+
+    sync_* methods pull from the API and commit each page together with its
+    position, so an interrupted sync loses at most one page of work. A full run
+    re-reads everything, which also drops rows deleted upstream.
+
+    Contacts are first walked with the dateAdded cursor. Once a walk completes,
+    incremental runs search for contacts whose dateUpdated is at or after the
+    high-water mark (when that walk began, then the newest dateUpdated seen),
+    which picks up edits as well as new contacts. Opportunities have no such
+    filter, so an incremental run only continues after the newest one seen;
+    edits need a full run. The small reference lists and object records are
+    always re-read in full.
+
+    The list_*/get_*/search_* methods answer from the local copy and never
+    touch the network. Contacts are also indexed for search_contacts().
+    """
+
+    def __init__(self, path: Union[str, Path], clock: Callable[[], float] = time.time):
+        self.path = Path(path)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), timeout=30.0, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        # ANALYZE samples rather than reading every row
+        self._conn.execute("PRAGMA analysis_limit=1000")
+        self._conn.executescript(_SCHEMA)
+        if self._conn.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+            self._upgrade()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def _upgrade(self) -> None:
+        """Adds the search index to a mirror file written before it existed."""
+        with self._transaction() as conn:
+            if conn.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+                # Another process got here first
+                return
+            present = {row[1] for row in conn.execute("PRAGMA table_info(contacts)")}
+            missing = [column for column in _SEARCH_COLUMNS if column not in present]
+            for column in missing:
+                conn.execute(f"ALTER TABLE contacts ADD COLUMN {column} TEXT")
+            if missing:
+                # Recompute the derived columns before the triggers exist
+                rows = conn.execute("SELECT location_id, data, synced_at FROM contacts").fetchall()
+                conn.executemany(_UPSERT_CONTACT, [_contact_row(loc, json.loads(data), at) for loc, data, at in rows])
+            for statement in _SEARCH_SCHEMA:
+                conn.execute(statement)
+            conn.execute("INSERT INTO contacts_fts (contacts_fts) VALUES ('rebuild')")
+            conn.execute("DELETE FROM contact_tags")
+            conn.execute(
+                "INSERT OR IGNORE INTO contact_tags (location_id, tag, contact_id) "
+                "SELECT c.location_id, lower(trim(t.value)), c.id FROM contacts c, json_each(c.data, '$.tags') t "
+                "WHERE json_type(c.data, '$.tags') = 'array' AND trim(t.value) != ''"
+            )
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self._analyze()
+
+    def _analyze(self) -> None:
+        """Refreshes planner statistics; without them SQLite tends to walk the dateAdded index for every search."""
+        with self._lock:
+            self._conn.execute("ANALYZE contacts")
+            self._conn.execute("ANALYZE contact_tags")
+
+    def state(self, location_id: Optional[str], resource: str) -> Optional[Dict[str, Any]]:
+        row = self._conn.execute(
+            "SELECT cursor, high_water, synced_at FROM sync_state WHERE location_id = ? AND resource = ?",
+            (location_id or "", resource),
+        ).fetchone()
+        if row is None:
+            return None
+        return {"cursor": json.loads(row[0]) if row[0] else None, "high_water": row[1], "synced_at": row[2]}
+
+    def _save_state(self, conn: sqlite3.Connection, location_id: str, resource: str,
+                    cursor: Optional[List[Any]], high_water: Optional[str], reset: bool = False) -> None:
+        """Records the sync position. high_water only moves forward unless reset (a walk starting over)."""
+        merged = "excluded.high_water" if reset else (
+            "NULLIF(MAX(COALESCE(sync_state.high_water, ''), COALESCE(excluded.high_water, '')), '')")
+        conn.execute(
+            "INSERT INTO sync_state (location_id, resource, cursor, high_water, synced_at) VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT(location_id, resource) DO UPDATE SET cursor = excluded.cursor, "
+            f"high_water = {merged}, synced_at = excluded.synced_at",
+            (location_id, resource, json.dumps(cursor) if cursor else None, high_water, self._clock()),
+        )
+
+    def status(self, location_id: Optional[str]) -> Dict[str, Any]:
+        """Row counts and last sync time per resource."""
+        location = location_id or ""
+        result = {}
+        for resource in RESOURCES:
+            count = self._conn.execute(f"SELECT COUNT(*) FROM {resource} WHERE location_id = ?", (location,)).fetchone()[0]
+            synced = self._conn.execute(
+                "SELECT MAX(synced_at) FROM sync_state WHERE location_id = ? AND (resource = ? OR resource LIKE ?)",
+                (location, resource, f"{resource}:%"),
+            ).fetchone()[0]
+            result[resource] = {"rows": count, "synced_at": synced}
+        return result
+
+    def _sync_cursor(self, location: str, resource: str, table: str, key: str,
+                     iter_pages: Callable[[Optional[int], Optional[str]], Iterator[Dict[str, Any]]],
+                     upsert: Callable[[sqlite3.Connection, List[Dict[str, Any]], float], None], full: bool,
+                     track_updates: bool = False) -> Dict[str, int]:
+        """Walks the resource with its startAfter cursor, resuming an unfinished walk.
+
+        With track_updates the cursor is cleared once the walk completes, and the
+        high-water mark is the time the walk began: everything edited since then is
+        what the next incremental run has to fetch.
+        """
+        state = None if full else self.state(location, resource)
+        cursor = state["cursor"] if state else None
+        started = self._clock()
+        begun = _iso(started - HIGH_WATER_OVERLAP) if track_updates and cursor is None else None
+        fetched = 0
+
+        for page in prefetch(iter_pages(*(cursor or (None, None)))):
+            items = page.get(key, [])
+            meta = page.get("meta") or {}
+            if meta.get("startAfterId"):
+                cursor = [meta.get("startAfter"), meta["startAfterId"]]
+            with self._transaction() as conn:
+                upsert(conn, items, started)
+                self._save_state(conn, location, resource, cursor, begun, reset=begun is not None)
+            fetched += len(items)
+
+        if track_updates:
+            with self._transaction() as conn:
+                self._save_state(conn, location, resource, None, begun, reset=begun is not None)
+        removed = self._prune(table, location, started) if full else 0
+        return {"fetched": fetched, "removed": removed}
+
+    def _sync_updated(self, location: str, resource: str, pages: Iterator[Dict[str, Any]], key: str, updated_field: str,
+                      upsert: Callable[[sqlite3.Connection, List[Dict[str, Any]], float], None]) -> Dict[str, int]:
+        """Applies pages of items sorted by updated_field ascending, moving the high-water mark up with each."""
+        started = self._clock()
+        fetched = 0
+        for page in prefetch(pages):
+            items = page.get(key, [])
+            high_water = max((i.get(updated_field) or "" for i in items), default=None) or None
+            with self._transaction() as conn:
+                upsert(conn, items, started)
+                self._save_state(conn, location, resource, None, high_water)
+            fetched += len(items)
+        return {"fetched": fetched, "removed": 0}
+
+    def _prune(self, table: str, location: str, started: float, where: str = "", args: tuple = ()) -> int:
+        """Deletes rows a full sync did not see, i.e. ones deleted upstream."""
+        with self._transaction() as conn:
+            return conn.execute(
+                f"DELETE FROM {table} WHERE location_id = ? AND synced_at < ?{where}", (location, started) + args
+            ).rowcount
+
+    def sync_contacts(self, client: GHLClient, full: bool = False) -> Dict[str, int]:
+        location = client.location_id or ""
+
+        def upsert(conn: sqlite3.Connection, items: List[Dict[str, Any]], synced_at: float) -> None:
+            conn.executemany(_UPSERT_CONTACT, [_contact_row(location, _without_search_after(c), synced_at)
+                                               for c in items if c.get("id")])
+
+        state = None if full else self.state(location, "contacts")
+        if state and state["cursor"] is None and state["high_water"]:
+            # The inclusive bound re-reads contacts updated at the mark itself; upserts make that harmless
+            pages = contacts.iter_search_pages(
+                client, filters=[contacts.contact_filter("dateUpdated", "range", {"gte": state["high_water"]})],
+                sort=[{"field": "dateUpdated", "direction": "asc"}], page_size=contacts.SEARCH_PAGE_SIZE,
+            )
+            result = self._sync_updated(location, "contacts", pages, "contacts", "dateUpdated", upsert)
+        else:
+            result = self._sync_cursor(
+                location, "contacts", "contacts", "contacts",
+                lambda after, after_id: contacts.iter_contact_pages(client, contacts.MAX_PAGE_SIZE, None, after, after_id),
+                upsert, full, track_updates=True,
+            )
+        self._analyze()
+        return result
+
+    def load_contacts(self, location_id: Optional[str], items: Iterable[Dict[str, Any]]) -> Dict[str, int]:
+        """Adds contacts from another source, such as a JSONL export, committing every LOAD_BATCH rows."""
+        location = location_id or ""
+        loaded = 0
+        batch: List[Dict[str, Any]] = []
+        for item in items:
+            if item.get("id"):
+                batch.append(item)
+            if len(batch) >= LOAD_BATCH:
+                loaded += self._load_batch(location, batch)
+                batch = []
+        if batch:
+            loaded += self._load_batch(location, batch)
+        self._analyze()
+        return {"loaded": loaded}
+
+    def _load_batch(self, location: str, items: List[Dict[str, Any]]) -> int:
+        synced_at = self._clock()
+        with self._transaction() as conn:
+            conn.executemany(_UPSERT_CONTACT, [_contact_row(location, c, synced_at) for c in items])
+        return len(items)
+
+    def sync_opportunities(self, client: GHLClient, full: bool = False) -> Dict[str, int]:
+        location = client.location_id or ""
+
+        def upsert(conn: sqlite3.Connection, items: List[Dict[str, Any]], synced_at: float) -> None:
+            conn.executemany(
+                "INSERT OR REPLACE INTO opportunities (location_id, id, name, pipeline_id, status, updated_at, synced_at, data) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [(location, o["id"], o.get("name"), o.get("pipelineId"), o.get("status"), o.get("updatedAt"),
+                  synced_at, json.dumps(o)) for o in items if o.get("id")],
+            )
+
+        return self._sync_cursor(
+            location, "opportunities", "opportunities", "opportunities",
+            lambda after, after_id: opportunities.iter_opportunity_pages(
+                client, opportunities.MAX_PAGE_SIZE, start_after=after, start_after_id=after_id
+            ),
+            upsert, full,
+        )
+
+    def _replace(self, table: str, location: str, items: Iterable[Dict[str, Any]]) -> Dict[str, int]:
+        started = self._clock()
+        rows = [(location, item["id"], started, json.dumps(item)) for item in items if item.get("id")]
+        with self._transaction() as conn:
+            conn.executemany(f"INSERT OR REPLACE INTO {table} (location_id, id, synced_at, data) VALUES (?, ?, ?, ?)", rows)
+            removed = conn.execute(f"DELETE FROM {table} WHERE location_id = ? AND synced_at < ?", (location, started)).rowcount
+            self._save_state(conn, location, table, None, None)
+        return {"fetched": len(rows), "removed": removed}
+
+    def sync_pipelines(self, client: GHLClient) -> Dict[str, int]:
+        return self._replace("pipelines", client.location_id or "", opportunities.list_pipelines(client).get("pipelines", []))
+
+    def sync_calendars(self, client: GHLClient) -> Dict[str, int]:
+        return self._replace("calendars", client.location_id or "", calendars.list_calendars(client).get("calendars", []))
+
+    def sync_records(self, client: GHLClient, schema_key: str) -> Dict[str, int]:
+        location = client.location_id or ""
+        started = self._clock()
+        fetched = 0
+        for page in prefetch(objects.iter_record_pages(client, schema_key)):
+            records = page.get("records", [])
+            with self._transaction() as conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO records (location_id, schema_key, id, updated_at, synced_at, data) VALUES (?, ?, ?, ?, ?, ?)",
+                    [(location, schema_key, r["id"], r.get("updatedAt"), started, json.dumps(r)) for r in records if r.get("id")],
+                )
+            fetched += len(records)
+
+        removed = self._prune("records", location, started, " AND schema_key = ?", (schema_key,))
+        with self._transaction() as conn:
+            self._save_state(conn, location, f"records:{schema_key}", None, None)
+        return {"fetched": fetched, "removed": removed}
+
+    def sync(self, client: GHLClient, resources: Optional[Iterable[str]] = None, full: bool = False,
+             schema_keys: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """Syncs the given resources (default: all). Records default to every custom object schema."""
+        resources = list(resources or RESOURCES)
+        unknown = set(resources) - set(RESOURCES)
+        if unknown:
+            raise ValueError(f"Unknown resources: {', '.join(sorted(unknown))}")
+
+        summary: Dict[str, Any] = {}
+        if "contacts" in resources:
+            summary["contacts"] = self.sync_contacts(client, full)
+        if "opportunities" in resources:
+            summary["opportunities"] = self.sync_opportunities(client, full)
+        if "pipelines" in resources:
+            summary["pipelines"] = self.sync_pipelines(client)
+        if "calendars" in resources:
+            summary["calendars"] = self.sync_calendars(client)
+        if "records" in resources:
+            if schema_keys is None:
+                schemas = objects.list_schemas(client).get("objects", [])
+                schema_keys = [s["key"] for s in schemas if str(s.get("key", "")).startswith("custom_objects.")]
+            summary["records"] = {key: self.sync_records(client, key) for key in schema_keys}
+        return summary
+
+    def _rows(self, sql: str, args: tuple) -> List[Dict[str, Any]]:
+        return [codec.loads(row[0]) for row in self._conn.execute(sql, args).fetchall()]
+
+    def list_contacts(self, location_id: Optional[str], limit: int = 20, query: Optional[str] = None) -> Dict[str, Any]:
+        where, args = "location_id = ?", (location_id or "",)
+        if query:
+            like = f"%{query}%"
+            where += " AND (name LIKE ? OR email LIKE ? OR phone LIKE ?)"
+            args += (like, like, like)
+        total = self._conn.execute(f"SELECT COUNT(*) FROM contacts WHERE {where}", args).fetchone()[0]
+        items = self._rows(f"SELECT data FROM contacts WHERE {where} ORDER BY date_added DESC LIMIT ?", args + (limit,))
+        return {"contacts": items, "meta": {"total": total}}
+
+    def search_contacts(self, location_id: Optional[str], query: str, limit: int = 100) -> Dict[str, Any]:
+        """Field-scoped, prefix and wildcard search over the indexed contacts; see search.compile_query()."""
+        clauses, args = compile_query(query, location_id or "")
+        where = " AND ".join(clauses)
+        total = self._conn.execute(f"SELECT COUNT(*) FROM contacts c WHERE {where}", args).fetchone()[0]
+        items = self._rows(f"SELECT c.data FROM contacts c WHERE {where} ORDER BY c.date_added DESC LIMIT ?", args + (limit,))
+        return {"contacts": items, "meta": {"total": total}}
+
+    def get_contact(self, location_id: Optional[str], contact_id: str) -> Optional[Dict[str, Any]]:
+        rows = self._rows("SELECT data FROM contacts WHERE location_id = ? AND id = ?", (location_id or "", contact_id))
+        return rows[0] if rows else None
+
+    def list_opportunities(self, location_id: Optional[str], limit: int = 20, query: Optional[str] = None,
+                           pipeline_id: Optional[str] = None, status: Optional[str] = None) -> Dict[str, Any]:
+        where, args = "location_id = ?", (location_id or "",)
+        if query:
+            where += " AND name LIKE ?"
+            args += (f"%{query}%",)
+        if pipeline_id:
+            where += " AND pipeline_id = ?"
+            args += (pipeline_id,)
+        if status and status != "all":
+            where += " AND status = ?"
+            args += (status,)
+        total = self._conn.execute(f"SELECT COUNT(*) FROM opportunities WHERE {where}", args).fetchone()[0]
+        items = self._rows(f"SELECT data FROM opportunities WHERE {where} ORDER BY updated_at DESC LIMIT ?", args + (limit,))
+        return {"opportunities": items, "meta": {"total": total}}
+
+    def list_pipelines(self, location_id: Optional[str]) -> Dict[str, Any]:
+        return {"pipelines": self._rows("SELECT data FROM pipelines WHERE location_id = ?", (location_id or "",))}
+
+    def list_calendars(self, location_id: Optional[str]) -> Dict[str, Any]:
+        return {"calendars": self._rows("SELECT data FROM calendars WHERE location_id = ?", (location_id or "",))}
+
+    def list_records(self, location_id: Optional[str], schema_key: str, limit: int = 20, query: Optional[str] = None) -> Dict[str, Any]:
+        where, args = "location_id = ? AND schema_key = ?", (location_id or "", schema_key)
+        if query:
+            # Plain substring match over the record's JSON
+            where += " AND data LIKE ?"
+            args += (f"%{query}%",)
+        total = self._conn.execute(f"SELECT COUNT(*) FROM records WHERE {where}", args).fetchone()[0]
+        records = self._rows(f"SELECT data FROM records WHERE {where} ORDER BY updated_at DESC LIMIT ?", args + (limit,))
+        return {"records": records, "total": total}
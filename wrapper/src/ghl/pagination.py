@@ -0,0 +1,104 @@
+import asyncio
+import queue
+import threading
+from contextlib import suppress
+from typing import Optional, Dict, Any, List, Iterator, AsyncIterator, TypeVar
+
+T = TypeVar("T")
+
+# Pages kept ready ahead of the consumer by the iter_* helpers
+DEFAULT_PREFETCH = 1
+
+_ITEM, _DONE, _ERROR = "item", "done", "error"
+
+def next_cursor(items: List[Any], meta: Optional[Dict[str, Any]], page_size: int, cursor: Optional[tuple]) -> Optional[tuple]:
+    """Returns the (startAfter, startAfterId) cursor for the next page, or None at the end."""
+    meta = meta or {}
+    if len(items) < page_size or not meta.get("startAfterId"):
+        return None
+    following = (meta.get("startAfter"), meta.get("startAfterId"))
+    # Guard against a server that keeps handing back the same cursor
+    if following == cursor:
+        return None
+    return following
+
+def prefetch(pages: Iterator[T], depth: int = DEFAULT_PREFETCH) -> Iterator[T]:
+    """Iterates `pages` in a background thread, keeping up to `depth` pages ready.
+
+    While the caller works on page N the thread is already fetching page N+1.
+    The bounded queue caps memory at depth + 2 pages. Errors raised by the page
+    iterator are re-raised in the caller; closing the returned generator stops
+    the thread after its current request.
+    """
+    if depth <= 0:
+        yield from pages
+        return
+
+    buffer: "queue.Queue[tuple]" = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def put(entry: tuple) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for page in pages:
+                if not put((_ITEM, page)):
+                    return
+            put((_DONE, None))
+        except BaseException as e:
+            put((_ERROR, e))
+        finally:
+            close = getattr(pages, "close", None)
+            if close:
+                close()
+
+    thread = threading.Thread(target=produce, name="ghl-prefetch", daemon=True)
+    thread.start()
+    try:
+        while True:
+            kind, value = buffer.get()
+            if kind == _DONE:
+                return
+            if kind == _ERROR:
+                raise value
+            yield value
+    finally:
+        stop.set()
+
+async def aprefetch(pages: AsyncIterator[T], depth: int = DEFAULT_PREFETCH) -> AsyncIterator[T]:
+    """asyncio version of prefetch(): fetches ahead in a task on the running loop."""
+    if depth <= 0:
+        async for page in pages:
+            yield page
+        return
+
+    buffer: "asyncio.Queue[tuple]" = asyncio.Queue(maxsize=depth)
+
+    async def produce() -> None:
+        try:
+            async for page in pages:
+                await buffer.put((_ITEM, page))
+            await buffer.put((_DONE, None))
+        except Exception as e:
+            await buffer.put((_ERROR, e))
+
+    task = asyncio.create_task(produce())
+    try:
+        while True:
+            kind, value = await buffer.get()
+            if kind == _DONE:
+                return
+            if kind == _ERROR:
+                raise value
+            yield value
+    finally:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
@@ -0,0 +1,273 @@
+import json
+import os
+from importlib import resources
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Callable, Iterator, Union
+
+# Optional dependency: install with `pip install ghl-wrapper[parquet]`
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - exercised only without the extra
+    pa = None
+    pq = None
+
+# OpenAPI component schemas describing one exported item, per resource.
+# Contacts merge the list and detail shapes; the list one omits the name fields.
+RESOURCE_SCHEMAS = {
+    "contacts": ("contacts.json", ["ContactsSearchSchema", "GetContectByIdSchema"]),
+    "opportunities": ("opportunities.json", ["SearchOpportunitiesResponseSchema"]),
+    "records": ("objects.json", ["RecordResponseDTO"]),
+}
+
+# Column holding, as JSON, any keys of an item that the schema has no column for
+EXTRA_COLUMN = "_extra"
+
+# Rows buffered per Parquet row group
+ROW_GROUP_SIZE = 10_000
+
+def _require_pyarrow() -> None:
+    if pa is None:
+        raise ImportError("Parquet export needs pyarrow: pip install 'ghl-wrapper[parquet]'")
+
+def specs_dir() -> Optional[Path]:
+    """Directory of full apps/*.json OpenAPI specs to use instead of the bundled schemas (GHL_SPECS_DIR)."""
+    configured = os.environ.get("GHL_SPECS_DIR")
+    return Path(configured) if configured else None
+
+def _component_refs(node: Any) -> Iterator[str]:
+    if isinstance(node, dict):
+        ref = node.get("$ref")
+        if isinstance(ref, str) and ref.startswith("#/components/schemas/"):
+            yield ref.rsplit("/", 1)[-1]
+        for value in node.values():
+            yield from _component_refs(value)
+    elif isinstance(node, list):
+        for value in node:
+            yield from _component_refs(value)
+
+def bundled_schemas(spec: Dict[str, Any], names: List[str]) -> Dict[str, Any]:
+    """The part of an OpenAPI spec that schema_from_spec reads: the named component
+    schemas and every schema they reference. This is what ships in ghl/schemas/."""
+    schemas = spec.get("components", {}).get("schemas", {})
+    kept: Dict[str, Any] = {}
+    pending = list(names)
+    while pending:
+        name = pending.pop()
+        if name in kept or name not in schemas:
+            continue
+        kept[name] = schemas[name]
+        pending.extend(_component_refs(schemas[name]))
+    return {"components": {"schemas": dict(sorted(kept.items()))}}
+
+def _load_spec(filename: str, directory: Optional[Path]) -> Optional[Dict[str, Any]]:
+    if directory is not None:
+        path = Path(directory) / filename
+        if not path.exists():
+            return None
+        with open(path, "r") as f:
+            return json.load(f)
+    bundled = resources.files(__package__).joinpath("schemas", filename)
+    return json.loads(bundled.read_text()) if bundled.is_file() else None
+
+def _arrow_type(spec: Dict[str, Any], node: Dict[str, Any], seen: frozenset = frozenset()) -> "pa.DataType":
+    ref = node.get("$ref")
+    if ref is not None:
+        name = ref.rsplit("/", 1)[-1]
+        # External and recursive references are kept as JSON text
+        if not ref.startswith("#/components/schemas/") or name in seen:
+            return pa.string()
+        return _arrow_type(spec, spec["components"]["schemas"].get(name, {}), seen | {name})
+
+    kind = node.get("type")
+    if kind == "string":
+        return pa.string()
+    if kind == "integer":
+        return pa.int64()
+    if kind == "number":
+        return pa.float64()
+    if kind == "boolean":
+        return pa.bool_()
+    if kind == "array" and "items" in node:
+        return pa.list_(_arrow_type(spec, node["items"], seen))
+    if kind == "object" and node.get("properties"):
+        return pa.struct([pa.field(name, _arrow_type(spec, prop, seen)) for name, prop in node["properties"].items()])
+    # Free-form objects, anyOf/oneOf and untyped nodes
+    return pa.string()
+
+def schema_from_spec(resource: str, directory: Optional[Path] = None) -> Optional["pa.Schema"]:
+    """Arrow schema for `resource` built from its OpenAPI definitions, or None if they are unavailable.
+
+    The definitions come from `directory` or GHL_SPECS_DIR when given, else from
+    the schemas bundled with the package.
+    """
+    _require_pyarrow()
+    directory = directory or specs_dir()
+    if resource not in RESOURCE_SCHEMAS:
+        return None
+    filename, names = RESOURCE_SCHEMAS[resource]
+    spec = _load_spec(filename, directory)
+    if spec is None:
+        return None
+
+    fields: Dict[str, "pa.Field"] = {}
+    for name in names:
+        properties = spec.get("components", {}).get("schemas", {}).get(name, {}).get("properties", {})
+        for prop, node in properties.items():
+            fields.setdefault(prop, pa.field(prop, _arrow_type(spec, node, frozenset({name}))))
+    return pa.schema(list(fields.values())) if fields else None
+
+def _infer_type(values: List[Any]) -> "pa.DataType":
+    kinds = {type(v) for v in values if v is not None}
+    if kinds == {bool}:
+        return pa.bool_()
+    # Numbers are float64 even if the sample only holds whole ones: a later page
+    # may not, and the schema is fixed once the file is opened
+    if kinds and kinds <= {int, float}:
+        return pa.float64()
+    return pa.string()
+
+def infer_schema(items: List[Dict[str, Any]]) -> "pa.Schema":
+    """Flat schema guessed from sample items; used when no spec is available."""
+    _require_pyarrow()
+    names: Dict[str, None] = {}
+    for item in items:
+        names.update(dict.fromkeys(item))
+    return pa.schema([pa.field(name, _infer_type([item.get(name) for item in items])) for name in names])
+
+def _to_json(value: Any) -> Optional[str]:
+    if value is None or isinstance(value, str):
+        return value
+    return json.dumps(value)
+
+class _Fractional(ValueError):
+    pass
+
+def _integer(value: Any) -> int:
+    """Whole numbers, or numeric strings, as int; raises rather than drop a fraction."""
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            pass
+    number = float(value)
+    if not number.is_integer():
+        raise _Fractional(f"{value!r}, which is not a whole number")
+    return int(number)
+
+def _converter(dtype: "pa.DataType", name: str = "") -> Callable[[Any], Any]:
+    """Compiles a function coercing a JSON value into something Arrow accepts for `dtype`.
+
+    The specs are not always accurate (numbers typed as strings, objects typed as
+    strings), so mismatches are converted rather than rejected. The exception is
+    a fractional number in an integer column: that raises ValueError naming the
+    column instead of being truncated.
+    """
+    if pa.types.is_string(dtype):
+        return _to_json
+    if pa.types.is_boolean(dtype):
+        return lambda v: v if isinstance(v, bool) else None
+
+    if pa.types.is_integer(dtype) or pa.types.is_floating(dtype):
+        cast = _integer if pa.types.is_integer(dtype) else float
+
+        def number(v: Any) -> Any:
+            if v is None or isinstance(v, bool):
+                return None
+            try:
+                return cast(v)
+            except _Fractional as e:
+                raise ValueError(f"Column {name!r} is {dtype} but got {e}") from None
+            except (TypeError, ValueError):
+                return None
+        return number
+
+    if pa.types.is_list(dtype):
+        item = _converter(dtype.value_type, f"{name}[]")
+        return lambda v: [item(x) for x in v] if isinstance(v, list) else None
+
+    if pa.types.is_struct(dtype):
+        members = [(dtype.field(i).name, _converter(dtype.field(i).type, f"{name}.{dtype.field(i).name}"))
+                   for i in range(dtype.num_fields)]
+        return lambda v: {name: convert(v.get(name)) for name, convert in members} if isinstance(v, dict) else None
+
+    return lambda v: v
+
+class ParquetSink:
+    """Writes items as Parquet, one Arrow record batch per page.
+
+    Columns come from the resource's OpenAPI schema (restricted to `fields` when
+    given). Without specs they are inferred from the first page. Keys outside
+    the schema are kept as JSON in the `_extra` column. Pages are buffered into
+    row groups of ROW_GROUP_SIZE rows.
+
+    Parquet files cannot be appended to, so this sink is not resumable. It
+    writes to OUT.part and renames it when the export completes, which means a
+    crash never leaves a truncated file behind.
+    """
+    resumable = False
+
+    def __init__(self, path: Union[str, Path], fields: Optional[List[str]] = None, offset: Optional[int] = None,
+                 resource: Optional[str] = None, schema: Optional["pa.Schema"] = None):
+        _require_pyarrow()
+        self.path = Path(path)
+        self._part = self.path.with_name(self.path.name + ".part")
+        self.fields = fields
+        self.schema = schema if schema is not None else (schema_from_spec(resource) if resource else None)
+        self._writer = None
+        self._batches: List["pa.RecordBatch"] = []
+        self._buffered = 0
+
+    def _open(self, items: List[Dict[str, Any]]) -> None:
+        schema = self.schema if self.schema is not None else infer_schema(items)
+        if self.fields:
+            by_name = {field.name: field for field in schema}
+            schema = pa.schema([by_name.get(name, pa.field(name, pa.string())) for name in self.fields])
+        else:
+            schema = schema.append(pa.field(EXTRA_COLUMN, pa.string()))
+        self.schema = schema
+        self._columns = [(field.name, _converter(field.type, field.name)) for field in schema if field.name != EXTRA_COLUMN]
+        self._known = {field.name for field in schema}
+        self._writer = pq.ParquetWriter(str(self._part), schema)
+
+    def _row(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        row = {name: convert(item.get(name)) for name, convert in self._columns}
+        if not self.fields:
+            extra = {k: v for k, v in item.items() if k not in self._known}
+            row[EXTRA_COLUMN] = json.dumps(extra) if extra else None
+        return row
+
+    def write(self, items: List[Dict[str, Any]]) -> None:
+        if not items:
+            return
+        if self._writer is None:
+            self._open(items)
+        self._batches.append(pa.RecordBatch.from_pylist([self._row(item) for item in items], schema=self.schema))
+        self._buffered += len(items)
+        if self._buffered >= ROW_GROUP_SIZE:
+            self._flush()
+
+    def _flush(self) -> None:
+        if self._batches:
+            self._writer.write_table(pa.Table.from_batches(self._batches, schema=self.schema))
+            self._batches = []
+            self._buffered = 0
+
+    def checkpoint(self) -> None:
+        return None
+
+    def close(self) -> None:
+        if self._writer is None:
+            # No rows at all: still produce a readable (empty) file
+            self._open([])
+        self._flush()
+        self._writer.close()
+        os.replace(self._part, self.path)
+
+    def abort(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+        if self._part.exists():
+            self._part.unlink()
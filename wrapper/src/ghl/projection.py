@@ -0,0 +1,139 @@
+import re
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Tuple, Callable, Union
+
+# Returned by a path getter when the path does not exist in the item
+MISSING = object()
+
+Step = Tuple[str, Any]
+_KEY, _INDEX, _EACH, _MATCH = "key", "index", "each", "match"
+
+_SEGMENT = re.compile(r"([^.\[\]]+)|\[(\*|-?\d+|[^\]=]+=[^\]]*)\]|(\.)")
+
+def parse_path(path: str) -> Tuple[Step, ...]:
+    """Splits a field path into steps.
+
+    - `name`: a key of an object
+    - `a.b`: key `b` of the object under `a`
+    - `[0]`, `[-1]`: an element of a list
+    - `[*]`: every element of a list (the result is a list)
+    - `[id=abc]`: the first element of a list whose `id` is "abc"; handy for
+      `customFields[id=abc].value`
+    """
+    steps: List[Step] = []
+    position = 0
+    expect_key = True
+    for match in _SEGMENT.finditer(path):
+        if match.start() != position:
+            break
+        key, bracket, dot = match.groups()
+        if key is not None:
+            if not expect_key:
+                break
+            steps.append((_KEY, key))
+            expect_key = False
+        elif dot is not None:
+            if expect_key:
+                break
+            expect_key = True
+        elif expect_key and steps:
+            # `a.[0]`
+            break
+        elif bracket == "*":
+            steps.append((_EACH, None))
+        elif "=" in bracket:
+            field, _, value = bracket.partition("=")
+            steps.append((_MATCH, (field, value)))
+        else:
+            steps.append((_INDEX, int(bracket)))
+        position = match.end()
+    if not steps or position != len(path) or (expect_key and path.endswith(".")):
+        raise ValueError(f"Invalid field path: {path!r}")
+    return tuple(steps)
+
+def _getter(steps: Tuple[Step, ...]) -> Callable[[Any], Any]:
+    if not steps:
+        return lambda value: value
+
+    (kind, arg), rest = steps[0], _getter(steps[1:])
+    if kind == _KEY:
+        def key(value: Any) -> Any:
+            if not isinstance(value, dict) or arg not in value:
+                return MISSING
+            return rest(value[arg])
+        return key
+
+    if kind == _INDEX:
+        def index(value: Any) -> Any:
+            if not isinstance(value, list) or not -len(value) <= arg < len(value):
+                return MISSING
+            return rest(value[arg])
+        return index
+
+    if kind == _MATCH:
+        field, wanted = arg
+
+        def match(value: Any) -> Any:
+            if isinstance(value, list):
+                for element in value:
+                    if isinstance(element, dict) and str(element.get(field)) == wanted:
+                        return rest(element)
+            return MISSING
+        return match
+
+    def each(value: Any) -> Any:
+        if not isinstance(value, list):
+            return MISSING
+        return [v for v in map(rest, value) if v is not MISSING]
+    return each
+
+def compile_path(path: str) -> Callable[[Any], Any]:
+    """Function returning the value at `path` in an item, or MISSING."""
+    steps = parse_path(path)
+    if len(steps) == 1 and steps[0][0] == _KEY:
+        key = steps[0][1]
+        return lambda item: item.get(key, MISSING) if isinstance(item, dict) else MISSING
+    return _getter(steps)
+
+@lru_cache(maxsize=128)
+def compile_projection(fields: Union[str, Tuple[str, ...]]) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """Compiles a comma-separated field list (or tuple of paths) into a projector.
+
+    The projector returns a dict keyed by the paths as written, leaving out paths
+    the item does not have. Compiled projectors are cached, so calling this
+    for every page or record costs a dict lookup.
+    """
+    paths = tuple(p.strip() for p in fields.split(",")) if isinstance(fields, str) else fields
+    paths = tuple(dict.fromkeys(p for p in paths if p))
+
+    if all(len(parse_path(p)) == 1 and parse_path(p)[0][0] == _KEY for p in paths):
+        # Plain top-level keys: a single comprehension, no per-path calls
+        def top_level(item: Dict[str, Any]) -> Dict[str, Any]:
+            return {k: item[k] for k in paths if k in item}
+        return top_level
+
+    getters = [(path, compile_path(path)) for path in paths]
+
+    def nested(item: Dict[str, Any]) -> Dict[str, Any]:
+        result = {}
+        for path, get in getters:
+            value = get(item)
+            if value is not MISSING:
+                result[path] = value
+        return result
+    return nested
+
+def project(data: Any, fields: Optional[Union[str, Tuple[str, ...]]]) -> Any:
+    """Applies compile_projection(fields) to an item or a list of items; no fields returns data unchanged."""
+    if not fields:
+        return data
+    projector = compile_projection(fields)
+    if isinstance(data, list):
+        return [projector(item) if isinstance(item, dict) else item for item in data]
+    return projector(data) if isinstance(data, dict) else data
+
+def project_page(data: Dict[str, Any], key: str, fields: Optional[str]) -> Dict[str, Any]:
+    """Projects the item list under `key` of a response, keeping the rest (meta, totals) as is."""
+    if not fields or not isinstance(data.get(key), list):
+        return data
+    return {**data, key: project(data[key], fields)}
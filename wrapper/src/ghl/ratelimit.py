@@ -0,0 +1,120 @@
+import asyncio
+import threading
+import time
+from typing import Optional, Dict, Mapping, Callable, Any
+
+# Burst limit documented in docs/oauth/Authorization.md: 100 requests per 10 seconds per location.
+DEFAULT_MAX_REQUESTS = 100
+DEFAULT_INTERVAL = 10.0
+
+MAX_HEADER = "X-RateLimit-Max"
+REMAINING_HEADER = "X-RateLimit-Remaining"
+INTERVAL_HEADER = "X-RateLimit-Interval-Milliseconds"
+
+def _header_int(headers: Mapping[str, str], name: str) -> Optional[int]:
+    value = headers.get(name)
+    if not isinstance(value, str):
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+class TokenBucket:
+    """Token bucket that hands out send slots and can be recalibrated from server headers.
+
+    reserve() always takes a token, letting the balance go negative, and returns how
+    long the caller must wait before sending. Concurrent callers therefore queue up
+    behind each other instead of all waking at the same instant.
+    """
+
+    def __init__(self, capacity: float = DEFAULT_MAX_REQUESTS, interval: float = DEFAULT_INTERVAL,
+                 clock: Callable[[], float] = time.monotonic):
+        self.capacity = float(capacity)
+        self.interval = float(interval)
+        self.tokens = float(capacity)
+        self._clock = clock
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        return self.capacity / self.interval
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self._updated = now
+
+    def reserve(self) -> float:
+        """Takes one token and returns the number of seconds to wait before sending."""
+        with self._lock:
+            self._refill()
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+    def update(self, limit: Optional[int] = None, remaining: Optional[int] = None, interval: Optional[float] = None) -> None:
+        """Recalibrates the bucket from what the server reports."""
+        with self._lock:
+            self._refill()
+            if limit and limit > 0:
+                self.capacity = float(limit)
+            if interval and interval > 0:
+                self.interval = float(interval)
+            if remaining is not None:
+                # Responses arrive out of order under concurrency, so only ever trust
+                # the server to lower our estimate; the refill raises it again.
+                self.tokens = min(self.tokens, float(remaining), self.capacity)
+
+class RateLimiter:
+    """Paces requests per location with one TokenBucket per location_id.
+
+    A single limiter can be shared by several clients (e.g. one client per
+    sub-account) so each location keeps its own budget.
+    """
+
+    def __init__(self, max_requests: int = DEFAULT_MAX_REQUESTS, interval: float = DEFAULT_INTERVAL,
+                 clock: Callable[[], float] = time.monotonic):
+        self.max_requests = max_requests
+        self.interval = interval
+        self._clock = clock
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, key: Optional[str]) -> TokenBucket:
+        key = key or "default"
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = TokenBucket(self.max_requests, self.interval, self._clock)
+                self._buckets[key] = bucket
+            return bucket
+
+    def acquire(self, key: Optional[str]) -> None:
+        delay = self.bucket(key).reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, key: Optional[str]) -> None:
+        delay = self.bucket(key).reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def update_from_headers(self, key: Optional[str], headers: Mapping[str, str]) -> None:
+        limit = _header_int(headers, MAX_HEADER)
+        remaining = _header_int(headers, REMAINING_HEADER)
+        interval_ms = _header_int(headers, INTERVAL_HEADER)
+        if limit is None and remaining is None and interval_ms is None:
+            return
+
+        interval = interval_ms / 1000.0 if interval_ms else None
+        self.bucket(key).update(limit, remaining, interval)
+
+    def update_from_response(self, key: Optional[str], response: Any) -> None:
+        headers = getattr(response, "headers", None)
+        if headers is not None:
+            self.update_from_headers(key, headers)
@@ -0,0 +1,110 @@
+import random
+import re
+import time
+from email.utils import parsedate_to_datetime
+from typing import Optional, Iterable, Callable, Any
+import httpx
+from .cache import READ_ONLY_POSTS
+
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"get", "put", "delete"})
+# POST routes that are safe to replay: the server de-duplicates them, or they only mint a token
+IDEMPOTENT_POST_PATHS = ("/contacts/upsert", "/opportunities/upsert", "/oauth/locationToken")
+
+# Failures where the request never reached the server, so any method can be replayed
+_UNSENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+def parse_retry_after(value: Any) -> Optional[float]:
+    """Parses a Retry-After header given either as seconds or as an HTTP date."""
+    if not isinstance(value, str) or not value.strip():
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+class RetryPolicy:
+    """Decides which failed requests are retried and how long to wait in between.
+
+    Backoff uses decorrelated jitter: each delay is drawn uniformly between
+    base_delay and three times the previous delay, capped at max_delay. A
+    Retry-After header from the server takes precedence. No attempt is made
+    once total_timeout seconds have passed since the first one.
+    """
+
+    def __init__(self, max_attempts: int = 5, base_delay: float = 0.5, max_delay: float = 30.0,
+                 total_timeout: float = 120.0, retry_statuses: Iterable[int] = RETRY_STATUSES,
+                 retry_methods: Iterable[str] = IDEMPOTENT_METHODS,
+                 idempotent_post_paths: Iterable[str] = IDEMPOTENT_POST_PATHS,
+                 read_only_posts: Iterable["re.Pattern"] = READ_ONLY_POSTS):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.total_timeout = total_timeout
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_methods = frozenset(m.lower() for m in retry_methods)
+        self.idempotent_post_paths = tuple(p.rstrip("/") for p in idempotent_post_paths)
+        self.read_only_posts = tuple(read_only_posts)
+
+    def is_idempotent(self, method: str, url: str) -> bool:
+        method = method.lower()
+        if method in self.retry_methods:
+            return True
+        if method == "post":
+            path = str(url).split("?", 1)[0]
+            # Searches only read, so replaying one is as safe as a GET
+            return (path.rstrip("/") in self.idempotent_post_paths
+                    or any(p.fullmatch(path) for p in self.read_only_posts))
+        return False
+
+    def is_retryable(self, method: str, url: str, error: Exception) -> bool:
+        if isinstance(error, httpx.HTTPStatusError):
+            return error.response.status_code in self.retry_statuses and self.is_idempotent(method, url)
+        if isinstance(error, _UNSENT_ERRORS):
+            return True
+        if isinstance(error, httpx.TransportError):
+            return self.is_idempotent(method, url)
+        return False
+
+    def backoff(self, previous: float) -> float:
+        return min(self.max_delay, random.uniform(self.base_delay, max(self.base_delay, previous * 3)))
+
+    def start(self, clock: Callable[[], float] = time.monotonic) -> "RetryState":
+        return RetryState(self, clock)
+
+class RetryState:
+    """Tracks attempts and the time budget for a single logical request."""
+
+    def __init__(self, policy: RetryPolicy, clock: Callable[[], float] = time.monotonic):
+        self.policy = policy
+        self.attempts = 1
+        self._clock = clock
+        self._deadline = clock() + policy.total_timeout
+        self._previous = policy.base_delay
+
+    def next_delay(self, method: str, url: str, error: Exception) -> Optional[float]:
+        """Returns seconds to wait before the next attempt, or None to give up."""
+        if self.attempts >= self.policy.max_attempts:
+            return None
+        if not self.policy.is_retryable(method, url, error):
+            return None
+
+        delay = self.policy.backoff(self._previous)
+        if isinstance(error, httpx.HTTPStatusError):
+            headers = getattr(error.response, "headers", None)
+            retry_after = parse_retry_after(headers.get("Retry-After")) if headers is not None else None
+            if retry_after is not None:
+                delay = retry_after
+
+        if self._clock() + delay > self._deadline:
+            return None
+
+        self._previous = max(delay, self.policy.base_delay)
+        self.attempts += 1
+        return delay
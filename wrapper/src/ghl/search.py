@@ -0,0 +1,164 @@
+import re
+import shlex
+from typing import Optional, List, Tuple
+
+# Query field -> indexed column (aliases included)
+FIELDS = {
+    "email": "email",
+    "phone": "phone",
+    "name": "name",
+    "firstname": "name",
+    "lastname": "name",
+    "company": "company",
+    "companyname": "company",
+    "tag": "tag",
+    "tags": "tag",
+    "dateadded": "date_added",
+    "added": "date_added",
+    "id": "id",
+}
+
+# Columns matched through the contacts_fts full-text table
+TEXT_COLUMNS = ("name", "company")
+
+_DATE_RANGE = re.compile(r"^(>=|<=|>|<|=)?(.*)$")
+
+def reverse_email(email: Optional[str]) -> Optional[str]:
+    """Stored reversed so `*@domain` becomes a prefix scan on an index."""
+    return email[::-1] if email else None
+
+def phone_digits(phone: Optional[str]) -> Optional[str]:
+    digits = re.sub(r"\D", "", phone or "")
+    return digits or None
+
+def _upper_bound(prefix: str) -> str:
+    """Smallest string greater than every string starting with `prefix`."""
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+def _prefix(column: str, prefix: str) -> Tuple[str, tuple]:
+    # A range rather than LIKE, so the B-tree index on `column` is used
+    return f"c.{column} >= ? AND c.{column} < ?", (prefix, _upper_bound(prefix))
+
+def _glob(value: str) -> str:
+    """Escapes GLOB metacharacters other than `*`."""
+    return re.sub(r"([?\[\]])", r"[\1]", value)
+
+def _fts_phrase(value: str) -> str:
+    phrase = '"' + value.rstrip("*").replace('"', '""') + '"'
+    return phrase + "*" if value.endswith("*") else phrase
+
+def _pattern(column: str, value: str, reversed_column: Optional[str] = None) -> Tuple[str, tuple]:
+    """Exact, `prefix*`, `*suffix` or general wildcard match on an indexed column."""
+    stars = value.count("*")
+    if stars == 0:
+        return f"c.{column} = ?", (value,)
+    if stars == 1 and value.endswith("*") and len(value) > 1:
+        return _prefix(column, value[:-1])
+    if stars == 1 and value.startswith("*") and len(value) > 1 and reversed_column:
+        return _prefix(reversed_column, value[1:][::-1])
+    if value.strip("*") == "":
+        return f"c.{column} IS NOT NULL", ()
+    # Leading or inner wildcards cannot use the index
+    return f"c.{column} GLOB ?", (_glob(value),)
+
+def _date(value: str) -> Tuple[str, tuple]:
+    if ".." in value:
+        start, end = value.split("..", 1)
+        clauses, args = [], ()
+        if start:
+            clauses.append("c.date_added >= ?")
+            args += (start,)
+        if end:
+            # Inclusive end: 2024-01-31 covers the whole day
+            clauses.append("c.date_added < ?")
+            args += (_upper_bound(end),)
+        return " AND ".join(clauses) or "1", args
+    op, date = _DATE_RANGE.match(value).groups()
+    if not date:
+        raise ValueError("dateAdded needs a date")
+    if op in (None, "="):
+        # A date or a leading part of one (2024-01) matches by prefix
+        return _prefix("date_added", date)
+    if op in (">", "<="):
+        # Timestamps on the given date count as that date
+        return f"c.date_added {'>=' if op == '>' else '<'} ?", (_upper_bound(date),)
+    return f"c.date_added {op} ?", (date,)
+
+def _tag(location: str, value: str) -> Tuple[str, tuple]:
+    value = value.lower()
+    # Not correlated with the outer row, so it is evaluated once
+    sub = "SELECT contact_id FROM contact_tags WHERE location_id = ? AND "
+    if "*" not in value:
+        return f"c.id IN ({sub}tag = ?)", (location, value)
+    if value.count("*") == 1 and value.endswith("*") and len(value) > 1:
+        prefix = value[:-1]
+        return f"c.id IN ({sub}tag >= ? AND tag < ?)", (location, prefix, _upper_bound(prefix))
+    return f"c.id IN ({sub}tag GLOB ?)", (location, _glob(value))
+
+def parse_query(query: str) -> List[Tuple[Optional[str], str]]:
+    """Splits a query into (field, value) terms; field is None for free text.
+
+    Terms are separated by whitespace and may be double-quoted. A term of the
+    form `field:value` is scoped to that field.
+    """
+    terms = []
+    for token in shlex.split(query):
+        field, sep, value = token.partition(":")
+        if sep and field.lower() in FIELDS:
+            if not value:
+                raise ValueError(f"Empty value for {field}:")
+            terms.append((FIELDS[field.lower()], value))
+        elif sep and re.fullmatch(r"[A-Za-z]+", field):
+            raise ValueError(f"Unknown search field: {field} (use one of {', '.join(sorted(set(FIELDS.values())))})")
+        else:
+            terms.append((None, token))
+    return terms
+
+def compile_query(query: str, location: str = "") -> Tuple[List[str], tuple]:
+    """WHERE clauses (over the `contacts c` table) and arguments for a search query in `location`.
+
+    - `email:` matches exactly, by `prefix*` or by `*@domain` (via the reversed
+      email column); other wildcards fall back to a scan.
+    - `phone:` compares digits only, so `+1 (555) 010*` finds `15550100`.
+    - `tag:` looks tags up in contact_tags.
+    - `dateAdded:` takes `2024-01`, `>2024-01-31`, `<=2024-02-01` or `2024-01-01..2024-01-31`.
+    - `name:`/`company:` and free text go through the contacts_fts full-text
+      index; a trailing `*` makes a prefix query.
+
+    All terms must match.
+    """
+    clauses: List[str] = ["c.location_id = ?"]
+    args: tuple = (location,)
+    fts: List[str] = []
+    for field, value in parse_query(query):
+        if field is None:
+            if value.strip("*"):
+                fts.append(_fts_phrase(value))
+        elif field in TEXT_COLUMNS and not value.startswith("*"):
+            fts.append(f"{field} : {_fts_phrase(value)}")
+        elif field in TEXT_COLUMNS:
+            clauses.append(f"lower(c.{field}) GLOB ?")
+            args += (_glob(value.lower()),)
+        elif field == "email":
+            clause, extra = _pattern("email", value.lower(), "email_reversed")
+            clauses.append(clause)
+            args += extra
+        elif field == "phone":
+            clause, extra = _pattern("phone_digits", "*".join(phone_digits(part) or "" for part in value.split("*")))
+            clauses.append(clause)
+            args += extra
+        elif field == "tag":
+            clause, extra = _tag(location, value)
+            clauses.append(clause)
+            args += extra
+        elif field == "date_added":
+            clause, extra = _date(value)
+            clauses.append(clause)
+            args += extra
+        else:
+            clauses.append("c.id = ?")
+            args += (value,)
+    if fts:
+        clauses.append("c.rowid IN (SELECT rowid FROM contacts_fts WHERE contacts_fts MATCH ?)")
+        args += (" AND ".join(fts),)
+    return clauses, args
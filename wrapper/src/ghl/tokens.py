@@ -0,0 +1,139 @@
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Optional, Dict, Any, Union
+
+class TokenLease:
+    """Exclusive hold on one stored token, taken by TokenStore.acquire().
+
+    Until release() no other process (or client) sharing the store can start a
+    refresh, so the refresh token is exchanged, and rotated, exactly once.
+    """
+
+    def __init__(self, conn: sqlite3.Connection, key: str, current: Optional[Dict[str, Any]]):
+        self._conn = conn
+        self.key = key
+        # What the store held when the lease was taken, or None
+        self.current = current
+
+    def save(self, token_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Records freshly exchanged tokens; returns them in the stored form."""
+        expires_at = token_data.get("expires_at")
+        if expires_at is None and token_data.get("expires_in"):
+            expires_at = time.time() + float(token_data["expires_in"])
+        refresh_token = token_data.get("refresh_token") or (self.current or {}).get("refresh_token")
+
+        self._conn.execute(
+            "INSERT OR REPLACE INTO tokens (key, access_token, refresh_token, expires_at, updated_at) VALUES (?, ?, ?, ?, ?)",
+            (self.key, token_data["access_token"], refresh_token, expires_at, time.time()),
+        )
+        self.current = {"access_token": token_data["access_token"], "refresh_token": refresh_token, "expires_at": expires_at}
+        return self.current
+
+    def release(self) -> None:
+        try:
+            self._conn.execute("COMMIT")
+        finally:
+            self._conn.close()
+
+    def abort(self) -> None:
+        """Releases the lease without keeping anything saved under it."""
+        try:
+            self._conn.execute("ROLLBACK")
+        finally:
+            self._conn.close()
+
+    def __enter__(self) -> "TokenLease":
+        return self
+
+    def __exit__(self, exc_type, *exc_info) -> None:
+        if exc_type is not None:
+            self.abort()
+        else:
+            self.release()
+
+class TokenStore:
+    """OAuth tokens persisted in SQLite so every process starts with the latest pair.
+
+    Rows are keyed per OAuth install (see GHLClient.token_key). Refreshes go through
+    acquire(), which takes SQLite's write lock with BEGIN IMMEDIATE: concurrent
+    workers queue on the file lock, and the ones that get in after a refresh find
+    the new tokens already stored instead of replaying a rotated refresh token.
+    """
+
+    def __init__(self, path: Union[str, Path], timeout: float = 60.0):
+        self.path = Path(path)
+        self.timeout = timeout
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Holds live credentials. Created under a private umask so the file and the
+        # -wal/-shm files SQLite writes tokens to first are never readable by others;
+        # SQLite gives sidecar files created later the database file's mode.
+        if self.path.exists():
+            # Made by an older version: tighten it before SQLite copies its mode to new sidecars
+            self.path.chmod(0o600)
+        previous = os.umask(0o077)
+        try:
+            conn = self._connect()
+            try:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS tokens (
+                        key TEXT PRIMARY KEY,
+                        access_token TEXT NOT NULL,
+                        refresh_token TEXT,
+                        expires_at REAL,
+                        updated_at REAL NOT NULL
+                    )
+                """)
+            finally:
+                conn.close()
+        finally:
+            os.umask(previous)
+        for path in (self.path, self.path.with_name(self.path.name + "-wal"), self.path.with_name(self.path.name + "-shm")):
+            try:
+                path.chmod(0o600)
+            except FileNotFoundError:
+                # Sidecars only exist while a connection is open
+                pass
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(str(self.path), timeout=self.timeout, isolation_level=None, check_same_thread=False)
+
+    @staticmethod
+    def _row(row: Optional[tuple]) -> Optional[Dict[str, Any]]:
+        if row is None:
+            return None
+        return {"access_token": row[0], "refresh_token": row[1], "expires_at": row[2]}
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        conn = self._connect()
+        try:
+            return self._row(conn.execute(
+                "SELECT access_token, refresh_token, expires_at FROM tokens WHERE key = ?", (key,)
+            ).fetchone())
+        finally:
+            conn.close()
+
+    def acquire(self, key: str) -> TokenLease:
+        """Blocks until no one else is refreshing `key`, then returns a lease on it."""
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            current = self._row(conn.execute(
+                "SELECT access_token, refresh_token, expires_at FROM tokens WHERE key = ?", (key,)
+            ).fetchone())
+        except BaseException:
+            conn.close()
+            raise
+        return TokenLease(conn, key, current)
+
+    def clear(self, key: Optional[str] = None) -> None:
+        conn = self._connect()
+        try:
+            if key is None:
+                conn.execute("DELETE FROM tokens")
+            else:
+                conn.execute("DELETE FROM tokens WHERE key = ?", (key,))
+        finally:
+            conn.close()
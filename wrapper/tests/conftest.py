@@ -1,7 +1,7 @@
 import pytest
 import httpx
-from unittest.mock import MagicMock
-from ghl.client import GHLClient
+from unittest.mock import MagicMock, AsyncMock
+from ghl.client import GHLClient, AsyncGHLClient
 
 @pytest.fixture
 def mock_httpx_client():
@@ -24,3 +24,28 @@ def ghl_client_oauth(mock_httpx_client):
         refresh_token="test_refresh_token"
     )
     return client
+
+@pytest.fixture
+def mock_async_httpx_client():
+    client = AsyncMock(spec=httpx.AsyncClient)
+    client.headers = {"Authorization": "Bearer test_key"}
+    return client
+
+@pytest.fixture
+def async_ghl_client(mock_async_httpx_client):
+    return AsyncGHLClient(api_key="test_key", client=mock_async_httpx_client)
+
+@pytest.fixture
+def async_ghl_client_oauth(mock_async_httpx_client):
+    return AsyncGHLClient(
+        api_key="test_key",
+        client=mock_async_httpx_client,
+        client_id="test_client_id",
+        client_secret="test_client_secret",
+        refresh_token="test_refresh_token"
+    )
+
+@pytest.fixture(autouse=True)
+def no_retry_sleep(mocker):
+    # Keep retry backoff from slowing the suite down
+    return mocker.patch("ghl.client.time.sleep")
@@ -0,0 +1,114 @@
+import asyncio
+import pytest
+import httpx
+from unittest.mock import MagicMock, AsyncMock
+from ghl.client import AsyncGHLClient
+
+def _response(status_code, json_data=None):
+    response = MagicMock(spec=httpx.Response)
+    response.status_code = status_code
+    response.json.return_value = json_data
+    if status_code >= 400:
+        response.raise_for_status.side_effect = httpx.HTTPStatusError("Error", request=MagicMock(), response=response)
+        response.content = b""
+    else:
+        response.raise_for_status.return_value = None
+    return response
+
+def test_init(async_ghl_client):
+    assert async_ghl_client.api_key == "test_key"
+    assert async_ghl_client.location_id is None
+
+def test_default_client_is_async():
+    client = AsyncGHLClient(api_key="key", location_id="loc")
+    assert isinstance(client.client, httpx.AsyncClient)
+    assert client.client.headers["Authorization"] == "Bearer key"
+    assert client.client.headers["Version"] == "2021-07-28"
+    asyncio.run(client.aclose())
+
+def test_get_success(async_ghl_client, mock_async_httpx_client):
+    mock_async_httpx_client.get.return_value = _response(200, {"data": "ok"})
+
+    result = asyncio.run(async_ghl_client.get("/test"))
+
+    assert result.json() == {"data": "ok"}
+    mock_async_httpx_client.get.assert_awaited_once_with("/test", params=None)
+
+def test_post_success(async_ghl_client, mock_async_httpx_client):
+    mock_async_httpx_client.post.return_value = _response(201, {"id": "1"})
+
+    result = asyncio.run(async_ghl_client.post("/test", json={"foo": "bar"}))
+
+    assert result.status_code == 201
+    mock_async_httpx_client.post.assert_awaited_once_with("/test", json={"foo": "bar"}, params=None)
+
+def test_error_handling_enrichment(async_ghl_client, mock_async_httpx_client):
+    mock_async_httpx_client.get.return_value = _response(400, {"message": "Invalid data"})
+
+    with pytest.raises(httpx.HTTPStatusError) as exc_info:
+        asyncio.run(async_ghl_client.get("/test"))
+
+    assert "Invalid data" in str(exc_info.value)
+
+def test_refresh_token_success(async_ghl_client_oauth, mock_async_httpx_client, mocker):
+    mock_token_client = AsyncMock(spec=httpx.AsyncClient)
+    mock_token_client.post.return_value = _response(200, {
+        "access_token": "new_access_token",
+        "refresh_token": "new_refresh_token"
+    })
+    mock_token_client.__aenter__.return_value = mock_token_client
+    mocker.patch("httpx.AsyncClient", return_value=mock_token_client)
+
+    mock_async_httpx_client.get.side_effect = [_response(401), _response(200, {"success": True})]
+
+    result = asyncio.run(async_ghl_client_oauth.get("/test"))
+
+    assert result.json() == {"success": True}
+    assert async_ghl_client_oauth.api_key == "new_access_token"
+    assert async_ghl_client_oauth.refresh_token == "new_refresh_token"
+    assert mock_async_httpx_client.headers["Authorization"] == "Bearer new_access_token"
+    assert mock_async_httpx_client.get.await_count == 2
+
+def test_refresh_missing_credentials(async_ghl_client):
+    with pytest.raises(ValueError, match="required for token refresh"):
+        asyncio.run(async_ghl_client.refresh_access_token())
+
+def test_concurrent_requests(async_ghl_client, mock_async_httpx_client):
+    mock_async_httpx_client.get.return_value = _response(200, {"data": "ok"})
+
+    async def run():
+        return await asyncio.gather(*(async_ghl_client.get(f"/test/{i}") for i in range(10)))
+
+    results = asyncio.run(run())
+
+    assert len(results) == 10
+    assert mock_async_httpx_client.get.await_count == 10
+
+def test_context_manager_closes(async_ghl_client, mock_async_httpx_client):
+    async def run():
+        async with async_ghl_client:
+            pass
+
+    asyncio.run(run())
+    mock_async_httpx_client.aclose.assert_awaited_once()
+
+def test_stream_items_async():
+    from ghl.endpoints.aio import conversations
+    pages = {
+        None: b'{"messages": {"lastMessageId": "m2", "nextPage": true, "messages": [{"id": "m1"}, {"id": "m2"}]}}',
+        "m2": b'{"messages": {"lastMessageId": "m3", "nextPage": false, "messages": [{"id": "m3"}]}}',
+    }
+
+    def handler(request):
+        body = pages[request.url.params.get("lastMessageId")]
+
+        async def chunks():
+            yield body[:10]
+            yield body[10:]
+        return httpx.Response(200, content=chunks())
+
+    async def run():
+        async with AsyncGHLClient("key", client=httpx.AsyncClient(transport=httpx.MockTransport(handler), base_url="https://test")) as client:
+            return [m["id"] async for m in conversations.iter_messages(client, "conv_1")]
+
+    assert asyncio.run(run()) == ["m1", "m2", "m3"]
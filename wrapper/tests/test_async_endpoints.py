@@ -0,0 +1,165 @@
+import asyncio
+import pytest
+from unittest.mock import Mock, MagicMock, AsyncMock
+from ghl.endpoints.aio import contacts, calendars, conversations, locations, oauth, objects, opportunities, workflows
+
+@pytest.fixture
+def mock_client():
+    client = Mock()
+    client.location_id = "loc_123"
+    for method in ("get", "post", "put", "delete"):
+        response = MagicMock()
+        response.json.return_value = {}
+        setattr(client, method, AsyncMock(return_value=response))
+    return client
+
+def test_list_contacts(mock_client):
+    mock_client.get.return_value.json.return_value = {
+        "contacts": [{"id": "1", "name": "John Doe", "phone": "123"}],
+        "meta": {"total": 1}
+    }
+
+    result = asyncio.run(contacts.list_contacts(mock_client, limit=10))
+
+    mock_client.get.assert_awaited_with("/contacts/", params={"limit": 10})
+    assert result["contacts"] == [{"id": "1", "name": "John Doe"}]
+    assert result["meta"] == {"total": 1}
+
+def test_get_contact(mock_client):
+    mock_client.get.return_value.json.return_value = {"contact": {"id": "1", "phone": "123"}}
+
+    result = asyncio.run(contacts.get_contact(mock_client, "1", verbose=1))
+
+    mock_client.get.assert_awaited_with("/contacts/1")
+    assert result == {"id": "1", "phone": "123"}
+
+def test_update_contact(mock_client):
+    asyncio.run(contacts.update_contact(mock_client, "1", {"name": "John"}))
+    mock_client.put.assert_awaited_with("/contacts/1", json={"name": "John"})
+
+def test_upsert_contact(mock_client):
+    asyncio.run(contacts.upsert_contact(mock_client, {"email": "john@example.com"}))
+    mock_client.post.assert_awaited_with("/contacts/upsert", json={"email": "john@example.com"})
+
+def test_iter_search(mock_client):
+    mock_client.location_id = None
+    first, second = MagicMock(), MagicMock()
+    first.json.return_value = {"contacts": [{"id": "1", "searchAfter": [1, "1"]}]}
+    second.json.return_value = {"contacts": []}
+    mock_client.post.side_effect = [first, second]
+
+    async def collect():
+        return [c async for c in contacts.iter_search(mock_client, page_size=1, fields="id")]
+
+    assert asyncio.run(collect()) == [{"id": "1"}]
+    assert mock_client.post.await_args_list[1].kwargs["json"] == {"pageLimit": 1, "searchAfter": [1, "1"]}
+
+def test_iter_contacts(mock_client):
+    first, second = MagicMock(), MagicMock()
+    first.json.return_value = {"contacts": [{"id": "1"}, {"id": "2"}], "meta": {"startAfter": 5, "startAfterId": "2"}}
+    second.json.return_value = {"contacts": [{"id": "3"}], "meta": {"startAfter": 6, "startAfterId": "3"}}
+    mock_client.get.side_effect = [first, second]
+
+    async def collect():
+        return [c async for c in contacts.iter_contacts(mock_client, page_size=2)]
+
+    result = asyncio.run(collect())
+
+    assert [c["id"] for c in result] == ["1", "2", "3"]
+    mock_client.get.assert_awaited_with("/contacts/", params={"limit": 2, "locationId": "loc_123", "startAfter": 5, "startAfterId": "2"})
+
+def test_list_conversations(mock_client):
+    asyncio.run(conversations.list_conversations(mock_client))
+    mock_client.get.assert_awaited_with("/conversations/search", params={"limit": 20, "locationId": "loc_123"})
+
+def test_get_messages(mock_client):
+    asyncio.run(conversations.get_messages(mock_client, "conv_1", limit=5))
+    mock_client.get.assert_awaited_with("/conversations/conv_1/messages", params={"limit": 5})
+
+def test_list_opportunities(mock_client):
+    asyncio.run(opportunities.list_opportunities(mock_client))
+    mock_client.get.assert_awaited_with("/opportunities/search", params={"limit": 20, "location_id": "loc_123"})
+
+def test_create_opportunity(mock_client):
+    asyncio.run(opportunities.create_opportunity(mock_client, {"name": "Deal"}))
+    mock_client.post.assert_awaited_with("/opportunities/", json={"name": "Deal"})
+
+def test_list_events(mock_client):
+    asyncio.run(calendars.list_events(mock_client, "1000", "2000"))
+    mock_client.get.assert_awaited_with("/calendars/events", params={"startTime": "1000", "endTime": "2000", "locationId": "loc_123"})
+
+def test_delete_event(mock_client):
+    asyncio.run(calendars.delete_event(mock_client, "1"))
+    mock_client.delete.assert_awaited_with("/calendars/events/1")
+
+def test_list_records(mock_client):
+    asyncio.run(objects.list_records(mock_client, "key"))
+    mock_client.post.assert_awaited_with("/objects/key/records/search", json={"pageLimit": 20, "page": 1, "locationId": "loc_123"})
+
+def test_list_locations(mock_client):
+    asyncio.run(locations.list_locations(mock_client))
+    mock_client.get.assert_awaited_with("/locations/search", params={"limit": 10, "skip": 0})
+
+def test_list_workflows(mock_client):
+    asyncio.run(workflows.list_workflows(mock_client))
+    mock_client.get.assert_awaited_with("/workflows/", params={"locationId": "loc_123"})
+
+def _collect(aiterator):
+    async def run():
+        return [item async for item in aiterator]
+    return asyncio.run(run())
+
+def test_iter_opportunities(mock_client):
+    page = MagicMock()
+    page.json.return_value = {"opportunities": [{"id": "1"}], "meta": {}}
+    mock_client.get.return_value = page
+
+    assert _collect(opportunities.iter_opportunities(mock_client, page_size=2)) == [{"id": "1"}]
+
+def test_iter_records(mock_client):
+    page = MagicMock()
+    page.json.return_value = {"records": [{"id": "r1"}], "total": 1}
+    mock_client.post.return_value = page
+
+    assert _collect(objects.iter_records(mock_client, "key")) == [{"id": "r1"}]
+
+def test_iter_locations(mock_client):
+    page = MagicMock()
+    page.json.return_value = {"locations": [{"id": "a"}]}
+    mock_client.get.return_value = page
+
+    assert _collect(locations.iter_locations(mock_client)) == [{"id": "a"}]
+
+def test_list_all_locations_fetches_pages_in_waves(mock_client):
+    def page(path, params):
+        response = MagicMock()
+        # 5 locations, two per page: the third page is short
+        response.json.return_value = {"locations": [{"id": str(i)} for i in range(params["skip"], min(params["skip"] + 2, 5))]}
+        return response
+    mock_client.get.side_effect = page
+
+    result = asyncio.run(locations.list_all_locations(mock_client, page_size=2, company_id="co", parallel=2))
+
+    assert [location["id"] for location in result] == ["0", "1", "2", "3", "4"]
+    assert [c.kwargs["params"]["skip"] for c in mock_client.get.await_args_list] == [0, 2, 4, 6]
+    assert mock_client.get.await_args.kwargs["params"]["companyId"] == "co"
+
+def test_get_location_token(mock_client):
+    asyncio.run(oauth.get_location_token(mock_client, "co", "loc"))
+    mock_client.post.assert_awaited_with("/oauth/locationToken", data={"companyId": "co", "locationId": "loc"})
+
+def test_list_installed_locations(mock_client):
+    asyncio.run(oauth.list_installed_locations(mock_client, "co", "app", limit=50))
+    mock_client.get.assert_awaited_with("/oauth/installedLocations", params={
+        "companyId": "co", "appId": "app", "limit": 50, "skip": 0, "isInstalled": "true"})
+
+def test_list_all_installed_locations(mock_client):
+    def page(path, params):
+        response = MagicMock()
+        response.json.return_value = {"locations": [{"_id": str(params["skip"])}], "count": 3}
+        return response
+    mock_client.get.side_effect = page
+
+    result = asyncio.run(oauth.list_all_installed_locations(mock_client, "co", "app", page_size=1))
+
+    assert [location["_id"] for location in result] == ["0", "1", "2"]
@@ -0,0 +1,102 @@
+import asyncio
+import io
+import json
+import pytest
+from click.testing import CliRunner
+from unittest.mock import Mock, AsyncMock, patch
+from ghl import batch
+from ghl.batch import read_operations, resolve, run_batch
+from ghl.cli import cli
+
+def test_read_operations_reports_bad_lines():
+    source = io.StringIO('{"resource": "contacts", "action": "get", "id": "c1"}\n\nnot json\n[1]\n')
+
+    operations = list(read_operations(source))
+
+    assert [index for index, _ in operations] == [0, 2, 3]
+    assert operations[0][1]["id"] == "c1"
+    assert all(isinstance(op, ValueError) for _, op in operations[1:])
+
+def test_resolve_maps_operations_to_endpoints():
+    assert resolve({"resource": "contacts", "action": "update", "id": "c1", "payload": {"a": 1}}) == \
+        (batch.contacts.update_contact, ("c1", {"a": 1}))
+    assert resolve({"resource": "events", "action": "create", "payload": {"title": "x"}}) == \
+        (batch.calendars.create_event, ({"title": "x"},))
+    assert resolve({"resource": "objects", "action": "delete", "schemaKey": "custom_objects.pets", "id": "r1"}) == \
+        (batch.objects.delete_record, ("custom_objects.pets", "r1"))
+
+@pytest.mark.parametrize("operation, message", [
+    ({"resource": "invoices", "action": "get", "id": "1"}, "Unknown resource"),
+    ({"resource": "contacts", "action": "merge"}, "Unknown action"),
+    ({"resource": "opportunities", "action": "upsert", "payload": {}}, "does not support upsert"),
+    ({"resource": "contacts", "action": "get"}, "needs an id"),
+    ({"resource": "contacts", "action": "update", "id": "c1", "payload": [1]}, "needs a payload"),
+    ({"resource": "objects", "action": "get", "id": "r1"}, "schemaKey"),
+])
+def test_resolve_rejects_bad_operations(operation, message):
+    with pytest.raises(ValueError, match=message):
+        resolve(operation)
+
+def _operations(*delays):
+    return [(i, {"resource": "contacts", "action": "get", "id": f"c{i}", "delay": d}) for i, d in enumerate(delays)]
+
+def _run(mocker, operations, order, concurrency=3):
+    async def get_contact(client, contact_id):
+        operation = next(op for _, op in operations if op["id"] == contact_id)
+        await asyncio.sleep(operation["delay"])
+        if contact_id == "c1":
+            raise ValueError("404 Not Found")
+        return {"id": contact_id}
+
+    mocker.patch("ghl.batch.contacts.get_contact", AsyncMock(side_effect=get_contact))
+    emitted = []
+    summary = asyncio.run(run_batch(Mock(), iter(operations), emitted.append, concurrency, order))
+    return summary, emitted
+
+def test_run_batch_input_order(mocker):
+    summary, emitted = _run(mocker, _operations(0.03, 0.0, 0.01, 0.0), "input")
+
+    assert summary == {"succeeded": 3, "failed": 1}
+    assert [r["row"] for r in emitted] == [0, 1, 2, 3]
+    assert emitted[0] == {"row": 0, "resource": "contacts", "action": "get", "id": "c0", "status": "ok", "result": {"id": "c0"}}
+    assert emitted[1]["status"] == "error" and "404" in emitted[1]["error"]
+
+def test_run_batch_completion_order(mocker):
+    _, emitted = _run(mocker, _operations(0.05, 0.0, 0.02), "completion")
+
+    assert [r["row"] for r in emitted] == [1, 2, 0]
+
+def test_run_batch_bounds_concurrency(mocker):
+    running, peak = 0, 0
+
+    async def update_contact(client, contact_id, data):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.001)
+        running -= 1
+        return {}
+
+    mocker.patch("ghl.batch.contacts.update_contact", AsyncMock(side_effect=update_contact))
+    operations = [(i, {"resource": "contacts", "action": "update", "id": str(i), "payload": {}}) for i in range(50)]
+
+    summary = asyncio.run(run_batch(Mock(), operations, lambda result: None, concurrency=4))
+
+    assert summary == {"succeeded": 50, "failed": 0}
+    assert peak == 4
+
+@patch("ghl.commands.batch._async_client")
+@patch("ghl.cli.GHLClient")
+def test_batch_command(mock_client_cls, mock_async_client, tmp_path):
+    mock_async_client.return_value.__aenter__ = AsyncMock(return_value=Mock())
+    mock_async_client.return_value.__aexit__ = AsyncMock(return_value=None)
+    source = tmp_path / "ops.jsonl"
+    source.write_text('{"resource": "contacts", "action": "delete", "id": "c1"}\n{"resource": "nope", "action": "get"}\n')
+
+    with patch("ghl.batch.contacts.delete_contact", AsyncMock(return_value={"succeded": True})):
+        result = CliRunner().invoke(cli, ["--api-key", "key", "batch", str(source)])
+
+    assert result.exit_code == 0
+    lines = [json.loads(line) for line in result.output.splitlines() if line.startswith('{"row"')]
+    assert [(line["row"], line["status"]) for line in lines] == [(0, "ok"), (1, "error")]
+    assert '{"succeeded": 1, "failed": 1}' in result.output
@@ -0,0 +1,123 @@
+import asyncio
+import json
+import httpx
+from click.testing import CliRunner
+from unittest.mock import MagicMock, AsyncMock, patch
+from ghl.bulk import fetch_many, unique_ids
+from ghl.cache import ResponseCache, DEFAULT_TTLS, RECORD_TTLS
+from ghl.cli import cli
+from ghl.client import AsyncGHLClient
+from ghl.endpoints.aio import contacts, objects
+
+def _collect(aiterator):
+    async def run():
+        return [item async for item in aiterator]
+    return asyncio.run(run())
+
+def _not_found(item_id):
+    request = httpx.Request("GET", f"https://example.test/{item_id}")
+    return httpx.HTTPStatusError("404 Not Found", request=request, response=httpx.Response(404, request=request))
+
+def test_unique_ids_keeps_first_seen_order():
+    assert list(unique_ids(["b", "a", " b ", "", None, "c", "a"])) == ["b", "a", "c"]
+
+def test_fetch_many_dedupes_and_bounds_concurrency():
+    calls, running, peak = [], 0, 0
+
+    async def fetch(item_id):
+        nonlocal running, peak
+        calls.append(item_id)
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return {"id": item_id}
+
+    ids = [f"id{i % 10}" for i in range(30)]
+    results = _collect(fetch_many(fetch, ids, concurrency=4))
+
+    assert sorted(calls) == sorted(f"id{i}" for i in range(10))
+    assert len(results) == 10 and all(r["status"] == "ok" for r in results)
+    assert peak == 4
+
+def test_fetch_many_yields_as_completed_and_reports_missing():
+    async def fetch(item_id):
+        await asyncio.sleep({"slow": 0.05}.get(item_id, 0))
+        if item_id == "gone":
+            raise _not_found(item_id)
+        if item_id == "broken":
+            raise ValueError("500 Server Error")
+        return {"id": item_id}
+
+    results = _collect(fetch_many(fetch, ["slow", "gone", "fast", "broken"]))
+
+    assert results[-1] == {"id": "slow", "status": "ok", "result": {"id": "slow"}}
+    assert {"id": "gone", "status": "missing"} in results
+    assert {"id": "broken", "status": "error", "error": "500 Server Error"} in results
+
+def test_get_many_contacts_and_records():
+    client = MagicMock()
+    client.location_id = "loc_123"
+
+    def get(path, params=None):
+        response = MagicMock()
+        response.json.return_value = {"contact": {"id": path.rsplit("/", 1)[1], "phone": "1"}}
+        return response
+    client.get = AsyncMock(side_effect=get)
+
+    results = _collect(contacts.get_many_contacts(client, ["c1", "c2", "c1"], fields="id"))
+
+    assert sorted(r["result"]["id"] for r in results) == ["c1", "c2"]
+    assert all(set(r["result"]) == {"id"} for r in results)
+    assert client.get.await_count == 2
+
+    _collect(objects.get_many_records(client, "custom_objects.pets", ["r1"]))
+    client.get.assert_awaited_with("/objects/custom_objects.pets/records/r1")
+
+def test_get_many_answers_cached_ids_without_requests():
+    http = MagicMock()
+    http.get = AsyncMock(side_effect=lambda path, **kwargs: httpx.Response(
+        200, json={"contact": {"id": path.rsplit("/", 1)[1]}}, request=httpx.Request("GET", path)))
+    client = AsyncGHLClient("key", "loc", client=http, cache=ResponseCache(ttls={**DEFAULT_TTLS, **RECORD_TTLS}))
+
+    first = _collect(contacts.get_many_contacts(client, ["c1", "c2"]))
+    second = _collect(contacts.get_many_contacts(client, ["c2", "c1"]))
+
+    assert sorted(r["result"]["id"] for r in first) == sorted(r["result"]["id"] for r in second) == ["c1", "c2"]
+    assert http.get.await_count == 2
+
+@patch("ghl.cli.get_config", return_value={"api_key": "key", "location_id": "loc"})
+def test_get_command_streams_many_ids(mock_get_config, mocker):
+    async def get_contact(client, contact_id, *args):
+        if contact_id == "gone":
+            raise _not_found(contact_id)
+        return {"id": contact_id}
+    mocker.patch("ghl.endpoints.aio.contacts.get_contact", AsyncMock(side_effect=get_contact))
+
+    result = CliRunner().invoke(cli, ["contacts", "get", "c1", "-", "c1"], input="c2 gone\nc3\n")
+
+    assert result.exit_code == 0
+    assert sorted(json.loads(line)["id"] for line in result.stdout.splitlines()) == ["c1", "c2", "c3"]
+    assert json.loads(result.stderr) == {"found": 3, "missing": ["gone"], "failed": {}}
+
+@patch("ghl.cli.get_config", return_value={"api_key": "key", "location_id": "loc"})
+def test_get_command_fails_when_ids_fail(mock_get_config, mocker):
+    mocker.patch("ghl.endpoints.aio.opportunities.get_opportunity", AsyncMock(side_effect=ValueError("500 Server Error")))
+
+    result = CliRunner().invoke(cli, ["opportunities", "get", "o1", "o2"])
+
+    assert result.exit_code == 1
+    assert json.loads(result.stderr)["failed"] == {"o1": "500 Server Error", "o2": "500 Server Error"}
+
+@patch("ghl.cli.get_config", return_value={"location_id": "loc"})
+@patch("ghl.cli._open_mirror")
+def test_get_command_many_ids_locally(mock_open_mirror, mock_get_config):
+    mirror = mock_open_mirror.return_value
+    mirror.get_contact.side_effect = lambda location_id, contact_id: {"id": contact_id} if contact_id != "gone" else None
+
+    result = CliRunner().invoke(cli, ["contacts", "get", "--local", "c1", "gone"])
+
+    assert result.exit_code == 0
+    assert result.stdout == '{"id":"c1"}\n'
+    assert json.loads(result.stderr) == {"found": 1, "missing": ["gone"], "failed": {}}
+    mirror.close.assert_called_once()
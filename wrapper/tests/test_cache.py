@@ -0,0 +1,251 @@
+import asyncio
+import pytest
+import httpx
+from unittest.mock import MagicMock
+from ghl.cache import (ResponseCache, SQLiteResponseCache, DEFAULT_TTLS, RECORD_TTLS, cache_key, tenant_key,
+                       is_mutation, affects)
+from ghl.client import GHLClient, AsyncGHLClient
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+def _response(data=None):
+    response = MagicMock(spec=httpx.Response)
+    response.status_code = 200
+    response.json.return_value = data or {}
+    response.raise_for_status.return_value = None
+    return response
+
+def test_cache_key_is_order_independent():
+    assert cache_key("/calendars/", {"b": 1, "a": "x"}) == cache_key("/calendars/", {"a": "x", "b": 1})
+    assert cache_key("/calendars/", {"a": None}) == "/calendars/"
+
+def test_cache_key_is_scoped_to_tenant():
+    tenant = tenant_key("loc", "secret_token")
+    assert tenant != tenant_key("loc", "other_token") != tenant_key("other", "secret_token")
+    assert "secret_token" not in tenant
+    assert cache_key("/calendars/", {"a": 1}, tenant) != cache_key("/calendars/", {"a": 1})
+
+def test_ttl_routes():
+    cache = ResponseCache()
+    assert cache.ttl_for("/opportunities/pipelines") == 3600
+    assert cache.ttl_for("/calendars/") == 3600
+    assert cache.ttl_for("/calendars/cal_1") == 3600
+    assert cache.ttl_for("/objects/custom_objects.pet") == 3600
+    assert cache.ttl_for("/workflows/") == 3600
+    assert cache.ttl_for("/locations/loc_1") == 3600
+    # Volatile data is never cached
+    assert cache.ttl_for("/calendars/events") is None
+    assert cache.ttl_for("/locations/search") is None
+    assert cache.ttl_for("/objects/key/records/r1") is None
+    assert cache.ttl_for("/contacts/") is None
+
+def test_record_ttls_are_opt_in():
+    cache = ResponseCache(ttls={**DEFAULT_TTLS, **RECORD_TTLS})
+    assert ResponseCache().ttl_for("/contacts/c1") is None
+    assert cache.ttl_for("/contacts/c1") == 300
+    assert cache.ttl_for("/opportunities/o1") == 300
+    assert cache.ttl_for("/conversations/v1") == 300
+    assert cache.ttl_for("/objects/custom_objects.pets/records/r1") == 300
+    assert cache.ttl_for("/opportunities/pipelines") == 3600
+    for path in ("/contacts/", "/contacts/search", "/contacts/c1/tasks", "/opportunities/search", "/objects/key/records/search"):
+        assert cache.ttl_for(path) is None, path
+
+def test_is_mutation():
+    assert is_mutation("put", "/calendars/1")
+    assert is_mutation("post", "/calendars/")
+    assert not is_mutation("post", "/objects/key/records/search")
+    assert not is_mutation("get", "/calendars/")
+
+def test_affects():
+    assert affects("/calendars/abc", "/calendars/abc")
+    assert affects("/calendars/abc", "/calendars/")
+    assert affects("/calendars/", "/calendars/abc")
+    assert not affects("/calendars/abc", "/calendars/xyz")
+    assert not affects("/workflows/", "/calendars/")
+
+def test_expiry():
+    clock = FakeClock()
+    cache = ResponseCache(ttls={"/workflows/": 10}, clock=clock)
+    response = _response()
+
+    cache.set("k", "/workflows/", response)
+    assert cache.get("k") is response
+
+    clock.now = 11
+    assert cache.get("k") is None
+    assert cache.stats() == {"entries": 0, "hits": 1, "misses": 1, "evictions": 0}
+
+def test_lru_eviction():
+    cache = ResponseCache(max_entries=2, ttls={"/calendars/.*": 60})
+    cache.set("a", "/calendars/a", _response())
+    cache.set("b", "/calendars/b", _response())
+    cache.get("a")
+    cache.set("c", "/calendars/c", _response())
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert cache.stats()["evictions"] == 1
+
+def test_uncacheable_path_is_ignored():
+    cache = ResponseCache()
+    cache.set("k", "/contacts/", _response())
+    assert cache.stats()["entries"] == 0
+
+def test_client_serves_repeat_gets_from_cache(mock_httpx_client):
+    client = GHLClient(api_key="key", location_id="loc", client=mock_httpx_client, cache=ResponseCache())
+    mock_httpx_client.get.return_value = _response({"pipelines": []})
+
+    first = client.get("/opportunities/pipelines", params={"locationId": "loc"})
+    second = client.get("/opportunities/pipelines", params={"locationId": "loc"})
+
+    assert first is second
+    assert mock_httpx_client.get.call_count == 1
+    assert client.cache.stats()["hits"] == 1
+
+def test_tenants_do_not_share_entries(tmp_path):
+    cache = SQLiteResponseCache(tmp_path / "cache.db")
+
+    def fetch(api_key, location_id, **oauth):
+        http = MagicMock()
+        http.get.return_value = _real_response({"workflows": [api_key]})
+        client = GHLClient(api_key=api_key, location_id=location_id, client=http, cache=cache, **oauth)
+        return client.get("/workflows/", params={"locationId": "loc"}).json(), http.get.call_count
+
+    assert fetch("key_a", "loc") == ({"workflows": ["key_a"]}, 1)
+    assert fetch("key_b", "loc") == ({"workflows": ["key_b"]}, 1)
+    assert fetch("key_a", "other") == ({"workflows": ["key_a"]}, 1)
+    assert fetch("key_a", "loc") == ({"workflows": ["key_a"]}, 0)
+    # An OAuth install keeps its entries when the access token is refreshed
+    assert fetch("token_1", "loc", client_id="app")[1] == 1
+    assert fetch("token_2", "loc", client_id="app") == ({"workflows": ["token_1"]}, 0)
+
+def test_client_does_not_cache_volatile_routes(mock_httpx_client):
+    client = GHLClient(api_key="key", client=mock_httpx_client, cache=ResponseCache())
+    mock_httpx_client.get.return_value = _response()
+
+    client.get("/contacts/")
+    client.get("/contacts/")
+
+    assert mock_httpx_client.get.call_count == 2
+
+def test_client_write_invalidates(mock_httpx_client):
+    client = GHLClient(api_key="key", client=mock_httpx_client, cache=ResponseCache())
+    mock_httpx_client.get.return_value = _response()
+    mock_httpx_client.put.return_value = _response()
+
+    client.get("/calendars/", params={"locationId": "loc"})
+    client.get("/calendars/cal_1")
+    client.put("/calendars/cal_1", json={"name": "New"})
+    client.get("/calendars/", params={"locationId": "loc"})
+    client.get("/calendars/cal_1")
+
+    assert mock_httpx_client.get.call_count == 4
+
+def test_client_read_only_post_keeps_cache(mock_httpx_client):
+    client = GHLClient(api_key="key", client=mock_httpx_client, cache=ResponseCache())
+    mock_httpx_client.get.return_value = _response()
+    mock_httpx_client.post.return_value = _response()
+
+    client.get("/objects/key")
+    client.post("/objects/key/records/search", json={})
+    client.get("/objects/key")
+
+    assert mock_httpx_client.get.call_count == 1
+
+def test_async_client_uses_cache(mock_async_httpx_client):
+    client = AsyncGHLClient(api_key="key", client=mock_async_httpx_client, cache=ResponseCache())
+    mock_async_httpx_client.get.return_value = _response()
+
+    async def run():
+        await client.get("/workflows/", params={"locationId": "loc"})
+        await client.get("/workflows/", params={"locationId": "loc"})
+
+    asyncio.run(run())
+    assert mock_async_httpx_client.get.await_count == 1
+
+def _real_response(data, status_code=200):
+    return httpx.Response(status_code, json=data, request=httpx.Request("GET", "https://example.com/calendars/"))
+
+def test_sqlite_round_trip(tmp_path):
+    cache = SQLiteResponseCache(tmp_path / "cache.db")
+    cache.set("/calendars/?locationId=loc", "/calendars/", _real_response({"calendars": [1, 2]}))
+
+    cached = cache.get("/calendars/?locationId=loc")
+
+    assert cached.status_code == 200
+    assert cached.json() == {"calendars": [1, 2]}
+    cached.raise_for_status()
+    assert cache.get("/calendars/?locationId=other") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+def test_sqlite_shared_between_instances(tmp_path):
+    writer = SQLiteResponseCache(tmp_path / "cache.db")
+    reader = SQLiteResponseCache(tmp_path / "cache.db")
+
+    writer.set("/workflows/", "/workflows/", _real_response({"workflows": []}))
+
+    assert reader.get("/workflows/").json() == {"workflows": []}
+
+def test_sqlite_expiry(tmp_path):
+    clock = FakeClock()
+    cache = SQLiteResponseCache(tmp_path / "cache.db", ttls={"/workflows/": 10}, clock=clock)
+    cache.set("/workflows/", "/workflows/", _real_response({}))
+
+    clock.now = 11
+    assert cache.get("/workflows/") is None
+    assert cache.stats()["entries"] == 0
+
+def test_sqlite_evicts_least_recently_used(tmp_path):
+    clock = FakeClock()
+    cache = SQLiteResponseCache(tmp_path / "cache.db", max_entries=2, clock=clock)
+    for i, name in enumerate(["a", "b"]):
+        clock.now = i
+        cache.set(f"/calendars/{name}", f"/calendars/{name}", _real_response({}))
+    clock.now = 5
+    cache.get("/calendars/a")
+    clock.now = 6
+    cache.set("/calendars/c", "/calendars/c", _real_response({}))
+
+    assert cache.get("/calendars/b") is None
+    assert cache.get("/calendars/a") is not None
+    assert cache.stats()["evictions"] == 1
+
+def test_sqlite_size_cap(tmp_path):
+    cache = SQLiteResponseCache(tmp_path / "cache.db", max_bytes=100)
+    cache.set("/calendars/a", "/calendars/a", _real_response({"x": "y" * 60}))
+    cache.set("/calendars/b", "/calendars/b", _real_response({"x": "y" * 60}))
+
+    stats = cache.stats()
+    assert stats["entries"] == 1
+    assert stats["bytes"] <= 100
+
+def test_sqlite_invalidate_and_clear(tmp_path):
+    cache = SQLiteResponseCache(tmp_path / "cache.db")
+    cache.set("/calendars/?locationId=loc", "/calendars/", _real_response({}))
+    cache.set("/workflows/", "/workflows/", _real_response({}))
+
+    assert cache.invalidate("/calendars/cal_1") == 1
+    assert cache.stats()["entries"] == 1
+
+    cache.clear()
+    assert cache.stats() == {"entries": 0, "bytes": 0, "hits": 0, "misses": 0, "evictions": 0}
+
+def test_client_with_sqlite_cache(tmp_path, mock_httpx_client):
+    cache = SQLiteResponseCache(tmp_path / "cache.db")
+    client = GHLClient(api_key="key", client=mock_httpx_client, cache=cache)
+    mock_httpx_client.get.return_value = _real_response({"pipelines": ["p1"]})
+
+    client.get("/opportunities/pipelines", params={"locationId": "loc"})
+    # A fresh client (as in a new CLI process) reads the same file
+    other = GHLClient(api_key="key", client=mock_httpx_client, cache=SQLiteResponseCache(tmp_path / "cache.db"))
+    result = other.get("/opportunities/pipelines", params={"locationId": "loc"})
+
+    assert result.json() == {"pipelines": ["p1"]}
+    assert mock_httpx_client.get.call_count == 1
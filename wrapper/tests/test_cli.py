@@ -1,7 +1,7 @@
 import json
 import pytest
 from click.testing import CliRunner
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, AsyncMock, patch
 from ghl.cli import cli
 
 @pytest.fixture
@@ -34,6 +34,32 @@ def test_contacts_list(mock_list_contacts, mock_client_cls, runner):
     mock_client_cls.assert_called_with("test_key", None)
     mock_list_contacts.assert_called_with(mock_client, 20, None, None, 0)
 
+@patch("ghl.cli.GHLClient")
+@patch("ghl.endpoints.contacts.iter_contacts")
+def test_contacts_list_all(mock_iter_contacts, mock_client_cls, runner):
+    mock_client = MagicMock()
+    mock_client_cls.return_value = mock_client
+    mock_iter_contacts.return_value = iter([{"id": "1"}, {"id": "2"}])
+
+    result = runner.invoke(cli, ["--api-key", "test_key", "contacts", "list", "--all", "--fields", "id"])
+
+    assert result.exit_code == 0
+    assert [json.loads(line) for line in result.output.splitlines()] == [{"id": "1"}, {"id": "2"}]
+    mock_iter_contacts.assert_called_with(mock_client, query=None, fields="id", verbose=0)
+
+@patch("ghl.cli.GHLClient")
+@patch("ghl.endpoints.conversations.iter_messages")
+def test_conversations_messages_all(mock_iter_messages, mock_client_cls, runner):
+    mock_client = MagicMock()
+    mock_client_cls.return_value = mock_client
+    mock_iter_messages.return_value = iter([{"id": "m1"}, {"id": "m2"}])
+
+    result = runner.invoke(cli, ["--api-key", "test_key", "conversations", "messages", "conv_1", "--all", "--type", "TYPE_SMS"])
+
+    assert result.exit_code == 0
+    assert [json.loads(line) for line in result.output.splitlines()] == [{"id": "m1"}, {"id": "m2"}]
+    mock_iter_messages.assert_called_with(mock_client, "conv_1", message_type="TYPE_SMS")
+
 @patch("ghl.cli.GHLClient")
 @patch("ghl.endpoints.contacts.create_contact")
 def test_contacts_create_with_data(mock_create_contact, mock_client_cls, runner):
@@ -90,3 +116,163 @@ def test_contacts_list_exception(mock_list_contacts, mock_client_cls, runner):
 
     assert result.exit_code == 1
     assert "API Error" in result.output
+
+@patch("ghl.cli.get_config")
+@patch("ghl.cli.GHLClient")
+def test_cli_cache_enabled(mock_client_cls, mock_get_config, runner, tmp_path):
+    mock_get_config.return_value = {"api_key": "key", "location_id": "loc", "cache": True}
+
+    with patch("ghl.cli.CACHE_FILE", tmp_path / "cache.db"):
+        with patch("ghl.endpoints.opportunities.list_pipelines", return_value={}):
+            result = runner.invoke(cli, ["--cache", "opportunities", "pipelines"])
+
+    assert result.exit_code == 0
+    mock_get_config.assert_called_with(None, None, True)
+    assert "cache" in mock_client_cls.call_args.kwargs
+
+@patch("ghl.cli.get_config")
+@patch("ghl.cli.GHLClient")
+def test_cli_cache_records(mock_client_cls, mock_get_config, runner, tmp_path):
+    mock_get_config.return_value = {"api_key": "key", "location_id": "loc", "cache": True, "cache_records": True}
+
+    with patch("ghl.cli.CACHE_FILE", tmp_path / "cache.db"):
+        with patch("ghl.endpoints.opportunities.list_pipelines", return_value={}):
+            result = runner.invoke(cli, ["opportunities", "pipelines"])
+
+    assert result.exit_code == 0
+    cache = mock_client_cls.call_args.kwargs["cache"]
+    assert cache.ttl_for("/contacts/c1") == 300
+
+def test_cache_stats_and_clear(runner, tmp_path):
+    with patch("ghl.cli.CACHE_FILE", tmp_path / "cache.db"):
+        result = runner.invoke(cli, ["cache", "stats"])
+        assert result.exit_code == 0
+        assert json.loads(result.output)["entries"] == 0
+
+        result = runner.invoke(cli, ["cache", "clear"])
+        assert result.exit_code == 0
+        assert json.loads(result.output) == {"cleared": True}
+
+@patch("ghl.cli.get_config")
+@patch("ghl.cli.GHLClient")
+def test_cli_oauth_uses_token_store(mock_client_cls, mock_get_config, runner, tmp_path):
+    mock_get_config.return_value = {
+        "api_key": None, "location_id": "loc",
+        "client_id": "id", "client_secret": "secret", "refresh_token": "refresh",
+    }
+
+    with patch("ghl.cli.TOKENS_FILE", tmp_path / "tokens.db"):
+        with patch("ghl.endpoints.opportunities.list_pipelines", return_value={}):
+            result = runner.invoke(cli, ["opportunities", "pipelines"])
+
+    assert result.exit_code == 0
+    kwargs = mock_client_cls.call_args.kwargs
+    assert kwargs["refresh_token"] == "refresh"
+    assert kwargs["token_store"].path == tmp_path / "tokens.db"
+
+@patch("ghl.commands.contacts._async_client")
+@patch("ghl.cli.GHLClient")
+def test_contacts_import_resumes(mock_client_cls, mock_async_client, runner, tmp_path):
+    source = tmp_path / "contacts.csv"
+    source.write_text("email\na@x.com\nb@x.com\nc@x.com\n")
+    (tmp_path / "contacts.csv.journal").write_text("0\n")
+    async_client = MagicMock()
+    async_client.__aenter__.return_value = async_client
+    async_client.location_id = "loc"
+    mock_async_client.return_value = async_client
+
+    with patch("ghl.importer.contacts.upsert_contact", AsyncMock(return_value={"new": True, "contact": {"id": "x"}})) as mock_upsert:
+        result = runner.invoke(cli, ["--api-key", "key", "contacts", "import", str(source), "--concurrency", "2"])
+
+    assert result.exit_code == 0, result.output
+    assert json.loads(result.output) == {"created": 2, "updated": 0, "failed": 0, "skipped": 1}
+    assert mock_upsert.await_count == 2
+    assert (tmp_path / "contacts.csv.journal").read_text().split() == ["0", "1", "2"]
+    assert len((tmp_path / "contacts.csv.report.ndjson").read_text().splitlines()) == 2
+
+def test_contacts_import_stdin_needs_format(runner):
+    result = runner.invoke(cli, ["--api-key", "key", "contacts", "import", "-"], input="")
+    assert result.exit_code == 1
+    assert "--format" in result.output
+
+@patch("ghl.export.export_contacts")
+@patch("ghl.cli.GHLClient")
+def test_contacts_export(mock_client_cls, mock_export, runner, tmp_path):
+    mock_export.return_value = {"rows": 3, "pages": 1, "resumed": False}
+    out = tmp_path / "contacts.csv"
+
+    result = runner.invoke(cli, ["--api-key", "key", "contacts", "export", "--format", "csv", "--out", str(out)])
+
+    assert result.exit_code == 0
+    assert json.loads(result.output)["rows"] == 3
+    mock_export.assert_called_once_with(mock_client_cls.return_value, str(out), "csv", fields=None, query=None, restart=False)
+
+def test_contacts_list_local(runner, tmp_path):
+    from ghl.mirror import Mirror
+    mirror = Mirror(tmp_path / "mirror.db")
+    client = MagicMock()
+    client.location_id = "loc"
+    client.get.return_value.json.return_value = {"contacts": [{"id": "c1", "email": "a@x.com", "phone": "1"}], "meta": {}}
+    mirror.sync_contacts(client)
+    mirror.close()
+
+    with patch("ghl.cli.MIRROR_FILE", tmp_path / "mirror.db"), patch("ghl.cli.get_config", return_value={"location_id": "loc"}):
+        result = runner.invoke(cli, ["contacts", "list", "--local"])
+        missing = runner.invoke(cli, ["contacts", "get", "nope", "--local"])
+
+    assert result.exit_code == 0
+    assert json.loads(result.output) == {"contacts": [{"id": "c1", "email": "a@x.com"}], "meta": {"total": 1}}
+    assert missing.exit_code == 1
+    assert "not in the local mirror" in missing.output
+
+@patch("ghl.cli.Mirror")
+@patch("ghl.cli.GHLClient")
+def test_sync_command(mock_client_cls, mock_mirror_cls, runner):
+    mock_mirror_cls.return_value.sync.return_value = {"contacts": {"fetched": 1, "removed": 0}}
+
+    result = runner.invoke(cli, ["--api-key", "key", "sync", "--only", "contacts", "--full"])
+
+    assert result.exit_code == 0
+    mock_mirror_cls.return_value.sync.assert_called_once_with(mock_client_cls.return_value, ["contacts"], True, None)
+
+def test_contacts_search_local(runner, tmp_path):
+    export = tmp_path / "contacts.jsonl"
+    export.write_text('{"id": "c1", "email": "a@example.com"}\n{"id": "c2", "email": "b@other.com"}\n')
+
+    with patch("ghl.cli.MIRROR_FILE", tmp_path / "mirror.db"), patch("ghl.cli.get_config", return_value={"location_id": "loc"}):
+        loaded = runner.invoke(cli, ["sync", "--load", str(export)])
+        result = runner.invoke(cli, ["contacts", "search", "--local", "--query", "email:*@example.com"])
+        bad = runner.invoke(cli, ["contacts", "search", "--local", "--query", "colour:red"])
+
+    assert json.loads(loaded.output) == {"loaded": 2}
+    assert result.exit_code == 0
+    assert json.loads(result.output) == {"contacts": [{"id": "c1", "email": "a@example.com"}], "meta": {"total": 1}}
+    assert bad.exit_code == 1
+    assert "Unknown search field" in bad.output
+
+@patch("ghl.cli.GHLClient")
+def test_contacts_search_filters(mock_client_cls, runner):
+    with patch("ghl.endpoints.contacts.search_contacts", return_value={"contacts": [], "total": 0}) as mock_search:
+        result = runner.invoke(cli, ["--api-key", "key", "contacts", "search", "--filter", "tags:contains:vip",
+                                     "--filter", "dateAdded:range:2024-01-01..2024-01-31", "--sort", "dateAdded:desc"])
+
+    assert result.exit_code == 0
+    mock_search.assert_called_once_with(
+        mock_client_cls.return_value, None, None, 0,
+        [{"field": "tags", "operator": "contains", "value": "vip"},
+         {"field": "dateAdded", "operator": "range", "value": {"gte": "2024-01-01", "lte": "2024-01-31"}}],
+        [{"field": "dateAdded", "direction": "desc"}], 100,
+    )
+
+    bad = runner.invoke(cli, ["--api-key", "key", "contacts", "search", "--filter", "tags:like:vip"])
+    assert bad.exit_code == 1
+    assert "Unknown filter operator" in bad.output
+
+@patch("ghl.cli.GHLClient")
+def test_compact_output(mock_client_cls, runner):
+    with patch("ghl.endpoints.contacts.get_contact", return_value={"id": "c1", "email": "a@x.com"}):
+        pretty = runner.invoke(cli, ["--api-key", "key", "contacts", "get", "c1"])
+        compact = runner.invoke(cli, ["--api-key", "key", "--compact", "contacts", "get", "c1"])
+
+    assert pretty.output == '{\n  "id": "c1",\n  "email": "a@x.com"\n}\n'
+    assert compact.output == '{"id":"c1","email":"a@x.com"}\n'
@@ -36,6 +36,7 @@ COMMANDS = [
     (["opportunities", "get", "1"], "ghl.endpoints.opportunities.get_opportunity"),
     (["opportunities", "delete", "1"], "ghl.endpoints.opportunities.delete_opportunity"),
     (["opportunities", "pipelines"], "ghl.endpoints.opportunities.list_pipelines"),
+    (["opportunities", "list", "--all"], "ghl.endpoints.opportunities.iter_opportunities"),
 
     # Calendars
     (["calendars", "list"], "ghl.endpoints.calendars.list_calendars"),
@@ -50,11 +51,13 @@ COMMANDS = [
     (["objects", "list-schemas"], "ghl.endpoints.objects.list_schemas"),
     (["objects", "get-schema", "key"], "ghl.endpoints.objects.get_schema"),
     (["objects", "list", "key"], "ghl.endpoints.objects.list_records"),
+    (["objects", "list", "key", "--all"], "ghl.endpoints.objects.iter_records"),
     (["objects", "get", "key", "id"], "ghl.endpoints.objects.get_record"),
     (["objects", "delete", "key", "id"], "ghl.endpoints.objects.delete_record"),
 
     # Locations
     (["locations", "list"], "ghl.endpoints.locations.list_locations"),
+    (["locations", "list", "--all"], "ghl.endpoints.locations.iter_locations"),
     (["locations", "get", "1"], "ghl.endpoints.locations.get_location"),
     (["locations", "delete", "1"], "ghl.endpoints.locations.delete_location"),
 ]
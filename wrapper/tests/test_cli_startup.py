@@ -0,0 +1,53 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+import pytest
+from click.testing import CliRunner
+from unittest.mock import patch
+from ghl.cli import cli
+from ghl.commands import COMMANDS, LazyGroup
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+# Modules `ghl --help` must not load (benchmarks/bench_cli_startup.py times it)
+HEAVY_MODULES = ["httpx", "pydantic", "ghl.client", "ghl.endpoints", "ghl.mirror", "ghl.commands.contacts"]
+
+PROBE = """
+import json, sys
+from ghl.cli import cli
+try:
+    cli(sys.argv[1:], prog_name="ghl")
+except SystemExit:
+    pass
+print(json.dumps({"loaded": [m for m in %r if m in sys.modules]}), file=sys.stderr)
+""" % (HEAVY_MODULES,)
+
+def _probe(*args):
+    env = {**os.environ, "PYTHONPATH": str(SRC), "GHL_API_KEY": "key"}
+    result = subprocess.run([sys.executable, "-c", PROBE, *args], capture_output=True, text=True, env=env, timeout=60)
+    return json.loads(result.stderr.strip().splitlines()[-1])
+
+def test_help_skips_heavy_imports():
+    assert _probe("--help")["loaded"] == []
+    assert _probe("no-such-command")["loaded"] == []
+
+def test_group_loads_on_use():
+    assert "httpx" in _probe("contacts", "--help")["loaded"]
+
+def test_help_does_not_read_config():
+    with patch("ghl.cli.get_config") as mock_get_config, patch("ghl.cli.GHLClient") as mock_client_cls:
+        result = CliRunner().invoke(cli, ["--help"])
+        local = CliRunner().invoke(cli, ["cache", "--help"])
+
+    assert result.exit_code == 0 and local.exit_code == 0
+    mock_get_config.assert_not_called()
+    mock_client_cls.assert_not_called()
+
+@pytest.mark.parametrize("name", sorted(COMMANDS))
+def test_registered_help_matches_command(name):
+    group = LazyGroup(lazy_commands=COMMANDS)
+    command = group.get_command(None, name)
+
+    assert command.get_short_help_str(limit=200) == COMMANDS[name][1]
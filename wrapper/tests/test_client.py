@@ -1,6 +1,11 @@
+import asyncio
+import threading
+import time
 import pytest
 import httpx
-from unittest.mock import MagicMock, call
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, AsyncMock, call
+from ghl.retry import RetryPolicy
 
 def test_init(ghl_client):
     assert ghl_client.api_key == "test_key"
@@ -129,3 +134,155 @@ def test_rate_limit_error(ghl_client, mock_httpx_client):
 
     with pytest.raises(httpx.HTTPStatusError):
         ghl_client.get("/test")
+
+def _token_response(access_token, expires_in=None):
+    response = MagicMock(spec=httpx.Response)
+    response.status_code = 200
+    data = {"access_token": access_token, "refresh_token": f"refresh_{access_token}"}
+    if expires_in:
+        data["expires_in"] = expires_in
+    response.json.return_value = data
+    response.raise_for_status.return_value = None
+    return response
+
+def _auth_checking_get(mock_httpx_client, valid_token):
+    def get(url, **kwargs):
+        response = MagicMock(spec=httpx.Response)
+        if mock_httpx_client.headers["Authorization"] == f"Bearer {valid_token}":
+            response.status_code = 200
+            response.raise_for_status.return_value = None
+        else:
+            response.status_code = 401
+            response.content = b""
+            response.json.side_effect = ValueError()
+            response.raise_for_status.side_effect = httpx.HTTPStatusError("Unauthorized", request=MagicMock(), response=response)
+        return response
+    return get
+
+def test_refresh_records_expiry(ghl_client_oauth, mocker):
+    mock_token_client = MagicMock(spec=httpx.Client)
+    mock_token_client.post.return_value = _token_response("new_token", expires_in=3600)
+    mocker.patch("httpx.Client", return_value=mock_token_client)
+
+    before = time.time()
+    ghl_client_oauth.refresh_access_token()
+
+    assert ghl_client_oauth.token_expires_at == pytest.approx(before + 3600, abs=5)
+
+def test_proactive_refresh_before_expiry(ghl_client_oauth, mock_httpx_client, mocker):
+    mock_token_client = MagicMock(spec=httpx.Client)
+    mock_token_client.post.return_value = _token_response("new_token", expires_in=3600)
+    mocker.patch("httpx.Client", return_value=mock_token_client)
+    mock_httpx_client.get.side_effect = _auth_checking_get(mock_httpx_client, "new_token")
+    # Token expires within the refresh margin
+    ghl_client_oauth.token_expires_at = time.time() + 10
+
+    result = ghl_client_oauth.get("/test")
+
+    assert result.status_code == 200
+    # No failed round-trip: the refresh happened before the request was sent
+    assert mock_httpx_client.get.call_count == 1
+    mock_token_client.post.assert_called_once()
+
+def test_token_client_is_reused(ghl_client_oauth, mocker):
+    mock_token_client = MagicMock(spec=httpx.Client)
+    mock_token_client.post.side_effect = [_token_response("t1"), _token_response("t2")]
+    client_cls = mocker.patch("httpx.Client", return_value=mock_token_client)
+
+    ghl_client_oauth.refresh_access_token()
+    ghl_client_oauth.refresh_access_token()
+
+    assert client_cls.call_count == 1
+    assert mock_token_client.post.call_count == 2
+
+def test_concurrent_401s_refresh_once(ghl_client_oauth, mock_httpx_client, mocker):
+    refreshing = threading.Event()
+
+    def slow_refresh(url, data):
+        refreshing.wait(timeout=0.2)
+        return _token_response("new_token")
+
+    mock_token_client = MagicMock(spec=httpx.Client)
+    mock_token_client.post.side_effect = slow_refresh
+    mocker.patch("httpx.Client", return_value=mock_token_client)
+    mock_httpx_client.get.side_effect = _auth_checking_get(mock_httpx_client, "new_token")
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda i: ghl_client_oauth.get(f"/test/{i}"), range(8)))
+
+    assert all(r.status_code == 200 for r in results)
+    mock_token_client.post.assert_called_once()
+    assert ghl_client_oauth.refresh_token == "refresh_new_token"
+
+def test_async_concurrent_401s_refresh_once(async_ghl_client_oauth, mock_async_httpx_client, mocker):
+    async def slow_refresh(url, data):
+        await asyncio.sleep(0.01)
+        return _token_response("new_token")
+
+    mock_token_client = AsyncMock(spec=httpx.AsyncClient)
+    mock_token_client.post.side_effect = slow_refresh
+    mocker.patch("httpx.AsyncClient", return_value=mock_token_client)
+    sync_get = _auth_checking_get(mock_async_httpx_client, "new_token")
+
+    async def get(url, **kwargs):
+        await asyncio.sleep(0)
+        return sync_get(url, **kwargs)
+
+    mock_async_httpx_client.get.side_effect = get
+
+    async def run():
+        return await asyncio.gather(*(async_ghl_client_oauth.get(f"/test/{i}") for i in range(20)))
+
+    results = asyncio.run(run())
+
+    assert all(r.status_code == 200 for r in results)
+    assert mock_token_client.post.await_count == 1
+
+def test_responses_decode_with_codec(mocker):
+    from ghl import codec
+    from ghl.client import GHLClient
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=b'{"contacts": [{"id": "1"}]}'))
+    client = GHLClient(api_key="key", client=httpx.Client(transport=transport, base_url="https://test"))
+    loads = mocker.spy(codec, "loads")
+    mocker.patch.object(codec, "BACKEND", "orjson" if codec.orjson else "json")
+
+    assert client.get("/contacts/").json() == {"contacts": [{"id": "1"}]}
+    assert loads.called == (codec.orjson is not None)
+
+def _streaming_client(handler, **kwargs):
+    from ghl.client import GHLClient
+    return GHLClient(api_key="key", client=httpx.Client(transport=httpx.MockTransport(handler), base_url="https://test"), **kwargs)
+
+def test_stream_items_yields_array_elements_from_chunks():
+    body = b'{"contacts": [{"id": "1"}, {"id": "2"}], "meta": {"total": 2}}'
+    chunks = [body[i:i + 4] for i in range(0, len(body), 4)]
+    client = _streaming_client(lambda request: httpx.Response(200, content=iter(chunks)))
+    rest = {}
+
+    items = list(client.stream_items("/contacts/", "contacts", params={"limit": 2}, rest=rest))
+
+    assert items == [{"id": "1"}, {"id": "2"}]
+    assert rest == {"contacts": [], "meta": {"total": 2}}
+
+def test_stream_items_retries_before_the_body():
+    responses = iter([httpx.Response(429, json={"message": "slow down"}), httpx.Response(200, content=b'{"contacts": [{"id": "1"}]}')])
+    client = _streaming_client(lambda request: next(responses), retry_policy=RetryPolicy(max_attempts=2))
+
+    assert list(client.stream_items("/contacts/", "contacts")) == [{"id": "1"}]
+
+def test_stream_items_raises_with_error_body():
+    client = _streaming_client(lambda request: httpx.Response(404, json={"message": "Contact not found"}),
+                               retry_policy=RetryPolicy(max_attempts=1))
+
+    with pytest.raises(httpx.HTTPStatusError, match="Contact not found"):
+        list(client.stream_items("/contacts/x", "contacts"))
+
+def test_post_form_data(ghl_client, mock_httpx_client):
+    response = MagicMock(spec=httpx.Response)
+    response.status_code = 200
+    mock_httpx_client.post.return_value = response
+
+    ghl_client.post("/oauth/locationToken", data={"companyId": "co", "locationId": "loc"})
+
+    mock_httpx_client.post.assert_called_once_with("/oauth/locationToken", json=None, params=None,
+                                                   data={"companyId": "co", "locationId": "loc"})
@@ -0,0 +1,26 @@
+import pytest
+from ghl import codec
+
+@pytest.fixture(params=["json", pytest.param("orjson", marks=pytest.mark.skipif(codec.orjson is None, reason="orjson not installed"))])
+def backend(request):
+    previous = codec.BACKEND
+    codec.use(request.param)
+    yield request.param
+    codec.use(previous)
+
+def test_round_trip(backend):
+    data = {"id": "c1", "name": "Zoë", "tags": ["a"], "n": 1.5, "ok": True, "none": None}
+    assert codec.loads(codec.dumps(data)) == data
+    assert codec.loads(codec.dump_bytes(data)) == data
+
+def test_compact_and_pretty_output_match_across_backends(backend):
+    data = {"a": [1, 2], "b": {"c": "é"}}
+    assert codec.dumps(data) == '{"a":[1,2],"b":{"c":"é"}}'
+    assert codec.dumps(data, pretty=True) == '{\n  "a": [\n    1,\n    2\n  ],\n  "b": {\n    "c": "é"\n  }\n}'
+
+def test_values_orjson_rejects_fall_back(backend):
+    assert codec.loads(codec.dumps({"big": 2 ** 70})) == {"big": 2 ** 70}
+
+def test_use_rejects_unknown_backend():
+    with pytest.raises(ValueError):
+        codec.use("simdjson")
@@ -40,3 +40,34 @@ def test_get_config_priority():
     with patch.dict(os.environ, {}, clear=True):
         with patch("ghl.config.get_config_from_file", return_value={}):
             assert get_config()["api_key"] is None
+
+def test_get_config_cache_flag():
+    with patch.dict(os.environ, {}, clear=True):
+        with patch("ghl.config.get_config_from_file", return_value={}):
+            assert get_config()["cache"] is False
+        with patch("ghl.config.get_config_from_file", return_value={"cache": True}):
+            assert get_config()["cache"] is True
+            assert get_config(cache=False)["cache"] is False
+
+    with patch.dict(os.environ, {"GHL_CACHE": "1"}):
+        with patch("ghl.config.get_config_from_file", return_value={}):
+            assert get_config()["cache"] is True
+
+def test_get_config_cache_records_flag():
+    with patch.dict(os.environ, {}, clear=True):
+        with patch("ghl.config.get_config_from_file", return_value={}):
+            assert get_config()["cache_records"] is False
+        with patch("ghl.config.get_config_from_file", return_value={"cache_records": True}):
+            assert get_config()["cache_records"] is True
+
+    with patch.dict(os.environ, {"GHL_CACHE_RECORDS": "1"}):
+        with patch("ghl.config.get_config_from_file", return_value={}):
+            assert get_config()["cache_records"] is True
+
+def test_get_config_oauth_credentials():
+    with patch.dict(os.environ, {"GHL_CLIENT_ID": "env_id"}, clear=True):
+        with patch("ghl.config.get_config_from_file", return_value={"client_secret": "file_secret", "refresh_token": "file_refresh"}):
+            config = get_config()
+    assert config["client_id"] == "env_id"
+    assert config["client_secret"] == "file_secret"
+    assert config["refresh_token"] == "file_refresh"
@@ -1,6 +1,7 @@
 import pytest
 from unittest.mock import Mock, MagicMock
-from ghl.endpoints.contacts import list_contacts, get_contact, create_contact, update_contact, delete_contact
+from ghl.endpoints.contacts import list_contacts, get_contact, create_contact, upsert_contact, update_contact, delete_contact, iter_contacts, iter_contact_pages
+from ghl.endpoints.contacts import search_contacts, iter_search, parse_filter, parse_sort, contact_filter, any_of
 
 @pytest.fixture
 def mock_client():
@@ -67,6 +68,17 @@ def test_create_contact(mock_client):
     mock_client.post.assert_called_with("/contacts/", json=data)
     assert result["contact"]["id"] == "1"
 
+def test_upsert_contact(mock_client):
+    mock_response = MagicMock()
+    mock_response.json.return_value = {"new": True, "contact": {"id": "1"}}
+    mock_client.post.return_value = mock_response
+
+    data = {"email": "john@example.com", "locationId": "loc"}
+    result = upsert_contact(mock_client, data)
+
+    mock_client.post.assert_called_with("/contacts/upsert", json=data)
+    assert result["new"] is True
+
 def test_update_contact(mock_client):
     mock_response = MagicMock()
     mock_response.json.return_value = {"contact": {"id": "1", "name": "John Updated"}}
@@ -87,3 +99,111 @@ def test_delete_contact(mock_client):
 
     mock_client.delete.assert_called_with("/contacts/1")
     assert result["success"] is True
+
+def _page(ids, start_after_id=None):
+    response = MagicMock()
+    meta = {"startAfter": 1000 + len(ids), "startAfterId": start_after_id} if start_after_id else {}
+    response.json.return_value = {
+        "contacts": [{"id": i, "name": f"Contact {i}", "phone": "123"} for i in ids],
+        "meta": meta
+    }
+    return response
+
+def test_iter_contacts_follows_cursor(mock_client):
+    mock_client.location_id = "loc1"
+    mock_client.get.side_effect = [_page(["1", "2"], "2"), _page(["3", "4"], "4"), _page(["5"], "5")]
+
+    result = list(iter_contacts(mock_client, page_size=2))
+
+    assert [c["id"] for c in result] == ["1", "2", "3", "4", "5"]
+    assert "phone" not in result[0]
+    calls = mock_client.get.call_args_list
+    assert calls[0].kwargs["params"] == {"limit": 2, "locationId": "loc1"}
+    assert calls[1].kwargs["params"] == {"limit": 2, "locationId": "loc1", "startAfter": 1002, "startAfterId": "2"}
+    assert calls[2].kwargs["params"]["startAfterId"] == "4"
+
+def test_iter_contacts_stops_without_cursor(mock_client):
+    mock_client.location_id = None
+    mock_client.get.side_effect = [_page(["1", "2"])]
+
+    assert [c["id"] for c in iter_contacts(mock_client, page_size=2, fields="id,phone")] == ["1", "2"]
+    assert mock_client.get.call_count == 1
+
+def test_iter_contacts_stops_on_repeated_cursor(mock_client):
+    mock_client.location_id = None
+    mock_client.get.side_effect = [_page(["1", "2"], "2"), _page(["1", "2"], "2")]
+
+    assert len(list(iter_contacts(mock_client, page_size=2))) == 4
+    assert mock_client.get.call_count == 2
+
+def test_iter_contact_pages_resumes_from_cursor(mock_client):
+    mock_client.location_id = None
+    mock_client.get.side_effect = [_page(["3"])]
+
+    pages = list(iter_contact_pages(mock_client, page_size=2, start_after=1002, start_after_id="2"))
+
+    assert len(pages) == 1
+    mock_client.get.assert_called_with("/contacts/", params={"limit": 2, "startAfter": 1002, "startAfterId": "2"})
+
+def test_iter_contacts_is_lazy(mock_client):
+    mock_client.location_id = None
+    mock_client.get.side_effect = [_page(["1", "2"], "2"), _page(["3", "4"], "4")]
+
+    first = next(iter_contacts(mock_client, page_size=2, prefetch_depth=0))
+
+    assert first["id"] == "1"
+    assert mock_client.get.call_count == 1
+
+def test_search_contacts_sends_filters(mock_client):
+    mock_client.location_id = "loc_123"
+    mock_client.post.return_value.json.return_value = {"contacts": [{"id": "1", "email": "a@x.com", "phone": "1"}], "total": 1}
+    filters = [contact_filter("tags", "contains", "vip"), any_of(contact_filter("email", "exists"), contact_filter("phone", "exists"))]
+
+    result = search_contacts(mock_client, "ann", filters=filters, sort=[parse_sort("dateAdded:desc")], limit=5)
+
+    mock_client.post.assert_called_with("/contacts/search", json={
+        "pageLimit": 5, "page": 1, "locationId": "loc_123", "query": "ann",
+        "filters": [
+            {"field": "tags", "operator": "contains", "value": "vip"},
+            {"group": "OR", "filters": [{"field": "email", "operator": "exists"}, {"field": "phone", "operator": "exists"}]},
+        ],
+        "sort": [{"field": "dateAdded", "direction": "desc"}],
+    })
+    assert result == {"contacts": [{"id": "1", "email": "a@x.com"}], "total": 1}
+
+def test_iter_search_follows_search_after(mock_client):
+    mock_client.location_id = None
+    first, second = MagicMock(), MagicMock()
+    first.json.return_value = {"contacts": [{"id": "1", "searchAfter": [10, "1"]}, {"id": "2", "searchAfter": [20, "2"]}], "total": 3}
+    second.json.return_value = {"contacts": [{"id": "3", "searchAfter": [30, "3"]}], "total": 3}
+    mock_client.post.side_effect = [first, second]
+
+    result = list(iter_search(mock_client, filters=[parse_filter("tags:contains:vip")], page_size=2, prefetch_depth=0))
+
+    assert [c["id"] for c in result] == ["1", "2", "3"]
+    bodies = [c.kwargs["json"] for c in mock_client.post.call_args_list]
+    assert bodies[0]["page"] == 1 and "searchAfter" not in bodies[0]
+    assert bodies[1]["searchAfter"] == [20, "2"] and "page" not in bodies[1]
+
+@pytest.mark.parametrize("expression, expected", [
+    ("tags:contains:vip", {"field": "tags", "operator": "contains", "value": "vip"}),
+    ("email:exists", {"field": "email", "operator": "exists"}),
+    ("dateAdded:range:2024-01-01..", {"field": "dateAdded", "operator": "range", "value": {"gte": "2024-01-01"}}),
+    ("customFields.abc:eq:a:b", {"field": "customFields.abc", "operator": "eq", "value": "a:b"}),
+])
+def test_parse_filter(expression, expected):
+    assert parse_filter(expression) == expected
+
+@pytest.mark.parametrize("expression", ["tags", "tags:like:x", "tags:eq", "dateAdded:range:2024"])
+def test_parse_filter_rejects(expression):
+    with pytest.raises(ValueError):
+        parse_filter(expression)
+
+def test_list_contacts_nested_fields(mock_client):
+    mock_client.get.return_value.json.return_value = {
+        "contacts": [{"id": "1", "customFields": [{"id": "f1", "value": "gold"}]}], "meta": {}
+    }
+
+    result = list_contacts(mock_client, fields="id,customFields[id=f1].value")
+
+    assert result["contacts"] == [{"id": "1", "customFields[id=f1].value": "gold"}]
@@ -80,3 +80,24 @@ def test_get_messages(mock_client):
 
     mock_client.get.assert_called_with("/conversations/1/messages", params={"limit": 10})
     assert result["messages"]["messages"][0]["id"] == "m1"
+
+def test_iter_messages_follows_last_message_id(mock_client):
+    from ghl.endpoints.conversations import iter_messages
+    pages = [
+        ([{"id": "m1"}, {"id": "m2"}], {"messages": {"lastMessageId": "m2", "nextPage": True, "messages": []}}),
+        ([{"id": "m3"}], {"messages": {"lastMessageId": "m3", "nextPage": False, "messages": []}}),
+    ]
+    calls = []
+
+    def stream_items(url, path, params=None, rest=None):
+        calls.append((url, path, params))
+        items, remainder = pages[len(calls) - 1]
+        rest.update(remainder)
+        return iter(items)
+    mock_client.stream_items = stream_items
+
+    assert [m["id"] for m in iter_messages(mock_client, "conv_1", page_size=2, message_type="TYPE_SMS")] == ["m1", "m2", "m3"]
+    assert calls == [
+        ("/conversations/conv_1/messages", "messages.messages", {"limit": 2, "type": "TYPE_SMS"}),
+        ("/conversations/conv_1/messages", "messages.messages", {"limit": 2, "type": "TYPE_SMS", "lastMessageId": "m2"}),
+    ]
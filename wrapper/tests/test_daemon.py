@@ -0,0 +1,101 @@
+import io
+import json
+import os
+import threading
+import pytest
+from unittest.mock import MagicMock, patch
+from ghl import daemon
+from ghl.cli import cli
+
+@pytest.fixture
+def server(tmp_path):
+    path = tmp_path / "ghl.sock"
+    server = daemon.Daemon(path, cli)
+    thread = threading.Thread(target=server.serve_until_stopped, daemon=True)
+    thread.start()
+    yield server
+    daemon.stop(path)
+    thread.join(5)
+
+def run(server, *argv):
+    out, err = io.BytesIO(), io.BytesIO()
+    code = daemon.forward(list(argv), server.path, out, err)
+    return code, out.getvalue().decode(), err.getvalue().decode()
+
+@patch("ghl.cli.get_config", return_value={"api_key": "key", "location_id": "loc"})
+@patch("ghl.cli.GHLClient")
+def test_forwarded_commands_share_a_warm_client(mock_client_cls, mock_get_config, server):
+    with patch("ghl.endpoints.contacts.get_contact", side_effect=lambda client, contact_id, *a: {"id": contact_id}):
+        first = run(server, "contacts", "get", "c1")
+        second = run(server, "--compact", "contacts", "get", "c2")
+
+    assert first == (0, json.dumps({"id": "c1"}, indent=2) + "\n", "")
+    assert second == (0, '{"id":"c2"}\n', "")
+    mock_client_cls.assert_called_once()
+    assert mock_client_cls.call_args.kwargs["rate_limiter"] is server.rate_limiter
+
+def test_exit_status_and_stderr(server):
+    with patch("ghl.cli.get_config", return_value={}):
+        code, out, err = run(server, "contacts", "list")
+    assert (code, out) == (1, "")
+    assert "API Key is missing" in err
+
+    code, _, err = run(server, "no-such-command")
+    assert code == 2
+    assert "No such command" in err
+
+def test_runs_in_caller_environment_and_cwd(server, tmp_path):
+    seen = {}
+
+    def fake_get_config(*args):
+        seen.update(cwd=os.getcwd(), location=os.environ.get("GHL_LOCATION_ID"))
+        return {"location_id": "loc"}
+
+    request = {"argv": ["sync", "--status"], "env": {"GHL_LOCATION_ID": "caller", "GHL_COMPACT": "1"}, "cwd": str(tmp_path)}
+    before = os.getcwd()
+    with patch("ghl.cli.get_config", side_effect=fake_get_config), patch("ghl.cli._open_mirror") as mock_mirror:
+        mock_mirror.return_value.status.return_value = {"contacts": 0}
+        sock = daemon._connect(server.path)
+        out = io.BytesIO()
+        code = daemon._request(sock, request, out, io.BytesIO())
+        sock.close()
+
+    assert code == 0
+    assert out.getvalue() == b'{"contacts":0}\n'
+    assert seen == {"cwd": str(tmp_path), "location": "caller"}
+    assert os.getcwd() == before
+    assert "GHL_COMPACT" not in os.environ
+
+def test_not_forwarded_without_daemon_or_for_stdin(tmp_path, server, monkeypatch):
+    assert daemon.forward(["contacts", "list"], tmp_path / "missing.sock") is None
+    assert daemon.forward(["contacts", "import", "-", "--format", "csv"], server.path) is None
+    assert daemon.forward(["serve", "--stop"], server.path) is None
+
+    monkeypatch.setenv("GHL_NO_DAEMON", "1")
+    assert daemon.forward(["contacts", "list"], server.path) is None
+
+def test_second_daemon_refuses_and_stop_removes_socket(tmp_path):
+    path = tmp_path / "ghl.sock"
+    server = daemon.Daemon(path, cli)
+    thread = threading.Thread(target=server.serve_until_stopped, daemon=True)
+    thread.start()
+
+    with pytest.raises(RuntimeError, match="already listening"):
+        daemon.Daemon(path, cli)
+
+    assert daemon.stop(path) is True
+    thread.join(5)
+    assert not path.exists()
+    assert daemon.stop(path) is False
+
+def test_client_pool_evicts_least_recently_used():
+    pool = daemon.ClientPool(max_clients=2)
+    clients = {name: MagicMock() for name in "abc"}
+
+    assert pool.get({"api_key": "a"}, lambda: clients["a"]) is clients["a"]
+    pool.get({"api_key": "b"}, lambda: clients["b"])
+    assert pool.get({"api_key": "a"}, lambda: MagicMock()) is clients["a"]
+    pool.get({"api_key": "c"}, lambda: clients["c"])
+
+    clients["b"].close.assert_called_once()
+    clients["a"].close.assert_not_called()
@@ -106,3 +106,47 @@ def test_update_event(mock_client):
 def test_delete_event(mock_client):
     calendars.delete_event(mock_client, "1")
     mock_client.delete.assert_called_with("/calendars/events/1")
+
+def _json_response(data):
+    response = Mock()
+    response.json.return_value = data
+    return response
+
+def test_iter_opportunities(mock_client):
+    mock_client.get.side_effect = [
+        _json_response({"opportunities": [{"id": "1"}, {"id": "2"}], "meta": {"startAfter": 5, "startAfterId": "2"}}),
+        _json_response({"opportunities": [{"id": "3"}], "meta": {"startAfter": 6, "startAfterId": "3"}}),
+    ]
+
+    result = list(opportunities.iter_opportunities(mock_client, page_size=2, status="open"))
+
+    assert [o["id"] for o in result] == ["1", "2", "3"]
+    mock_client.get.assert_called_with("/opportunities/search", params={"limit": 2, "status": "open", "location_id": "loc_123", "startAfter": 5, "startAfterId": "2"})
+
+def test_iter_records(mock_client):
+    mock_client.post.side_effect = [
+        _json_response({"records": [{"id": "r1"}, {"id": "r2"}], "total": 3}),
+        _json_response({"records": [{"id": "r3"}], "total": 3}),
+    ]
+
+    result = list(objects.iter_records(mock_client, "key", page_size=2))
+
+    assert [r["id"] for r in result] == ["r1", "r2", "r3"]
+    mock_client.post.assert_called_with("/objects/key/records/search", json={"pageLimit": 2, "page": 2, "locationId": "loc_123"})
+
+def test_iter_records_stops_at_total(mock_client):
+    mock_client.post.side_effect = [_json_response({"records": [{"id": "r1"}, {"id": "r2"}], "total": 2})]
+
+    assert len(list(objects.iter_records(mock_client, "key", page_size=2))) == 2
+    assert mock_client.post.call_count == 1
+
+def test_iter_locations(mock_client):
+    mock_client.get.side_effect = [
+        _json_response({"locations": [{"id": "a"}, {"id": "b"}]}),
+        _json_response({"locations": []}),
+    ]
+
+    result = list(locations.iter_locations(mock_client, page_size=2, company_id="c1"))
+
+    assert [l["id"] for l in result] == ["a", "b"]
+    mock_client.get.assert_called_with("/locations/search", params={"limit": 2, "skip": 2, "companyId": "c1"})
@@ -0,0 +1,126 @@
+import asyncio
+import json
+import httpx
+from click.testing import CliRunner
+from unittest.mock import MagicMock, AsyncMock, patch
+from ghl import enrich
+from ghl.cli import cli
+from ghl.enrich import ContactLookup, with_contacts
+
+def _collect(aiterator):
+    async def run():
+        return [item async for item in aiterator]
+    return asyncio.run(run())
+
+def _not_found():
+    request = httpx.Request("GET", "https://example.test/contacts/gone")
+    return httpx.HTTPStatusError("404 Not Found", request=request, response=httpx.Response(404, request=request))
+
+def _fake_contacts(calls, delay=0.0):
+    async def fetch(contact_id):
+        calls.append(contact_id)
+        await asyncio.sleep(delay)
+        if contact_id == "gone":
+            raise _not_found()
+        if contact_id == "broken":
+            raise ValueError("500 Server Error")
+        return {"id": contact_id, "email": f"{contact_id}@example.com"}
+    return fetch
+
+def test_each_contact_fetched_once_and_order_kept():
+    calls = []
+    records = [{"id": f"o{i}", "contactId": f"c{i % 3}"} for i in range(12)]
+
+    async def run():
+        lookup = ContactLookup(_fake_contacts(calls, delay=0.01), concurrency=2)
+        return [r async for r in with_contacts(lookup, records, window=4)], lookup.fetched
+
+    joined, fetched = asyncio.run(run())
+
+    assert [r["id"] for r in joined] == [f"o{i}" for i in range(12)]
+    assert all(r["contact"]["id"] == r["contactId"] for r in joined)
+    assert sorted(calls) == ["c0", "c1", "c2"]
+    assert fetched == 3
+
+def test_missing_failed_and_absent_contacts():
+    records = [{"id": "a", "contactId": "gone"}, {"id": "b", "contactId": "broken"}, {"id": "c"}]
+
+    async def run():
+        lookup = ContactLookup(_fake_contacts([]))
+        return [r async for r in with_contacts(lookup, records)]
+
+    joined = asyncio.run(run())
+
+    assert joined[0] == {"id": "a", "contactId": "gone", "contact": None}
+    assert joined[1]["contact"] is None and joined[1]["contactError"] == "500 Server Error"
+    assert joined[2] == {"id": "c", "contact": None}
+
+def test_enrich_streams_async_records():
+    client = MagicMock()
+    client.location_id = "loc"
+    response = MagicMock()
+    response.json.return_value = {"contact": {"id": "c1", "email": "a@b.c", "tags": ["vip"], "city": "X"}}
+    client.get = AsyncMock(return_value=response)
+
+    async def events():
+        for i in range(3):
+            yield {"id": f"e{i}", "contactId": "c1"}
+
+    joined = _collect(enrich.enrich(client, events()))
+
+    assert client.get.await_count == 1
+    assert joined[2]["contact"] == {"id": "c1", "email": "a@b.c", "tags": ["vip"]}
+
+def _get_contact(calls):
+    async def get_contact(client, contact_id, fields=None, verbose=0):
+        calls.append(contact_id)
+        return {"id": contact_id, "name": contact_id.upper()}
+    return get_contact
+
+@patch("ghl.cli.get_config", return_value={"api_key": "key", "location_id": "loc"})
+def test_opportunities_list_all_with_contact(mock_get_config, mocker):
+    calls = []
+
+    async def iter_opportunities(client, **kwargs):
+        assert kwargs["fields"] == "id,contactId"
+        for i in range(4):
+            yield {"id": f"o{i}", "contactId": f"c{i % 2}"}
+
+    mocker.patch("ghl.endpoints.aio.opportunities.iter_opportunities", iter_opportunities)
+    mocker.patch("ghl.endpoints.aio.contacts.get_contact", _get_contact(calls))
+
+    result = CliRunner().invoke(cli, ["opportunities", "list", "--all", "--fields", "id", "--with-contact"])
+
+    assert result.exit_code == 0
+    lines = [json.loads(line) for line in result.stdout.splitlines()]
+    assert [line["contact"]["name"] for line in lines] == ["C0", "C1", "C0", "C1"]
+    assert sorted(calls) == ["c0", "c1"]
+
+@patch("ghl.cli.get_config", return_value={"api_key": "key", "location_id": "loc"})
+def test_calendar_events_with_contact(mock_get_config, mocker):
+    calls = []
+    mocker.patch("ghl.endpoints.aio.calendars.list_events", AsyncMock(return_value={
+        "events": [{"id": "e1", "contactId": "c1"}, {"id": "e2", "contactId": "c1"}]}))
+    mocker.patch("ghl.endpoints.aio.contacts.get_contact", _get_contact(calls))
+
+    result = CliRunner().invoke(cli, ["--compact", "calendars", "events", "--start-time", "1", "--end-time", "2", "--with-contact"])
+
+    assert result.exit_code == 0
+    assert json.loads(result.stdout)["events"][1] == {"id": "e2", "contactId": "c1", "contact": {"id": "c1", "name": "C1"}}
+    assert calls == ["c1"]
+
+@patch("ghl.cli.get_config", return_value={"api_key": "key", "location_id": "loc"})
+def test_calendar_events_without_contact(mock_get_config, mocker):
+    list_events = mocker.patch("ghl.endpoints.calendars.list_events", return_value={"events": [{"id": "e1"}]})
+
+    result = CliRunner().invoke(cli, ["--compact", "calendars", "events", "--start-time", "1", "--end-time", "2"])
+
+    assert result.exit_code == 0
+    assert list_events.call_count == 1
+    assert json.loads(result.stdout) == {"events": [{"id": "e1"}]}
+
+def test_with_contact_is_not_local():
+    result = CliRunner().invoke(cli, ["opportunities", "list", "--local", "--with-contact"])
+
+    assert result.exit_code == 2
+    assert "cannot be combined with --local" in result.output
@@ -0,0 +1,97 @@
+import csv
+import json
+import pytest
+from unittest.mock import Mock, MagicMock
+from ghl.export import export_contacts, ExportState
+
+def _page(start, count, more=True):
+    contacts = [{"id": f"c{i}", "email": f"c{i}@x.com", "tags": ["a", "b"], "phone": None} for i in range(start, start + count)]
+    meta = {"startAfter": start + count, "startAfterId": f"c{start + count - 1}"} if more else {}
+    response = MagicMock()
+    response.json.return_value = {"contacts": contacts, "meta": meta}
+    return response
+
+@pytest.fixture
+def mock_client():
+    client = Mock()
+    client.location_id = "loc_123"
+    return client
+
+def test_export_jsonl(mock_client, tmp_path):
+    mock_client.get.side_effect = [_page(0, 2), _page(2, 1, more=False)]
+    out = tmp_path / "contacts.jsonl"
+
+    result = export_contacts(mock_client, out, page_size=2, prefetch_depth=0)
+
+    assert result == {"rows": 3, "pages": 2, "resumed": False}
+    lines = [json.loads(line) for line in out.read_text().splitlines()]
+    assert [c["id"] for c in lines] == ["c0", "c1", "c2"]
+    assert not (tmp_path / "contacts.jsonl.cursor").exists()
+
+def test_export_csv_columns(mock_client, tmp_path):
+    mock_client.get.side_effect = [_page(0, 2, more=False)]
+    out = tmp_path / "contacts.csv"
+
+    export_contacts(mock_client, out, "csv", fields="id,tags,phone", page_size=2, prefetch_depth=0)
+
+    with open(out, newline="") as f:
+        rows = list(csv.reader(f))
+    assert rows == [["id", "tags", "phone"], ["c0", "a,b", ""], ["c1", "a,b", ""]]
+
+def test_export_resumes_after_interruption(mock_client, tmp_path):
+    out = tmp_path / "contacts.jsonl"
+    mock_client.get.side_effect = [_page(0, 2), RuntimeError("connection lost")]
+
+    with pytest.raises(RuntimeError):
+        export_contacts(mock_client, out, page_size=2, prefetch_depth=0)
+
+    state = ExportState(tmp_path / "contacts.jsonl.cursor").load()
+    assert state["position"] == {"startAfter": 2, "startAfterId": "c1"}
+    # Simulate a half-written line left behind by a crash
+    with open(out, "a") as f:
+        f.write('{"id": "partial"')
+
+    mock_client.get.side_effect = [_page(2, 2, more=False)]
+    result = export_contacts(mock_client, out, page_size=2, prefetch_depth=0)
+
+    assert result == {"rows": 4, "pages": 1, "resumed": True}
+    params = mock_client.get.call_args.kwargs["params"]
+    assert (params["startAfter"], params["startAfterId"]) == (2, "c1")
+    assert [json.loads(line)["id"] for line in out.read_text().splitlines()] == ["c0", "c1", "c2", "c3"]
+
+def test_export_rejects_mismatched_state(mock_client, tmp_path):
+    out = tmp_path / "contacts.jsonl"
+    ExportState(tmp_path / "contacts.jsonl.cursor").save(
+        {"resource": "contacts", "format": "csv", "fields": None, "query": None, "position": None, "rows": 0, "offset": 0}
+    )
+
+    with pytest.raises(ValueError, match="different export"):
+        export_contacts(mock_client, out, "jsonl")
+
+def test_export_restart_ignores_state(mock_client, tmp_path):
+    out = tmp_path / "contacts.jsonl"
+    ExportState(tmp_path / "contacts.jsonl.cursor").save({"format": "csv"})
+    mock_client.get.side_effect = [_page(0, 1, more=False)]
+
+    result = export_contacts(mock_client, out, restart=True, prefetch_depth=0)
+
+    assert result["resumed"] is False
+    assert result["rows"] == 1
+
+def test_export_opportunities_resume_cursor(mock_client, tmp_path):
+    from ghl.export import export_opportunities
+    out = tmp_path / "opps.jsonl"
+    ExportState(tmp_path / "opps.jsonl.cursor").save({
+        "resource": "opportunities", "format": "jsonl", "fields": None, "query": None, "pipeline_id": "p1",
+        "status": None, "position": {"startAfter": 5, "startAfterId": "o4"}, "rows": 0, "offset": 0,
+    })
+    out.write_text("")
+    response = MagicMock()
+    response.json.return_value = {"opportunities": [{"id": "o5"}], "meta": {}}
+    mock_client.get.return_value = response
+
+    result = export_opportunities(mock_client, out, pipeline_id="p1", prefetch_depth=0)
+
+    assert result == {"rows": 1, "pages": 1, "resumed": True}
+    params = mock_client.get.call_args.kwargs["params"]
+    assert (params["startAfter"], params["startAfterId"], params["pipeline_id"]) == (5, "o4", "p1")
@@ -0,0 +1,116 @@
+import asyncio
+import json
+import pytest
+from click.testing import CliRunner
+from unittest.mock import Mock, AsyncMock, patch
+from ghl import fanout
+from ghl.cli import cli
+from ghl.client import AsyncGHLClient
+from ghl.location_tokens import LocationTokenManager
+
+def _collect(aiterator):
+    async def run():
+        return [item async for item in aiterator]
+    return asyncio.run(run())
+
+@pytest.fixture
+def agency():
+    return AsyncGHLClient("agency_key")
+
+@pytest.fixture
+def tokens(mocker):
+    async def get_location_token(client, company_id, location_id):
+        if location_id == "bad":
+            raise ValueError("401 Unauthorized")
+        return {"access_token": f"token_{location_id}", "expires_in": 86399}
+    return mocker.patch("ghl.fanout.oauth.get_location_token", AsyncMock(side_effect=get_location_token))
+
+def test_fan_out_reuses_token_manager_across_runs(agency, tokens):
+    async def call(client):
+        return {"token": client.api_key, "shared": client.rate_limiter is agency.rate_limiter}
+
+    async def run():
+        async with LocationTokenManager(agency, "co") as manager:
+            first = [r async for r in fanout.fan_out(agency, call, ["a", "b"], tokens=manager)]
+            second = [r async for r in fanout.fan_out(agency, call, ["a", "b"], tokens=manager)]
+            return first + second
+
+    results = asyncio.run(run())
+
+    assert {r["data"]["token"] for r in results} == {"token_a", "token_b"}
+    assert all(r["data"]["shared"] for r in results)
+    assert tokens.await_count == 2
+
+def test_fan_out_with_agency_key(agency, tokens):
+    async def call(client):
+        return client.api_key
+
+    results = _collect(fanout.fan_out(agency, call, ["a"], location_tokens=False))
+
+    assert results == [{"locationId": "a", "data": "agency_key"}]
+    tokens.assert_not_awaited()
+
+def test_fan_out_runs_locations_concurrently(agency, tokens):
+    running, peak = 0, 0
+
+    async def call(client):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        if client.location_id == "broken":
+            raise ValueError("500 Server Error")
+        return {"token": client.api_key}
+
+    ids = [f"loc{i}" for i in range(6)] + ["broken", "bad"]
+    results = _collect(fanout.fan_out(agency, call, ids, company_id="co", concurrency=3))
+
+    by_location = {r["locationId"]: r for r in results}
+    assert len(results) == 8
+    assert by_location["loc4"] == {"locationId": "loc4", "data": {"token": "token_loc4"}}
+    assert by_location["broken"]["error"] == "500 Server Error"
+    assert "401 Unauthorized" in by_location["bad"]["error"]
+    assert peak == 3
+
+def test_fan_out_streams_items_and_lists_locations(agency, tokens, mocker):
+    mocker.patch("ghl.fanout.locations.list_all_locations",
+                 AsyncMock(return_value=[{"id": "a", "companyId": "co_a"}, {"id": "b"}]))
+    installed = mocker.patch("ghl.fanout.oauth.list_all_installed_locations", AsyncMock(return_value=[{"_id": "c"}]))
+
+    async def call(client):
+        for i in range(2):
+            yield {"n": i}
+
+    results = _collect(fanout.fan_out(agency, call, company_id="co"))
+
+    assert sorted((r["locationId"], r["data"]["n"]) for r in results) == [("a", 0), ("a", 1), ("b", 0), ("b", 1)]
+    assert {c.args[1] for c in tokens.await_args_list} == {"co_a", "co"}
+
+    results = _collect(fanout.fan_out(agency, call, company_id="co", app_id="app"))
+
+    installed.assert_awaited_once_with(agency, "co", "app")
+    assert {r["locationId"] for r in results} == {"c"}
+
+@patch("ghl.cli.get_config", return_value={"api_key": "agency_key"})
+def test_fanout_command(mock_get_config, mocker):
+    async def fan_out(agency, call, location_ids, company_id, concurrency, location_tokens, app_id):
+        assert (location_ids, company_id, location_tokens) == (("a", "b"), "co", False)
+        for location_id in location_ids:
+            client = Mock(location_id=location_id)
+            yield {"locationId": location_id, "data": await call(client)}
+        yield {"locationId": "c", "error": "boom"}
+
+    mocker.patch("ghl.fanout.fan_out", fan_out)
+    mocker.patch("ghl.endpoints.aio.locations.get_location", AsyncMock(side_effect=lambda client, location_id: {"id": location_id}))
+
+    result = CliRunner().invoke(cli, ["fanout", "location", "--location", "a", "--location", "b",
+                                       "--company-id", "co", "--no-location-tokens"])
+
+    assert result.exit_code == 0
+    assert [json.loads(line) for line in result.stdout.splitlines()] == [
+        {"locationId": "a", "data": {"id": "a"}},
+        {"locationId": "b", "data": {"id": "b"}},
+        {"locationId": "c", "error": "boom"},
+    ]
+    assert json.loads(result.stderr) == {"results": 2, "failed": 1}
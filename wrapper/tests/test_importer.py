@@ -0,0 +1,104 @@
+import asyncio
+import io
+import json
+import pytest
+from unittest.mock import Mock, AsyncMock
+from ghl import importer
+from ghl.importer import read_rows, detect_format, ImportJournal, import_contacts
+
+def test_detect_format():
+    assert detect_format("contacts.csv") == "csv"
+    assert detect_format("contacts.JSONL") == "jsonl"
+    assert detect_format("contacts.ndjson") == "jsonl"
+    with pytest.raises(ValueError):
+        detect_format("contacts.xlsx")
+
+def test_read_rows_csv():
+    source = io.StringIO("email,firstName,tags\na@x.com,Ann,\"vip, lead\"\nb@x.com,,\n")
+
+    rows = list(read_rows(source, "csv"))
+
+    assert rows == [
+        (0, {"email": "a@x.com", "firstName": "Ann", "tags": ["vip", "lead"]}),
+        (1, {"email": "b@x.com"}),
+    ]
+
+def test_read_rows_jsonl_reports_bad_lines():
+    source = io.StringIO('{"email": "a@x.com"}\n\nnot json\n[1]\n{"email": "b@x.com"}\n')
+
+    rows = list(read_rows(source, "jsonl"))
+
+    assert [index for index, _ in rows] == [0, 2, 3, 4]
+    assert rows[0][1] == {"email": "a@x.com"}
+    assert isinstance(rows[1][1], ValueError)
+    assert isinstance(rows[2][1], ValueError)
+    assert rows[3][1] == {"email": "b@x.com"}
+
+def test_journal_resumes_and_ignores_partial_line(tmp_path):
+    path = tmp_path / "import.journal"
+    path.write_text("0\n1\n4")
+
+    journal = ImportJournal(path)
+    assert journal.done == {0, 1}
+    journal.record(2)
+    journal.close()
+
+    assert ImportJournal(path).done == {0, 1, 2}
+
+@pytest.fixture
+def async_client():
+    client = Mock()
+    client.location_id = "loc_123"
+    return client
+
+def test_import_contacts(async_client, mocker, tmp_path):
+    def upsert(client, row):
+        if row["email"] == "bad@x.com":
+            raise ValueError("422 Unprocessable Entity")
+        return {"new": row["email"] == "new@x.com", "contact": {"id": row["email"].split("@")[0]}}
+
+    mock_upsert = mocker.patch("ghl.importer.contacts.upsert_contact", AsyncMock(side_effect=upsert))
+    rows = [(0, {"email": "new@x.com"}), (1, {"email": "old@x.com"}), (2, {"email": "bad@x.com"}), (3, ValueError("bad json"))]
+    journal = ImportJournal(tmp_path / "import.journal")
+    report = io.StringIO()
+
+    summary = asyncio.run(import_contacts(async_client, rows, concurrency=2, journal=journal, report=report))
+
+    assert summary == {"created": 1, "updated": 1, "failed": 2, "skipped": 0}
+    assert journal.done == {0, 1}
+    assert mock_upsert.await_args_list[0].args[1] == {"email": "new@x.com", "locationId": "loc_123"}
+    results = sorted((json.loads(line) for line in report.getvalue().splitlines()), key=lambda r: r["row"])
+    assert results[0] == {"row": 0, "status": "created", "id": "new"}
+    assert results[1]["status"] == "updated"
+    assert results[2]["status"] == "error" and "422" in results[2]["error"]
+    assert results[3]["error"].startswith("Invalid row")
+
+def test_import_contacts_skips_journaled_rows(async_client, mocker, tmp_path):
+    mock_upsert = mocker.patch("ghl.importer.contacts.upsert_contact", AsyncMock(return_value={"new": True, "contact": {}}))
+    path = tmp_path / "import.journal"
+    path.write_text("0\n1\n")
+
+    summary = asyncio.run(import_contacts(async_client, [(i, {"email": f"{i}@x.com"}) for i in range(3)],
+                                          journal=ImportJournal(path)))
+
+    assert summary == {"created": 1, "updated": 0, "failed": 0, "skipped": 2}
+    assert mock_upsert.await_count == 1
+
+def test_import_contacts_bounds_concurrency(async_client, mocker):
+    in_flight = 0
+    peak = 0
+
+    async def upsert(client, row):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.001)
+        in_flight -= 1
+        return {"new": True}
+
+    mocker.patch("ghl.importer.contacts.upsert_contact", AsyncMock(side_effect=upsert))
+
+    summary = asyncio.run(import_contacts(async_client, ((i, {"email": f"{i}@x.com"}) for i in range(50)), concurrency=4))
+
+    assert summary["created"] == 50
+    assert peak == 4
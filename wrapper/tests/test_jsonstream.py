@@ -0,0 +1,66 @@
+import json
+import pytest
+from ghl.jsonstream import ArrayStream, iter_array
+
+DOCUMENT = {
+    "meta": {"total": 3, "nextPage": "a,b]}"},
+    "contacts": [
+        {"id": "1", "name": "Ann \"A\" [x]", "tags": ["a", "b"]},
+        {"id": "2", "nested": {"list": [{"k": "}"}], "esc": "back\\slash"}},
+        {"id": "3", "emoji": "café ☃"},
+    ],
+    "after": [1, 2],
+}
+
+def chunked(data: bytes, size: int):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64, 10_000])
+def test_elements_across_chunk_boundaries(size):
+    raw = json.dumps(DOCUMENT, ensure_ascii=False).encode()
+    rest = {}
+
+    items = list(iter_array(chunked(raw, size), ["contacts"], rest))
+
+    assert items == DOCUMENT["contacts"]
+    assert rest == {**DOCUMENT, "contacts": []}
+
+def test_elements_are_yielded_before_the_document_ends():
+    parser = ArrayStream(["contacts"])
+
+    assert parser.feed(b'{"contacts": [{"id": "1"}, {"id"') == [{"id": "1"}]
+    assert parser.feed(b': "2"}') == []
+    assert parser.feed(b']}') == [{"id": "2"}]
+    assert parser.close() == {"contacts": []}
+
+def test_nested_path_ignores_same_key_elsewhere():
+    raw = b'{"messages": {"lastMessageId": "m2", "nextPage": true, "messages": [{"id": "m1"}, {"id": "m2"}]}}'
+    decoy = b'{"other": {"messages": [0]}, ' + raw[1:]
+    rest = {}
+
+    assert list(iter_array(chunked(decoy, 5), ["messages", "messages"], rest)) == [{"id": "m1"}, {"id": "m2"}]
+    assert rest["messages"] == {"lastMessageId": "m2", "nextPage": True, "messages": []}
+    assert rest["other"] == {"messages": [0]}
+
+def test_top_level_array_of_scalars():
+    raw = b' [1, "two, three", null, 4.5, [5], true] '
+    assert list(iter_array(chunked(raw, 2))) == [1, "two, three", None, 4.5, [5], True]
+
+def test_empty_and_missing_arrays():
+    assert list(iter_array([b'{"contacts": []}'], ["contacts"])) == []
+    rest = {}
+    assert list(iter_array([b'{"meta": {"total": 0}}'], ["contacts"], rest)) == []
+    assert rest == {"meta": {"total": 0}}
+
+def test_truncated_document_raises():
+    parser = ArrayStream(["contacts"])
+    assert parser.feed(b'{"contacts": [{"id": "1"}, {"id": "2"') == [{"id": "1"}]
+    with pytest.raises(ValueError):
+        parser.close()
+
+def test_buffer_holds_only_the_unfinished_element():
+    parser = ArrayStream(["contacts"])
+    parser.feed(b'{"contacts": [')
+    for i in range(1000):
+        parser.feed(json.dumps({"id": str(i), "pad": "x" * 100}).encode() + b", ")
+    assert len(parser._buf) < 200
@@ -0,0 +1,144 @@
+import asyncio
+import time
+import httpx
+import pytest
+from unittest.mock import AsyncMock
+from ghl.client import AsyncGHLClient
+from ghl.location_tokens import LocationTokenManager
+from ghl.tokens import TokenStore
+
+@pytest.fixture
+def agency():
+    return AsyncGHLClient("agency_key")
+
+@pytest.fixture
+def exchange(mocker):
+    minted = {}
+
+    async def get_location_token(client, company_id, location_id):
+        await asyncio.sleep(0.01)
+        minted[location_id] = minted.get(location_id, 0) + 1
+        return {"access_token": f"{location_id}_{minted[location_id]}", "refresh_token": "agency_refresh", "expires_in": 86399}
+    return mocker.patch("ghl.location_tokens.oauth.get_location_token", AsyncMock(side_effect=get_location_token))
+
+def test_concurrent_leases_share_one_exchange(agency, exchange):
+    async def run():
+        async with LocationTokenManager(agency, "co") as manager:
+            async def use(location_id):
+                async with manager.lease(location_id) as client:
+                    return client
+
+            clients = await asyncio.gather(*(use(location_id) for location_id in "aaab"))
+            return clients, len(manager)
+
+    clients, cached = asyncio.run(run())
+
+    assert clients[0] is clients[1] is clients[2]
+    assert [c.api_key for c in clients] == ["a_1", "a_1", "a_1", "b_1"]
+    assert clients[0].client.headers["Authorization"] == "Bearer a_1"
+    assert clients[0].rate_limiter is agency.rate_limiter
+    assert exchange.await_count == 2
+    assert cached == 2
+
+def test_expiring_tokens_are_refreshed_ahead(agency, exchange):
+    async def run():
+        async with LocationTokenManager(agency, "co", refresh_ahead=600) as manager:
+            async with manager.lease("a") as a, manager.lease("b") as b:
+                pass
+            a.token_expires_at = time.time() + 300
+            due = await manager.refresh_expiring()
+            async with manager.lease("a") as again:
+                return due, a, b, again
+
+    due, a, b, again = asyncio.run(run())
+
+    assert due == 1
+    assert again is a
+    assert (a.api_key, b.api_key) == ("a_2", "b_1")
+    assert a.token_expires_at > time.time() + 86000
+
+def test_background_refresh(agency, exchange):
+    async def run():
+        async with LocationTokenManager(agency, "co", refresh_interval=0.01) as manager:
+            async with manager.lease("a") as client:
+                client.token_expires_at = time.time()
+            await asyncio.sleep(0.1)
+            return client.api_key
+
+    assert asyncio.run(run()) == "a_2"
+
+def _response(status_code):
+    return httpx.Response(status_code, json={}, request=httpx.Request("GET", "https://example.test/contacts/"))
+
+def test_lease_outliving_its_token_mints_a_new_one(agency, exchange):
+    async def run():
+        async with LocationTokenManager(agency, "co") as manager:
+            async with manager.lease("a") as client:
+                client.client = AsyncMock(spec=httpx.AsyncClient)
+                client.client.headers = {}
+                client.client.get.return_value = _response(200)
+                # The token runs out while the lease is still held
+                client.token_expires_at = time.time()
+                await client.get("/contacts/")
+                expired = client.client.headers["Authorization"]
+                # ...or the API rejects it early
+                client.client.get.side_effect = [_response(401), _response(200)]
+                await client.get("/contacts/")
+                return expired, client.client.headers["Authorization"], client.refresh_token
+
+    expired, rejected, refresh_token = asyncio.run(run())
+
+    assert (expired, rejected) == ("Bearer a_2", "Bearer a_3")
+    assert exchange.await_count == 3
+    assert refresh_token is None
+
+def test_idle_locations_are_evicted_least_recently_used_first(agency, exchange):
+    async def run():
+        async with LocationTokenManager(agency, "co", max_locations=2) as manager:
+            async with manager.lease("a") as a:
+                async with manager.lease("b") as b:
+                    pass
+                async with manager.lease("c"):
+                    pass
+                # "a" was leased throughout, so the idle "b" went instead
+                async with manager.lease("a") as still_a:
+                    pass
+            return still_a is a, b.client.is_closed, a.client.is_closed, sorted(manager._locations)
+
+    same, b_closed, a_closed, cached = asyncio.run(run())
+
+    assert same and b_closed and not a_closed
+    assert cached == ["a", "c"]
+    assert exchange.await_count == 3
+
+def test_token_store_carries_tokens_to_the_next_run(agency, exchange, tmp_path):
+    store = TokenStore(tmp_path / "tokens.db")
+
+    async def run():
+        async with LocationTokenManager(agency, "co", token_store=store) as manager:
+            async with manager.lease("a") as client:
+                return client.api_key
+
+    assert asyncio.run(run()) == "a_1"
+    assert asyncio.run(run()) == "a_1"
+    assert exchange.await_count == 1
+    assert store.load("location:co:a")["access_token"] == "a_1"
+
+def test_failed_exchange_names_the_location(agency, mocker):
+    mocker.patch("ghl.location_tokens.oauth.get_location_token", AsyncMock(side_effect=ValueError("401 Unauthorized")))
+
+    async def run():
+        async with LocationTokenManager(agency, "co") as manager:
+            async with manager.lease("a"):
+                pass
+
+    with pytest.raises(RuntimeError, match="Location token for a: 401 Unauthorized"):
+        asyncio.run(run())
+
+    async def no_company():
+        async with LocationTokenManager(agency) as manager:
+            async with manager.lease("a"):
+                pass
+
+    with pytest.raises(ValueError, match="companyId"):
+        asyncio.run(no_company())
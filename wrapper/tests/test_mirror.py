@@ -0,0 +1,194 @@
+import pytest
+from unittest.mock import Mock, MagicMock
+from ghl.mirror import Mirror
+
+def _response(data):
+    response = MagicMock()
+    response.json.return_value = data
+    return response
+
+def _contacts_page(ids, after=None):
+    contacts = [{"id": i, "firstName": i.upper(), "email": f"{i}@x.com", "dateAdded": f"2024-01-0{n + 1}",
+                 "dateUpdated": f"2024-02-0{n + 1}"} for n, i in enumerate(ids)]
+    meta = {"startAfter": after, "startAfterId": ids[-1]} if ids else {}
+    return _response({"contacts": contacts, "meta": meta})
+
+@pytest.fixture
+def mock_client():
+    client = Mock()
+    client.location_id = "loc_123"
+    return client
+
+@pytest.fixture
+def mirror(tmp_path):
+    m = Mirror(tmp_path / "mirror.db")
+    yield m
+    m.close()
+
+def test_sync_contacts_incremental(tmp_path, mock_client):
+    mirror = Mirror(tmp_path / "mirror.db", clock=lambda: 1_700_000_000.0)
+    mock_client.get.side_effect = [_contacts_page(["a", "b"], after=2)]
+    assert mirror.sync_contacts(mock_client) == {"fetched": 2, "removed": 0}
+
+    # The walk is complete: the high-water mark is when it began (less the overlap)
+    state = mirror.state("loc_123", "contacts")
+    assert state["cursor"] is None
+    assert state["high_water"] == "2023-11-14T22:08:20.000Z"
+
+    # The next run searches for everything updated since, edits included
+    edited = {"id": "a", "firstName": "Edited", "dateUpdated": "2023-11-15T10:00:00.000Z", "searchAfter": [1, "a"]}
+    added = {"id": "c", "firstName": "C", "dateUpdated": "2023-11-15T11:00:00.000Z", "searchAfter": [2, "c"]}
+    mock_client.post.return_value = _response({"contacts": [edited, added], "total": 2})
+    assert mirror.sync_contacts(mock_client) == {"fetched": 2, "removed": 0}
+
+    body = mock_client.post.call_args.kwargs["json"]
+    assert mock_client.post.call_args.args == ("/contacts/search",)
+    assert body["filters"] == [{"field": "dateUpdated", "operator": "range", "value": {"gte": "2023-11-14T22:08:20.000Z"}}]
+    assert body["sort"] == [{"field": "dateUpdated", "direction": "asc"}]
+    assert mirror.get_contact("loc_123", "a") == {"id": "a", "firstName": "Edited", "dateUpdated": "2023-11-15T10:00:00.000Z"}
+    assert mirror.list_contacts("loc_123")["meta"]["total"] == 3
+    assert mirror.state("loc_123", "contacts")["high_water"] == "2023-11-15T11:00:00.000Z"
+
+def test_interrupted_contacts_walk_resumes_from_cursor(tmp_path, mock_client, monkeypatch):
+    monkeypatch.setattr("ghl.endpoints.contacts.MAX_PAGE_SIZE", 2)
+    now = [1_700_000_000.0]
+    mirror = Mirror(tmp_path / "mirror.db", clock=lambda: now[0])
+    mock_client.get.side_effect = [_contacts_page(["a", "b"], after=2), ValueError("boom")]
+    with pytest.raises(ValueError):
+        mirror.sync_contacts(mock_client)
+    assert mirror.state("loc_123", "contacts")["cursor"] == [2, "b"]
+
+    # Resuming keeps the mark of the walk's start, not of the resumed run
+    now[0] += 3600
+    mock_client.get.side_effect = [_contacts_page(["c"], after=3)]
+    assert mirror.sync_contacts(mock_client) == {"fetched": 1, "removed": 0}
+    params = mock_client.get.call_args.kwargs["params"]
+    assert (params["startAfter"], params["startAfterId"]) == (2, "b")
+    assert mirror.state("loc_123", "contacts") == {"cursor": None, "high_water": "2023-11-14T22:08:20.000Z",
+                                                    "synced_at": now[0]}
+    mock_client.post.assert_not_called()
+
+def test_full_sync_prunes_deleted(tmp_path, mock_client):
+    now = [100.0]
+    mirror = Mirror(tmp_path / "mirror.db", clock=lambda: now[0])
+    mock_client.get.side_effect = [_contacts_page(["a", "b"])]
+    mirror.sync_contacts(mock_client)
+
+    now[0] = 200.0
+    mock_client.get.side_effect = [_contacts_page(["a"])]
+    assert mirror.sync_contacts(mock_client, full=True) == {"fetched": 1, "removed": 1}
+    assert mirror.get_contact("loc_123", "b") is None
+    # Full runs start from the beginning
+    assert "startAfterId" not in mock_client.get.call_args_list[-1].kwargs["params"]
+
+def test_list_contacts_query(mirror, mock_client):
+    mock_client.get.side_effect = [_contacts_page(["ann", "bob"])]
+    mirror.sync_contacts(mock_client)
+
+    result = mirror.list_contacts("loc_123", query="ann@")
+    assert [c["id"] for c in result["contacts"]] == ["ann"]
+    assert result["meta"]["total"] == 1
+    # Other locations are kept apart
+    assert mirror.list_contacts("other")["contacts"] == []
+
+def test_sync_opportunities_and_filters(mirror, mock_client):
+    mock_client.get.side_effect = [_response({
+        "opportunities": [
+            {"id": "o1", "name": "Deal", "pipelineId": "p1", "status": "open", "updatedAt": "2024-01-02"},
+            {"id": "o2", "name": "Other", "pipelineId": "p2", "status": "won", "updatedAt": "2024-01-03"},
+        ],
+        "meta": {},
+    })]
+
+    assert mirror.sync_opportunities(mock_client)["fetched"] == 2
+    assert [o["id"] for o in mirror.list_opportunities("loc_123", pipeline_id="p1")["opportunities"]] == ["o1"]
+    assert [o["id"] for o in mirror.list_opportunities("loc_123", status="won")["opportunities"]] == ["o2"]
+
+def test_sync_reference_lists_replace(mirror, mock_client):
+    mock_client.get.side_effect = [
+        _response({"pipelines": [{"id": "p1"}, {"id": "p2"}]}),
+        _response({"pipelines": [{"id": "p2"}]}),
+    ]
+    mirror.sync_pipelines(mock_client)
+    assert mirror.sync_pipelines(mock_client) == {"fetched": 1, "removed": 1}
+    assert mirror.list_pipelines("loc_123") == {"pipelines": [{"id": "p2"}]}
+
+def test_sync_all_records_default_to_custom_objects(mirror, mock_client):
+    mock_client.get.side_effect = [_response({"objects": [{"key": "contact"}, {"key": "custom_objects.pets"}]})]
+    mock_client.post.return_value = _response({"records": [{"id": "r1", "properties": {"name": "Rex"}}], "total": 1})
+
+    summary = mirror.sync(mock_client, ["records"])
+
+    assert summary == {"records": {"custom_objects.pets": {"fetched": 1, "removed": 0}}}
+    assert mirror.list_records("loc_123", "custom_objects.pets", query="Rex")["total"] == 1
+    assert mirror.status("loc_123")["records"]["rows"] == 1
+
+def test_sync_rejects_unknown_resource(mirror, mock_client):
+    with pytest.raises(ValueError, match="Unknown resources"):
+        mirror.sync(mock_client, ["invoices"])
+
+def _search_fixture(mirror):
+    mirror.load_contacts("loc_123", [
+        {"id": "a", "firstName": "Ann", "lastName": "Lee", "email": "Ann@Example.com", "phone": "+1 555-0100",
+         "tags": ["VIP", "lead"], "companyName": "Acme Corp", "dateAdded": "2024-01-05T10:00:00Z"},
+        {"id": "b", "firstName": "Bob", "email": "bob@other.org", "phone": "+1 555-0199",
+         "tags": ["lead"], "dateAdded": "2024-02-10T10:00:00Z"},
+        {"id": "c", "firstName": "Annabel", "email": "annabel@example.com", "dateAdded": "2024-03-01T10:00:00Z"},
+    ])
+
+def _ids(result):
+    return [c["id"] for c in result["contacts"]]
+
+@pytest.mark.parametrize("query, expected", [
+    ("email:*@example.com", ["c", "a"]),
+    ("email:ann@example.com", ["a"]),
+    ("email:ann*", ["c", "a"]),
+    ("email:*other*", ["b"]),
+    ("phone:5550199", []),
+    ("phone:1555019*", ["b"]),
+    ("tag:vip", ["a"]),
+    ("tag:le*", ["b", "a"]),
+    ("ann*", ["c", "a"]),
+    ("name:ann", ["a"]),
+    ("company:acme", ["a"]),
+    ("dateAdded:2024-02", ["b"]),
+    ("dateAdded:>2024-01-05", ["c", "b"]),
+    ("dateAdded:2024-01-01..2024-02-10", ["b", "a"]),
+    ("tag:lead email:*@example.com", ["a"]),
+])
+def test_search_contacts(mirror, query, expected):
+    _search_fixture(mirror)
+    assert _ids(mirror.search_contacts("loc_123", query)) == expected
+
+def test_search_index_follows_updates_and_deletes(tmp_path):
+    now = [100.0]
+    mirror = Mirror(tmp_path / "mirror.db", clock=lambda: now[0])
+    _search_fixture(mirror)
+
+    now[0] = 200.0
+    mirror.load_contacts("loc_123", [{"id": "a", "firstName": "Ann", "email": "ann@new.io", "tags": ["gold"]}])
+    assert _ids(mirror.search_contacts("loc_123", "email:*@example.com")) == ["c"]
+    assert _ids(mirror.search_contacts("loc_123", "tag:gold email:*@new.io")) == ["a"]
+    assert _ids(mirror.search_contacts("loc_123", "tag:vip")) == []
+
+    mirror._prune("contacts", "loc_123", 200.0)
+    assert _ids(mirror.search_contacts("loc_123", "ann*")) == ["a"]
+    assert _ids(mirror.search_contacts("loc_123", "tag:lead")) == []
+    mirror.close()
+
+def test_upgrade_indexes_existing_mirror(tmp_path):
+    import sqlite3
+    path = tmp_path / "mirror.db"
+    conn = sqlite3.connect(str(path))
+    # Layout written before the search index existed
+    conn.executescript("""
+        CREATE TABLE contacts (location_id TEXT NOT NULL, id TEXT NOT NULL, name TEXT, email TEXT, phone TEXT,
+            date_added TEXT, date_updated TEXT, synced_at REAL NOT NULL, data TEXT NOT NULL, PRIMARY KEY (location_id, id));
+        INSERT INTO contacts VALUES ('loc', 'a', 'Ann', 'Ann@x.com', NULL, '2024', NULL, 1, '{"id": "a", "email": "Ann@x.com", "tags": ["vip"]}');
+    """)
+    conn.close()
+
+    mirror = Mirror(path)
+    assert _ids(mirror.search_contacts("loc", "email:*@x.com tag:vip")) == ["a"]
+    assert _ids(mirror.search_contacts("loc", "ann")) == ["a"]
+    mirror.close()
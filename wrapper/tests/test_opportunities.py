@@ -25,6 +25,18 @@ def test_list_opportunities(mock_client):
     mock_client.get.assert_called_with("/opportunities/search", params={"limit": 10, "q": "test", "location_id": "loc1"})
     assert len(result["opportunities"]) == 1
 
+def test_list_opportunities_fields(mock_client):
+    mock_response = MagicMock()
+    mock_response.json.return_value = {
+        "opportunities": [{"id": "1", "name": "Opp 1", "contact": {"id": "c1", "email": "a@x.com"}}],
+        "meta": {"total": 1}
+    }
+    mock_client.get.return_value = mock_response
+
+    result = list_opportunities(mock_client, fields="id,contact.email")
+
+    assert result == {"opportunities": [{"id": "1", "contact.email": "a@x.com"}], "meta": {"total": 1}}
+
 def test_get_opportunity(mock_client):
     mock_response = MagicMock()
     mock_response.json.return_value = {
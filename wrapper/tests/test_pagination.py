@@ -0,0 +1,116 @@
+import asyncio
+import threading
+import pytest
+from ghl.pagination import next_cursor, prefetch, aprefetch
+
+def test_next_cursor():
+    items = [{"id": "1"}, {"id": "2"}]
+    meta = {"startAfter": 10, "startAfterId": "2"}
+
+    assert next_cursor(items, meta, 2, None) == (10, "2")
+    # Short page, missing cursor or repeated cursor all end the walk
+    assert next_cursor(items[:1], meta, 2, None) is None
+    assert next_cursor(items, {}, 2, None) is None
+    assert next_cursor(items, meta, 2, (10, "2")) is None
+
+def test_prefetch_preserves_order():
+    assert list(prefetch(iter(range(10)), depth=2)) == list(range(10))
+
+def test_prefetch_depth_zero_is_passthrough():
+    pages = iter([1, 2])
+    assert list(prefetch(pages, depth=0)) == [1, 2]
+
+def test_prefetch_fetches_next_page_while_consumer_works():
+    fetched = []
+    second_fetched = threading.Event()
+
+    def pages():
+        for i in range(3):
+            fetched.append(i)
+            if i == 1:
+                second_fetched.set()
+            yield i
+
+    iterator = prefetch(pages(), depth=1)
+    assert next(iterator) == 0
+    # Page 1 is requested without the consumer asking for it
+    assert second_fetched.wait(timeout=2)
+    assert list(iterator) == [1, 2]
+
+def test_prefetch_is_bounded():
+    produced = []
+    # time.sleep is patched out by conftest, so wait on an event instead
+    settle = threading.Event()
+
+    def pages():
+        for i in range(100):
+            produced.append(i)
+            yield i
+
+    iterator = prefetch(pages(), depth=2)
+    next(iterator)
+    settle.wait(timeout=0.3)
+    # One page consumed, `depth` queued, and at most one more in hand waiting for room
+    assert len(produced) <= 4
+    iterator.close()
+
+def test_prefetch_propagates_errors():
+    def pages():
+        yield 1
+        raise RuntimeError("boom")
+
+    iterator = prefetch(pages(), depth=1)
+    assert next(iterator) == 1
+    with pytest.raises(RuntimeError, match="boom"):
+        next(iterator)
+
+def test_prefetch_close_stops_producer():
+    closed = threading.Event()
+
+    def pages():
+        try:
+            for i in range(1000):
+                yield i
+        finally:
+            closed.set()
+
+    iterator = prefetch(pages(), depth=1)
+    next(iterator)
+    iterator.close()
+
+    assert closed.wait(timeout=2)
+
+def test_aprefetch_preserves_order_and_errors():
+    async def pages():
+        for i in range(5):
+            yield i
+        raise RuntimeError("boom")
+
+    async def collect():
+        seen = []
+        with pytest.raises(RuntimeError, match="boom"):
+            async for page in aprefetch(pages(), depth=2):
+                seen.append(page)
+        return seen
+
+    assert asyncio.run(collect()) == [0, 1, 2, 3, 4]
+
+def test_aprefetch_fetches_ahead():
+    fetched = []
+
+    async def pages():
+        for i in range(3):
+            fetched.append(i)
+            yield i
+
+    async def run():
+        iterator = aprefetch(pages(), depth=1)
+        first = await iterator.__anext__()
+        await asyncio.sleep(0.01)
+        ahead = list(fetched)
+        await iterator.aclose()
+        return first, ahead
+
+    first, ahead = asyncio.run(run())
+    assert first == 0
+    assert 1 in ahead
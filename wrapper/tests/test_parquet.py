@@ -0,0 +1,135 @@
+import json
+import pytest
+from importlib import resources
+from pathlib import Path
+from unittest.mock import Mock, MagicMock
+
+pa = pytest.importorskip("pyarrow")
+import pyarrow.parquet as pq
+
+from ghl import parquet
+from ghl.export import export_contacts, export_records
+from ghl.parquet import ParquetSink, schema_from_spec, infer_schema
+
+def _response(data):
+    response = MagicMock()
+    response.json.return_value = data
+    return response
+
+@pytest.fixture
+def mock_client():
+    client = Mock()
+    client.location_id = "loc_123"
+    return client
+
+def test_schema_from_spec_contacts(monkeypatch):
+    monkeypatch.delenv("GHL_SPECS_DIR", raising=False)
+    schema = schema_from_spec("contacts")
+
+    assert schema is not None
+    # Merged from the list and detail schemas
+    assert schema.field("firstName").type == pa.string()
+    assert schema.field("tags").type == pa.list_(pa.string())
+    assert schema.field("dnd").type == pa.bool_()
+    assert pa.types.is_struct(schema.field("dndSettings").type)
+
+def test_schema_from_spec_missing_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("GHL_SPECS_DIR", str(tmp_path))
+    assert schema_from_spec("contacts") is None
+
+SPECS = Path(__file__).resolve().parents[2] / "apps"
+
+@pytest.mark.skipif(not SPECS.is_dir(), reason="needs the apps/ OpenAPI specs of a repository checkout")
+@pytest.mark.parametrize("resource", sorted(parquet.RESOURCE_SCHEMAS))
+def test_bundled_schemas_match_specs(resource, monkeypatch):
+    # Out of date? Run scripts/update_schemas.py
+    monkeypatch.delenv("GHL_SPECS_DIR", raising=False)
+    filename, names = parquet.RESOURCE_SCHEMAS[resource]
+    bundled = json.loads(resources.files("ghl").joinpath("schemas", filename).read_text())
+
+    assert bundled == parquet.bundled_schemas(json.loads((SPECS / filename).read_text()), names)
+    assert schema_from_spec(resource) == schema_from_spec(resource, SPECS)
+
+def test_infer_schema():
+    schema = infer_schema([{"a": 1, "b": "x", "c": True}, {"a": 2.5, "d": {"k": 1}}])
+    assert schema.field("a").type == pa.float64()
+    assert schema.field("b").type == pa.string()
+    assert schema.field("c").type == pa.bool_()
+    assert schema.field("d").type == pa.string()
+
+def test_inferred_numbers_keep_later_fractions(tmp_path):
+    out = tmp_path / "items.parquet"
+    sink = ParquetSink(out)
+    sink.write([{"id": "a", "amount": 100}])
+    sink.write([{"id": "b", "amount": 99.5}])
+    sink.close()
+
+    assert [row["amount"] for row in pq.read_table(out).to_pylist()] == [100, 99.5]
+
+def test_sink_refuses_to_truncate_integers(tmp_path):
+    sink = ParquetSink(tmp_path / "items.parquet", schema=pa.schema([("count", pa.int64())]))
+    sink.write([{"count": 100}, {"count": 7.0}, {"count": "12"}])
+
+    with pytest.raises(ValueError, match="Column 'count' is int64 but got 99.5"):
+        sink.write([{"count": 99.5}])
+    sink.abort()
+
+def test_sink_coerces_and_keeps_extra_keys(tmp_path):
+    schema = pa.schema([("id", pa.string()), ("count", pa.int64()), ("tags", pa.list_(pa.string()))])
+    out = tmp_path / "items.parquet"
+    sink = ParquetSink(out, schema=schema)
+
+    sink.write([{"id": "a", "count": "3", "tags": ["x"], "unknown": {"k": 1}}, {"id": 7, "count": None}])
+    sink.close()
+
+    rows = pq.read_table(out).to_pylist()
+    assert rows[0] == {"id": "a", "count": 3, "tags": ["x"], "_extra": json.dumps({"unknown": {"k": 1}})}
+    assert rows[1] == {"id": "7", "count": None, "tags": None, "_extra": None}
+    assert not (tmp_path / "items.parquet.part").exists()
+
+def test_sink_row_groups(tmp_path, monkeypatch):
+    monkeypatch.setattr(parquet, "ROW_GROUP_SIZE", 2)
+    out = tmp_path / "items.parquet"
+    sink = ParquetSink(out, schema=pa.schema([("id", pa.string())]))
+    for i in range(3):
+        sink.write([{"id": str(i)}])
+    sink.close()
+
+    assert pq.ParquetFile(out).metadata.num_row_groups == 2
+
+def test_sink_abort_leaves_no_file(tmp_path):
+    out = tmp_path / "items.parquet"
+    sink = ParquetSink(out, schema=pa.schema([("id", pa.string())]))
+    sink.write([{"id": "a"}])
+    sink.abort()
+
+    assert not out.exists()
+    assert not (tmp_path / "items.parquet.part").exists()
+
+def test_export_contacts_parquet(mock_client, tmp_path):
+    mock_client.get.return_value = _response({
+        "contacts": [{"id": "c1", "firstName": "Ann", "tags": ["vip"], "customThing": 1}],
+        "meta": {},
+    })
+    out = tmp_path / "contacts.parquet"
+
+    result = export_contacts(mock_client, out, "parquet", prefetch_depth=0)
+
+    assert result == {"rows": 1, "pages": 1, "resumed": False}
+    table = pq.read_table(out)
+    row = table.to_pylist()[0]
+    assert row["firstName"] == "Ann"
+    assert row["tags"] == ["vip"]
+    assert json.loads(row["_extra"]) == {"customThing": 1}
+    assert not (tmp_path / "contacts.parquet.cursor").exists()
+
+def test_export_records_parquet_fields(mock_client, tmp_path):
+    mock_client.post.return_value = _response({
+        "records": [{"id": "r1", "properties": {"ticket": "x"}, "owner": ["u1"]}],
+        "total": 1,
+    })
+    out = tmp_path / "records.parquet"
+
+    export_records(mock_client, "custom_objects.tickets", out, "parquet", fields="id,properties", prefetch_depth=0)
+
+    assert pq.read_table(out).to_pylist() == [{"id": "r1", "properties": json.dumps({"ticket": "x"})}]
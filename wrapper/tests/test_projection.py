@@ -0,0 +1,43 @@
+import pytest
+from ghl.projection import parse_path, compile_path, compile_projection, project, project_page, MISSING
+
+CONTACT = {
+    "id": "c1",
+    "email": "a@x.com",
+    "tags": ["vip", "lead"],
+    "customFields": [{"id": "f1", "value": "gold"}, {"id": "f2", "value": 7}],
+    "attributionSource": {"medium": "email", "utm": {"campaign": "spring"}},
+}
+
+@pytest.mark.parametrize("path, expected", [
+    ("email", "a@x.com"),
+    ("attributionSource.utm.campaign", "spring"),
+    ("tags[0]", "vip"),
+    ("tags[-1]", "lead"),
+    ("customFields[*].id", ["f1", "f2"]),
+    ("customFields[id=f2].value", 7),
+    ("customFields[id=nope].value", MISSING),
+    ("tags[5]", MISSING),
+    ("email.domain", MISSING),
+    ("missing", MISSING),
+])
+def test_compile_path(path, expected):
+    assert compile_path(path)(CONTACT) == expected
+
+@pytest.mark.parametrize("path", ["", "a..b", "a.", ".a", "a[0]b", "a.[0]", "a[x"])
+def test_parse_path_rejects(path):
+    with pytest.raises(ValueError):
+        parse_path(path)
+
+def test_projection_keeps_paths_as_keys_and_skips_missing():
+    projector = compile_projection("id, attributionSource.medium,customFields[id=f1].value,phone")
+    assert projector(CONTACT) == {"id": "c1", "attributionSource.medium": "email", "customFields[id=f1].value": "gold"}
+
+def test_projection_is_compiled_once():
+    assert compile_projection("id,email") is compile_projection("id,email")
+
+def test_project_lists_and_pages():
+    assert project([CONTACT, "x"], "id") == [{"id": "c1"}, "x"]
+    assert project(CONTACT, None) is CONTACT
+    page = {"records": [{"id": "r1", "properties": {"name": "Rex"}}], "total": 1}
+    assert project_page(page, "records", "properties.name") == {"records": [{"properties.name": "Rex"}], "total": 1}
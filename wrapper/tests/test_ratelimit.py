@@ -0,0 +1,125 @@
+import asyncio
+import pytest
+import httpx
+from unittest.mock import MagicMock
+from ghl.client import GHLClient
+from ghl.ratelimit import TokenBucket, RateLimiter
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+def test_bucket_allows_burst_then_paces(clock):
+    bucket = TokenBucket(capacity=10, interval=10.0, clock=clock)
+
+    delays = [bucket.reserve() for _ in range(10)]
+    assert delays == [0.0] * 10
+
+    # Out of tokens: refill rate is 1/s, so waiters queue up one second apart
+    assert bucket.reserve() == pytest.approx(1.0)
+    assert bucket.reserve() == pytest.approx(2.0)
+
+def test_bucket_refills_over_time(clock):
+    bucket = TokenBucket(capacity=10, interval=10.0, clock=clock)
+    for _ in range(10):
+        bucket.reserve()
+
+    clock.now = 5.0
+    assert bucket.reserve() == 0.0
+    assert bucket.tokens == pytest.approx(4.0)
+
+    # Refill never exceeds capacity
+    clock.now = 100.0
+    bucket.reserve()
+    assert bucket.tokens == pytest.approx(9.0)
+
+def test_bucket_update_recalibrates(clock):
+    bucket = TokenBucket(capacity=100, interval=10.0, clock=clock)
+
+    bucket.update(limit=50, remaining=3, interval=5.0)
+
+    assert bucket.capacity == 50
+    assert bucket.interval == 5.0
+    assert bucket.tokens == 3
+    assert bucket.rate == pytest.approx(10.0)
+
+def test_bucket_update_never_raises_estimate(clock):
+    bucket = TokenBucket(capacity=100, interval=10.0, clock=clock)
+    for _ in range(90):
+        bucket.reserve()
+
+    # A stale response reporting more remaining capacity must not over-credit us
+    bucket.update(remaining=80)
+
+    assert bucket.tokens == pytest.approx(10.0)
+
+def test_limiter_buckets_per_location(clock):
+    limiter = RateLimiter(max_requests=1, interval=1.0, clock=clock)
+
+    assert limiter.bucket("loc_a").reserve() == 0.0
+    assert limiter.bucket("loc_b").reserve() == 0.0
+    assert limiter.bucket("loc_a").reserve() == pytest.approx(1.0)
+    assert limiter.bucket(None) is limiter.bucket("default")
+
+def test_limiter_update_from_headers(clock):
+    limiter = RateLimiter(clock=clock)
+    headers = httpx.Headers({
+        "X-RateLimit-Max": "200",
+        "X-RateLimit-Remaining": "7",
+        "X-RateLimit-Interval-Milliseconds": "20000"
+    })
+
+    limiter.update_from_headers("loc", headers)
+
+    bucket = limiter.bucket("loc")
+    assert bucket.capacity == 200
+    assert bucket.interval == 20.0
+    assert bucket.tokens == 7
+
+def test_limiter_ignores_missing_or_invalid_headers(clock):
+    limiter = RateLimiter(clock=clock)
+
+    limiter.update_from_headers("loc", httpx.Headers({"X-RateLimit-Max": "abc"}))
+    limiter.update_from_headers("loc", MagicMock())
+
+    assert limiter.bucket("loc").capacity == 100
+    assert limiter.bucket("loc").tokens == 100
+
+def test_acquire_sleeps_for_delay(clock, mocker):
+    sleep = mocker.patch("ghl.ratelimit.time.sleep")
+    limiter = RateLimiter(max_requests=1, interval=2.0, clock=clock)
+
+    limiter.acquire("loc")
+    sleep.assert_not_called()
+
+    limiter.acquire("loc")
+    sleep.assert_called_once_with(pytest.approx(2.0))
+
+def test_acquire_async_sleeps_for_delay(clock, mocker):
+    sleep = mocker.patch("ghl.ratelimit.asyncio.sleep")
+    limiter = RateLimiter(max_requests=1, interval=2.0, clock=clock)
+
+    asyncio.run(limiter.acquire_async("loc"))
+    asyncio.run(limiter.acquire_async("loc"))
+
+    sleep.assert_awaited_once_with(pytest.approx(2.0))
+
+def test_client_recalibrates_from_response(mock_httpx_client):
+    limiter = RateLimiter()
+    client = GHLClient(api_key="key", location_id="loc", client=mock_httpx_client, rate_limiter=limiter)
+    response = MagicMock(spec=httpx.Response)
+    response.status_code = 200
+    response.headers = httpx.Headers({"X-RateLimit-Max": "100", "X-RateLimit-Remaining": "42"})
+    response.raise_for_status.return_value = None
+    mock_httpx_client.get.return_value = response
+
+    client.get("/test")
+
+    assert limiter.bucket("loc").tokens == pytest.approx(42, abs=0.1)
@@ -0,0 +1,140 @@
+import asyncio
+import pytest
+import httpx
+from unittest.mock import MagicMock
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+from ghl.endpoints import contacts
+from ghl.retry import RetryPolicy, parse_retry_after
+
+def _error_response(status_code, headers=None):
+    response = MagicMock(spec=httpx.Response)
+    response.status_code = status_code
+    response.headers = httpx.Headers(headers or {})
+    response.content = b""
+    response.json.side_effect = ValueError()
+    response.raise_for_status.side_effect = httpx.HTTPStatusError("Error", request=MagicMock(), response=response)
+    return response
+
+def _ok_response():
+    response = MagicMock(spec=httpx.Response)
+    response.status_code = 200
+    response.headers = httpx.Headers({})
+    response.raise_for_status.return_value = None
+    return response
+
+def _status_error(status_code, headers=None):
+    response = _error_response(status_code, headers)
+    return httpx.HTTPStatusError("Error", request=MagicMock(), response=response)
+
+def test_parse_retry_after_seconds():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("1.5") == 1.5
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+
+def test_parse_retry_after_http_date():
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+    assert parse_retry_after(format_datetime(retry_at, usegmt=True)) == pytest.approx(30, abs=2)
+
+def test_idempotency_rules():
+    policy = RetryPolicy()
+    assert policy.is_idempotent("get", "/contacts/")
+    assert policy.is_idempotent("PUT", "/contacts/1")
+    assert policy.is_idempotent("delete", "/contacts/1")
+    assert policy.is_idempotent("post", "/contacts/upsert")
+    assert policy.is_idempotent("post", "/opportunities/upsert/")
+    assert not policy.is_idempotent("post", "/contacts/")
+    # Read-only searches replay like GETs
+    assert policy.is_idempotent("post", "/contacts/search")
+    assert policy.is_idempotent("post", "/opportunities/search/")
+    assert not policy.is_idempotent("post", "/contacts/search/duplicate/merge")
+
+def test_retryable_errors():
+    policy = RetryPolicy()
+    assert policy.is_retryable("get", "/x", _status_error(503))
+    assert not policy.is_retryable("get", "/x", _status_error(400))
+    assert not policy.is_retryable("post", "/contacts/", _status_error(429))
+    # Connection never established: safe even for POST
+    assert policy.is_retryable("post", "/contacts/", httpx.ConnectError("refused"))
+    # Connection reset mid-request: only idempotent methods
+    assert policy.is_retryable("get", "/x", httpx.ReadError("reset"))
+    assert not policy.is_retryable("post", "/contacts/", httpx.ReadError("reset"))
+
+def test_backoff_is_bounded():
+    policy = RetryPolicy(base_delay=0.5, max_delay=4.0)
+    previous = 0.5
+    for _ in range(50):
+        delay = policy.backoff(previous)
+        assert 0.5 <= delay <= 4.0
+        assert delay <= max(0.5, previous * 3)
+        previous = delay
+
+def test_state_honors_retry_after():
+    state = RetryPolicy().start()
+    assert state.next_delay("get", "/x", _status_error(429, {"Retry-After": "7"})) == 7.0
+
+def test_state_stops_after_max_attempts():
+    state = RetryPolicy(max_attempts=3).start()
+    assert state.next_delay("get", "/x", _status_error(503)) is not None
+    assert state.next_delay("get", "/x", _status_error(503)) is not None
+    assert state.next_delay("get", "/x", _status_error(503)) is None
+
+def test_state_respects_total_budget():
+    now = [0.0]
+    state = RetryPolicy(total_timeout=10.0).start(clock=lambda: now[0])
+
+    assert state.next_delay("get", "/x", _status_error(429, {"Retry-After": "5"})) == 5.0
+    now[0] = 8.0
+    assert state.next_delay("get", "/x", _status_error(429, {"Retry-After": "5"})) is None
+
+def test_client_retries_transient_status(ghl_client, mock_httpx_client, no_retry_sleep):
+    mock_httpx_client.get.side_effect = [_error_response(503), _error_response(429, {"Retry-After": "2"}), _ok_response()]
+
+    result = ghl_client.get("/test")
+
+    assert result.status_code == 200
+    assert mock_httpx_client.get.call_count == 3
+    assert no_retry_sleep.call_args_list[-1].args == (2.0,)
+
+def test_client_does_not_retry_plain_post(ghl_client, mock_httpx_client):
+    mock_httpx_client.post.return_value = _error_response(503)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        ghl_client.post("/contacts/", json={})
+
+    assert mock_httpx_client.post.call_count == 1
+
+def test_client_retries_upsert_post(ghl_client, mock_httpx_client):
+    mock_httpx_client.post.side_effect = [_error_response(502), _ok_response()]
+
+    result = ghl_client.post("/contacts/upsert", json={})
+
+    assert result.status_code == 200
+    assert mock_httpx_client.post.call_count == 2
+
+def test_search_page_retried_after_rate_limit(ghl_client, mock_httpx_client, no_retry_sleep):
+    page = _ok_response()
+    page.json.return_value = {"contacts": [{"id": "c1"}], "total": 1}
+    mock_httpx_client.post.side_effect = [_error_response(429, {"Retry-After": "1"}), page]
+
+    pages = list(contacts.iter_search_pages(ghl_client, query="a", page_size=10))
+
+    assert pages == [{"contacts": [{"id": "c1"}], "total": 1}]
+    assert mock_httpx_client.post.call_count == 2
+    assert no_retry_sleep.call_args_list[-1].args == (1.0,)
+
+def test_client_retries_connection_reset(ghl_client, mock_httpx_client):
+    mock_httpx_client.get.side_effect = [httpx.ReadError("Connection reset by peer"), _ok_response()]
+
+    assert ghl_client.get("/test").status_code == 200
+
+def test_async_client_retries(async_ghl_client, mock_async_httpx_client, mocker):
+    sleep = mocker.patch("ghl.client.asyncio.sleep")
+    mock_async_httpx_client.get.side_effect = [_error_response(504), _ok_response()]
+
+    result = asyncio.run(async_ghl_client.get("/test"))
+
+    assert result.status_code == 200
+    assert mock_async_httpx_client.get.await_count == 2
+    sleep.assert_awaited_once()
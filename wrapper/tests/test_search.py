@@ -0,0 +1,27 @@
+import pytest
+from ghl.search import parse_query, compile_query, phone_digits
+
+def test_parse_query_fields_and_free_text():
+    assert parse_query('email:*@example.com firstName:jo* "ann lee"') == [
+        ("email", "*@example.com"), ("name", "jo*"), (None, "ann lee")
+    ]
+
+def test_parse_query_rejects_unknown_field():
+    with pytest.raises(ValueError, match="Unknown search field: colour"):
+        parse_query("colour:red")
+
+def test_email_suffix_uses_reversed_column():
+    clauses, args = compile_query("email:*@Example.com", "loc")
+    assert clauses == ["c.location_id = ?", "c.email_reversed >= ? AND c.email_reversed < ?"]
+    assert args == ("loc", "moc.elpmaxe@", "moc.elpmaxeA")
+
+def test_phone_compares_digits():
+    assert phone_digits("+1 (555) 010-0000") == "15550100000"
+    clauses, args = compile_query('phone:"+1 (555) 010*"')
+    assert clauses[1] == "c.phone_digits >= ? AND c.phone_digits < ?"
+    assert args[1:] == ("1555010", "1555011")
+
+def test_free_text_and_name_share_one_match():
+    clauses, args = compile_query('ann name:le* company:"*corp"')
+    assert clauses[1] == "lower(c.company) GLOB ?"
+    assert args[-1] == '"ann" AND name : "le"*'
@@ -0,0 +1,204 @@
+import asyncio
+import os
+import stat
+import threading
+import time
+import pytest
+import httpx
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, AsyncMock
+from ghl.client import GHLClient, AsyncGHLClient
+from ghl.tokens import TokenStore
+
+KEY = "test_client_id:loc"
+# Captured before tests patch httpx.Client for the token exchange
+HTTP_CLIENT, ASYNC_HTTP_CLIENT = httpx.Client, httpx.AsyncClient
+
+def _token_response(access_token, expires_in=86400):
+    response = MagicMock(spec=httpx.Response)
+    response.status_code = 200
+    response.json.return_value = {
+        "access_token": access_token,
+        "refresh_token": f"refresh_{access_token}",
+        "expires_in": expires_in,
+    }
+    response.raise_for_status.return_value = None
+    return response
+
+def _client(store, api_key="stale", cls=GHLClient, http=None):
+    http = http or MagicMock(spec=HTTP_CLIENT)
+    http.headers = {}
+    return cls(api_key, "loc", client=http, client_id="test_client_id", client_secret="secret",
+               refresh_token="configured_refresh", token_store=store)
+
+@pytest.fixture
+def store(tmp_path):
+    return TokenStore(tmp_path / "tokens.db")
+
+def test_save_and_load(store):
+    assert store.load(KEY) is None
+
+    with store.acquire(KEY) as lease:
+        assert lease.current is None
+        lease.save({"access_token": "a1", "refresh_token": "r1", "expires_in": 100})
+
+    stored = store.load(KEY)
+    assert stored["access_token"] == "a1"
+    assert stored["refresh_token"] == "r1"
+    assert stored["expires_at"] == pytest.approx(time.time() + 100, abs=5)
+
+def test_store_files_are_private(tmp_path):
+    seen = {}
+
+    class Recording:
+        """Notes each file's mode while the setup connection still has its WAL open."""
+        def __init__(self, conn):
+            self.conn = conn
+
+        def execute(self, *args):
+            return self.conn.execute(*args)
+
+        def close(self):
+            seen.update({path.name: stat.S_IMODE(path.stat().st_mode) for path in tmp_path.iterdir()})
+            self.conn.close()
+
+    class RecordingStore(TokenStore):
+        def _connect(self):
+            return Recording(super()._connect())
+
+    previous = os.umask(0o022)
+    try:
+        store = RecordingStore(tmp_path / "tokens.db")
+        # The process umask is left as it was
+        assert os.umask(0o022) == 0o022
+    finally:
+        os.umask(previous)
+
+    assert sorted(seen) == ["tokens.db", "tokens.db-shm", "tokens.db-wal"]
+    assert set(seen.values()) == {0o600}
+    assert store.load(KEY) is None
+
+def test_save_keeps_refresh_token_when_not_rotated(store):
+    with store.acquire(KEY) as lease:
+        lease.save({"access_token": "a1", "refresh_token": "r1"})
+    with store.acquire(KEY) as lease:
+        lease.save({"access_token": "a2"})
+
+    assert store.load(KEY)["refresh_token"] == "r1"
+
+def test_failed_refresh_is_rolled_back(store):
+    with pytest.raises(RuntimeError):
+        with store.acquire(KEY) as lease:
+            lease.save({"access_token": "a1"})
+            raise RuntimeError("exchange failed")
+
+    assert store.load(KEY) is None
+
+def test_acquire_waits_for_other_holder(tmp_path):
+    # Two stores on one file stand in for two processes
+    first = TokenStore(tmp_path / "tokens.db")
+    second = TokenStore(tmp_path / "tokens.db")
+    lease = first.acquire(KEY)
+    seen = []
+
+    def wait_for_lease():
+        with second.acquire(KEY) as other:
+            seen.append(other.current)
+
+    thread = threading.Thread(target=wait_for_lease)
+    thread.start()
+    threading.Event().wait(0.2)
+    assert seen == []
+
+    lease.save({"access_token": "a1", "refresh_token": "r1"})
+    lease.release()
+    thread.join(timeout=5)
+
+    assert seen[0]["access_token"] == "a1"
+
+def test_clear(store):
+    with store.acquire(KEY) as lease:
+        lease.save({"access_token": "a1"})
+    store.clear(KEY)
+    assert store.load(KEY) is None
+
+def test_client_starts_with_stored_tokens(store):
+    with store.acquire(KEY) as lease:
+        lease.save({"access_token": "stored", "refresh_token": "stored_refresh", "expires_in": 3600})
+
+    client = _client(store)
+
+    assert client.api_key == "stored"
+    assert client.refresh_token == "stored_refresh"
+    assert not client._token_expiring()
+
+def test_client_without_access_token_refreshes_first(store):
+    client = _client(store, api_key=None)
+    assert client._token_expiring()
+
+def test_refresh_saves_and_uses_latest_refresh_token(store, mocker):
+    token_client = MagicMock(spec=HTTP_CLIENT)
+    token_client.post.return_value = _token_response("fresh")
+    mocker.patch("httpx.Client", return_value=token_client)
+
+    client = _client(store)
+    client.refresh_access_token()
+
+    assert client.api_key == "fresh"
+    assert client.client.headers["Authorization"] == "Bearer fresh"
+    assert token_client.post.call_args.kwargs["data"]["refresh_token"] == "configured_refresh"
+    assert store.load(KEY)["refresh_token"] == "refresh_fresh"
+
+    # The next exchange must present the rotated refresh token from the store
+    token_client.post.return_value = _token_response("fresher")
+    client.refresh_access_token()
+    assert token_client.post.call_args.kwargs["data"]["refresh_token"] == "refresh_fresh"
+
+def test_refresh_adopts_token_refreshed_elsewhere(tmp_path, mocker):
+    token_client = MagicMock(spec=HTTP_CLIENT)
+    token_client.post.return_value = _token_response("fresh")
+    mocker.patch("httpx.Client", return_value=token_client)
+
+    worker_a = _client(TokenStore(tmp_path / "tokens.db"))
+    worker_b = _client(TokenStore(tmp_path / "tokens.db"))
+
+    worker_a.refresh_access_token()
+    worker_b.refresh_access_token()
+
+    token_client.post.assert_called_once()
+    assert worker_b.api_key == "fresh"
+    assert worker_b.refresh_token == "refresh_fresh"
+
+def test_concurrent_workers_exchange_once(tmp_path, mocker):
+    def slow_exchange(url, data):
+        threading.Event().wait(0.05)
+        return _token_response("fresh")
+
+    token_client = MagicMock(spec=HTTP_CLIENT)
+    token_client.post.side_effect = slow_exchange
+    mocker.patch("httpx.Client", return_value=token_client)
+    workers = [_client(TokenStore(tmp_path / "tokens.db")) for _ in range(6)]
+
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        list(pool.map(lambda w: w.refresh_access_token(), workers))
+
+    token_client.post.assert_called_once()
+    assert {w.api_key for w in workers} == {"fresh"}
+
+def test_async_refresh_with_store(tmp_path, mocker):
+    token_client = AsyncMock(spec=ASYNC_HTTP_CLIENT)
+    token_client.post.return_value = _token_response("fresh")
+    mocker.patch("httpx.AsyncClient", return_value=token_client)
+
+    worker_a = _client(TokenStore(tmp_path / "tokens.db"), cls=AsyncGHLClient, http=AsyncMock(spec=ASYNC_HTTP_CLIENT))
+    worker_b = _client(TokenStore(tmp_path / "tokens.db"), cls=AsyncGHLClient, http=AsyncMock(spec=ASYNC_HTTP_CLIENT))
+
+    async def run():
+        await worker_a.refresh_access_token()
+        await worker_b.refresh_access_token()
+
+    asyncio.run(run())
+
+    assert token_client.post.await_count == 1
+    assert worker_b.api_key == "fresh"
+    assert TokenStore(tmp_path / "tokens.db").load(KEY)["access_token"] == "fresh"